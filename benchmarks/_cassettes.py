@@ -0,0 +1,89 @@
+"""Decodable GET responses from the recorded test cassettes."""
+import glob
+import json
+import os
+import re
+
+import yaml
+
+from pygrocy.data_models.battery import Battery
+from pygrocy.data_models.chore import Chore
+from pygrocy.data_models.meal_items import MealPlanItem, MealPlanSection, RecipeItem
+from pygrocy.data_models.product import Product, ShoppingListProduct
+from pygrocy.data_models.task import Task
+from pygrocy.data_models.user import User
+from pygrocy.grocy_api_client import (
+    BatteryDetailsResponse,
+    ChoreDetailsResponse,
+    CurrentBatteryResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    CurrentVolatilStockResponse,
+    MealPlanResponse,
+    MealPlanSectionResponse,
+    ProductData,
+    ProductDetailsResponse,
+    RecipeDetailsResponse,
+    ShoppingListItem,
+    SystemConfigDto,
+    SystemInfoDto,
+    SystemTimeDto,
+    TaskResponse,
+    UserDto,
+)
+
+CASSETTE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test", "cassettes"
+)
+
+CASSETTE_MODELS = [
+    (r"stock", CurrentStockResponse),
+    (r"stock/volatile", CurrentVolatilStockResponse),
+    (r"stock/products/(by-barcode/)?\d+", ProductDetailsResponse),
+    (r"chores", CurrentChoreResponse),
+    (r"chores/\d+", ChoreDetailsResponse),
+    (r"batteries", CurrentBatteryResponse),
+    (r"batteries/\d+", BatteryDetailsResponse),
+    (r"tasks|objects/tasks/\d+", TaskResponse),
+    (r"objects/meal_plan", MealPlanResponse),
+    (r"objects/meal_plan_sections", MealPlanSectionResponse),
+    (r"objects/recipes/\d+", RecipeDetailsResponse),
+    (r"objects/products", ProductData),
+    (r"objects/shopping_list", ShoppingListItem),
+    (r"users", UserDto),
+    (r"system/info", SystemInfoDto),
+    (r"system/time", SystemTimeDto),
+    (r"system/config", SystemConfigDto),
+]
+
+# The data model wrapping each response model.
+DATA_MODELS = {
+    CurrentStockResponse: Product,
+    ProductDetailsResponse: Product,
+    CurrentChoreResponse: Chore,
+    ChoreDetailsResponse: Chore,
+    CurrentBatteryResponse: Battery,
+    BatteryDetailsResponse: Battery,
+    TaskResponse: Task,
+    MealPlanResponse: MealPlanItem,
+    MealPlanSectionResponse: MealPlanSection,
+    RecipeDetailsResponse: RecipeItem,
+    ShoppingListItem: ShoppingListProduct,
+    UserDto: User,
+}
+
+
+def cassette_payloads():
+    """Yield ``(model, rows)`` for every decodable GET response in the cassettes."""
+    for path in sorted(glob.glob(os.path.join(CASSETTE_DIR, "*", "*.yaml"))):
+        with open(path) as cassette:
+            interactions = yaml.safe_load(cassette)["interactions"]
+        for interaction in interactions:
+            request, response = interaction["request"], interaction["response"]
+            if request["method"] != "GET" or response["status"]["code"] != 200:
+                continue
+            end_url = request["uri"].split("/api/", 1)[1].split("?")[0]
+            for pattern, model in CASSETTE_MODELS:
+                if re.fullmatch(pattern, end_url):
+                    body = json.loads(response["body"]["string"])
+                    yield model, body if isinstance(body, list) else [body]
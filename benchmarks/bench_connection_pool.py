@@ -0,0 +1,52 @@
+"""Compare per-call latency of one-shot connections against the pooled client.
+
+Run with ``python -m benchmarks.bench_connection_pool``.
+"""
+import argparse
+import statistics
+import time
+from urllib.parse import urljoin
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from pygrocy.grocy_api_client import GrocyApiClient
+
+USERS = [{"id": 1, "username": "admin"}]
+
+
+def _measure(call, calls: int):
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def _report(label: str, timings):
+    print(
+        f"{label:<10} mean {statistics.mean(timings) * 1000:.3f} ms"
+        f"  median {statistics.median(timings) * 1000:.3f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=500)
+    args = parser.parse_args()
+
+    with StubServer({"users": USERS}) as server:
+        client = GrocyApiClient(server.base_url, "demo_mode", port=server.port)
+        url = urljoin(client._base_url, "users")
+
+        unpooled = _measure(lambda: requests.get(url).json(), args.calls)
+        with client:
+            pooled = _measure(client.get_users, args.calls)
+
+    _report("unpooled", unpooled)
+    _report("pooled", pooled)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare validated, trusted and lazy decoding of the recorded Grocy responses.
+
+Lazy rows are timed twice: decoding only, and decoding plus reading every
+field once.
+
+Run with ``python -m benchmarks.bench_decoding``.
+"""
+import argparse
+import time
+from collections import defaultdict
+
+from benchmarks._cassettes import cassette_payloads
+from pygrocy.decoding import DecodeMode, decode_list
+
+
+def _read_all(model, decoded):
+    for row in decoded:
+        for name in model.__fields__:
+            getattr(row, name)
+
+
+def _time(model, rows, mode: DecodeMode, repeat: int, read: bool = False) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decoded = decode_list(model, rows, mode)
+        if read:
+            _read_all(model, decoded)
+    return time.perf_counter() - start
+
+
+COLUMNS = [
+    ("validated", DecodeMode.VALIDATED, False),
+    ("trusted", DecodeMode.TRUSTED, False),
+    ("lazy", DecodeMode.LAZY, False),
+    ("lazy+read", DecodeMode.LAZY, True),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payloads = defaultdict(list)
+    for model, rows in cassette_payloads():
+        payloads[model].extend(rows)
+
+    totals = {name: 0.0 for name, _, _ in COLUMNS}
+    print(f"{'model':<28} {'rows':>5}" + "".join(f" {c[0]:>10}" for c in COLUMNS))
+    for model, rows in sorted(payloads.items(), key=lambda item: item[0].__name__):
+        for _, mode, _ in COLUMNS:
+            decode_list(model, rows, mode)  # compile outside the timing
+        line = f"{model.__name__:<28} {len(rows):>5}"
+        for name, mode, read in COLUMNS:
+            elapsed = _time(model, rows, mode, args.repeat, read)
+            totals[name] += elapsed
+            line += f" {elapsed / (len(rows) * args.repeat) * 1e6:>8.1f}us"
+        print(line)
+    validated = totals["validated"]
+    speedups = "".join(f" {validated / totals[c[0]]:>9.2f}x" for c in COLUMNS)
+    print(f"{'total':<34}" + "".join(f" {totals[c[0]]:>9.3f}s" for c in COLUMNS))
+    print(f"{'speedup':<34}" + speedups)
+
+
+if __name__ == "__main__":
+    main()
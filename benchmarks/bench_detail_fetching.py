@@ -0,0 +1,51 @@
+"""Compare sequential and thread-pooled ``get_details`` fan-out.
+
+Run with ``python -m benchmarks.bench_detail_fetching``.
+"""
+import argparse
+import time
+
+from benchmarks.stub_server import StubServer
+from pygrocy import Grocy
+
+
+def _chore_routes(count: int) -> dict:
+    routes = {"chores": [{"chore_id": i} for i in range(1, count + 1)]}
+    for chore_id in range(1, count + 1):
+        routes[f"chores/{chore_id}"] = {
+            "chore": {
+                "id": chore_id,
+                "name": f"Chore {chore_id}",
+                "period_type": "daily",
+                "track_date_only": "0",
+                "rollover": "0",
+                "userfields": None,
+            },
+        }
+    return routes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chores", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    with StubServer(_chore_routes(args.chores), latency=args.latency) as server:
+        for workers in args.workers:
+            with Grocy(
+                server.base_url,
+                "demo_mode",
+                port=server.port,
+                pool_maxsize=workers,
+                detail_workers=workers,
+            ) as grocy:
+                start = time.perf_counter()
+                grocy.chores(get_details=True)
+                elapsed = time.perf_counter() - start
+            print(f"{workers:>3} workers: {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
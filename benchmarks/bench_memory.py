@@ -0,0 +1,104 @@
+"""Measure bytes per data model built from the recorded Grocy responses.
+
+Each row is repeated ``--rows`` times from separately parsed JSON, as if it
+came from separate responses. ``before`` and ``after`` are everything
+still allocated per row once the JSON is dropped, backing response
+included; ``instance`` is the data model object itself.
+
+``before`` is measured in the same run on a baseline with string interning
+turned off and the attributes of each data model copied into the
+``__dict__`` of a plain object, as they were stored before ``__slots__``.
+``after`` is the current data models.
+
+Run with ``python -m benchmarks.bench_memory``.
+"""
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections import defaultdict
+from types import SimpleNamespace
+from unittest import mock
+
+from benchmarks._cassettes import DATA_MODELS, cassette_payloads
+from pygrocy import grocy_api_client
+from pygrocy.decoding import DecodeMode, decode_list
+
+
+class _DictBacked(object):
+    pass
+
+
+def _dict_backed(data_model):
+    copy = _DictBacked()
+    for klass in data_model.__class__.__mro__:
+        for name in getattr(klass, "__slots__", ()):
+            if hasattr(data_model, name):
+                copy.__dict__[name] = getattr(data_model, name)
+    return copy
+
+
+def _instance_size(obj) -> int:
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def _retained(build, model, payload: str, copies: int, mode: DecodeMode):
+    gc.collect()
+    tracemalloc.start()
+    objects = []
+    for _ in range(copies):
+        rows = json.loads(payload)
+        objects.extend(build(row) for row in decode_list(model, rows, mode))
+        del rows
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return retained / len(objects), _instance_size(objects[0])
+
+
+def _baseline(model, data_model, payload: str, copies: int, mode: DecodeMode):
+    def build(row):
+        return _dict_backed(data_model(row))
+
+    no_interning = SimpleNamespace(intern=lambda value: value)
+    with mock.patch.object(grocy_api_client, "sys", no_interning):
+        return _retained(build, model, payload, copies, mode)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument(
+        "--mode", choices=[mode.value for mode in DecodeMode], default="validated"
+    )
+    args = parser.parse_args()
+    mode = DecodeMode(args.mode)
+
+    payloads = defaultdict(list)
+    for model, rows in cassette_payloads():
+        if model in DATA_MODELS:
+            payloads[model].extend(rows)
+
+    print(
+        f"{'data model':<20} {'response':<24} {'before':>10} {'after':>10} "
+        f"{'saved':>7} {'instance':>17}"
+    )
+    for model, rows in payloads.items():
+        data_model = DATA_MODELS[model]
+        copies = max(args.rows // len(rows), 1)
+        payload = json.dumps(rows)
+        before, instance_before = _baseline(model, data_model, payload, copies, mode)
+        after, instance_after = _retained(data_model, model, payload, copies, mode)
+        print(
+            f"{data_model.__name__:<20} {model.__name__:<24} "
+            f"{before:>8.0f} B {after:>8.0f} B {1 - after / before:>7.1%} "
+            f"{instance_before:>6d} -> {instance_after:>4d} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Compare data model serialization paths on the recorded stock response.
+
+``legacy`` is the previous ``as_dict``, which walked the class ``__dict__``
+for properties and recursed with ``hasattr``.
+
+Run with ``python -m benchmarks.bench_serialization``.
+"""
+import argparse
+import io
+import json
+import time
+
+from benchmarks._cassettes import cassette_payloads
+from pygrocy.base import as_dicts, dump_json
+from pygrocy.data_models.product import Product
+from pygrocy.grocy_api_client import CurrentStockResponse
+
+
+def _legacy_get_val(obj):
+    if hasattr(obj, "as_dict"):
+        return _legacy_as_dict(obj)
+    return obj
+
+
+def _legacy_as_dict(model):
+    return {
+        name: _legacy_get_val(getattr(model, name))
+        for name, value in model.__class__.__dict__.items()
+        if isinstance(value, property)
+    }
+
+
+def _time(function, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [
+        row
+        for model, rows in cassette_payloads()
+        if model is CurrentStockResponse
+        for row in rows
+    ]
+    rows = (rows * (args.rows // len(rows) + 1))[: args.rows]
+    products = [Product(CurrentStockResponse(**row)) for row in rows]
+
+    cases = {
+        "legacy as_dict": lambda: [_legacy_as_dict(p) for p in products],
+        "as_dict": lambda: [p.as_dict() for p in products],
+        "as_dicts": lambda: as_dicts(products),
+        "legacy json.dumps": lambda: json.dumps(
+            [_legacy_as_dict(p) for p in products], default=str
+        ),
+        "json.dumps(as_dicts)": lambda: json.dumps(as_dicts(products), default=str),
+        "dump_json": lambda: dump_json(products, io.StringIO(), default=str),
+    }
+    print(f"{len(products)} products")
+    for name, function in cases.items():
+        print(f"{name:<22} {_time(function, args.repeat) * 1e3:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare peak memory of buffered and streamed ``objects/stock_log`` reads.
+
+Run with ``python -m benchmarks.bench_streaming``.
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from benchmarks.stub_server import StubServer
+from pygrocy import EntityType, Grocy
+
+
+def _stock_log(count: int) -> bytes:
+    rows = [
+        {
+            "id": row_id,
+            "product_id": row_id % 500,
+            "amount": "1",
+            "best_before_date": "2022-12-31",
+            "purchased_date": "2022-01-01",
+            "used_date": None,
+            "spoiled": "0",
+            "stock_id": f"{row_id:013x}",
+            "transaction_type": "purchase",
+            "price": "1.99",
+            "undone": "0",
+            "undone_timestamp": None,
+            "opened_date": None,
+            "row_created_timestamp": "2022-01-01 10:00:00",
+            "location_id": "1",
+            "recipe_id": None,
+            "correlation_id": None,
+            "transaction_id": f"{row_id:013x}",
+            "stock_row_id": None,
+            "shopping_location_id": None,
+            "user_id": "1",
+            "note": None,
+        }
+        for row_id in range(1, count + 1)
+    ]
+    return json.dumps(rows).encode("utf-8")
+
+
+def _measure(read) -> tuple:
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = read()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    for count in args.rows:
+        routes = {"objects/stock_log": _stock_log(count)}
+        with StubServer(routes) as server, Grocy(
+            server.base_url, "demo_mode", port=server.port
+        ) as grocy:
+            results = {
+                "buffered": _measure(
+                    lambda: len(
+                        grocy.get_generic_objects_for_type(EntityType.STOCK_LOG)
+                    )
+                ),
+                "streamed": _measure(
+                    lambda: sum(
+                        1 for _ in grocy.iter_generic_objects(EntityType.STOCK_LOG)
+                    )
+                ),
+            }
+        for name, (rows, elapsed, peak) in results.items():
+            print(
+                f"{count:>7} rows {name}: {peak / 2**20:8.1f} MiB peak, "
+                f"{elapsed * 1000:8.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@
 The pygrocy module
 """
 from .data_models.generic import EntityType  # noqa: F401
+from .details import DetailsMode  # noqa: F401
 from .grocy import Grocy  # noqa: F401
 from .grocy_api_client import TransactionType  # noqa: F401
+from .query import Operator, Query  # noqa: F401
 
 name = "pygrocy"
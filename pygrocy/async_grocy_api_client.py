@@ -0,0 +1,598 @@
+import asyncio
+import base64
+import json
+import logging
+from datetime import datetime
+from typing import List
+from urllib.parse import urljoin
+
+import aiohttp
+
+from pygrocy import EntityType
+from pygrocy.decoding import DecodeMode, decode, decode_list
+from pygrocy.query import Query, QueryFilters, normalize_query
+from pygrocy.timeouts import RequestTimeouts, current_deadline
+from pygrocy.utils import grocy_datetime_str, localize_datetime, parse_date
+
+from .errors import DeadlineExceededError, GrocyError
+from .grocy_api_client import (
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PORT_NUMBER,
+    BatteryDetailsResponse,
+    ChoreDetailsResponse,
+    CurrentBatteryResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    CurrentVolatilStockResponse,
+    LocationData,
+    MealPlanResponse,
+    MealPlanSectionResponse,
+    ProductDetailsResponse,
+    RecipeDetailsResponse,
+    ShoppingListItem,
+    StockLogResponse,
+    SystemConfigDto,
+    SystemInfoDto,
+    SystemTimeDto,
+    TaskResponse,
+    TransactionType,
+    UserDto,
+    _build_base_url,
+    _build_headers,
+    _enable_debug_mode,
+)
+
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.INFO)
+
+
+class _ResponseContent(object):
+    """Buffered aiohttp response exposing the interface GrocyError expects."""
+
+    def __init__(self, status_code: int, content: bytes):
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncGrocyApiClient(object):
+    def __init__(
+        self,
+        base_url,
+        api_key,
+        port: int = DEFAULT_PORT_NUMBER,
+        path: str = None,
+        verify_ssl=True,
+        debug=False,
+        session: aiohttp.ClientSession = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        timeouts: RequestTimeouts = None,
+        decode_mode: DecodeMode = DecodeMode.VALIDATED,
+    ):
+        if debug:
+            _enable_debug_mode()
+            _LOGGER.setLevel(logging.DEBUG)
+
+        self._base_url = _build_base_url(base_url, port, path)
+        _LOGGER.debug(f"generated base url: {self._base_url}")
+
+        self._api_key = api_key
+        self._verify_ssl = verify_ssl
+        self._headers = _build_headers(api_key)
+
+        self._session = session
+        self._owns_session = session is None
+        self._pool_maxsize = pool_maxsize
+        self._timeouts = timeouts or RequestTimeouts()
+        self._decode_mode = DecodeMode(decode_mode)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self._pool_maxsize)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _send(self, method: str, end_url: str, **kwargs) -> _ResponseContent:
+        req_url = urljoin(self._base_url, end_url)
+        kwargs.setdefault("headers", self._headers)
+        ssl = None if self._verify_ssl else False
+        deadline = current_deadline()
+        connect, read = self._timeouts.for_endpoint(end_url)
+        if deadline is not None:
+            connect, read = deadline.clamp((connect, read))
+        kwargs["timeout"] = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+        try:
+            async with self._get_session().request(
+                method, req_url, ssl=ssl, **kwargs
+            ) as resp:
+                return _ResponseContent(resp.status, await resp.read())
+        except asyncio.TimeoutError as error:
+            if deadline is not None and deadline.remaining() <= 0:
+                raise DeadlineExceededError(deadline.budget) from error
+            raise
+
+    async def _do_get_request(self, end_url: str, query_filters: QueryFilters = None):
+        query_filters, order, limit, offset = normalize_query(query_filters)
+        params = [("query[]", query_filter) for query_filter in query_filters or ()]
+        if order:
+            params.append(("order", order))
+        if limit is not None:
+            params.append(("limit", str(limit)))
+        if offset:
+            params.append(("offset", str(offset)))
+        resp = await self._send("GET", end_url, params=params)
+
+        _LOGGER.debug("-->\tGET /%s", end_url)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+
+        if len(resp.content) > 0:
+            return resp.json()
+
+    async def _do_post_request(self, end_url: str, data: dict):
+        resp = await self._send("POST", end_url, json=data)
+
+        _LOGGER.debug("-->\tPOST /%s", end_url)
+        _LOGGER.debug("\t\t%s", data)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+        if len(resp.content) > 0:
+            return resp.json()
+
+    async def _do_put_request(self, end_url: str, data):
+        up_header = self._headers.copy()
+        up_header["accept"] = "*/*"
+        if isinstance(data, dict):
+            up_header["Content-Type"] = "application/json"
+            data = json.dumps(data)
+        else:
+            up_header["Content-Type"] = "application/octet-stream"
+        resp = await self._send("PUT", end_url, headers=up_header, data=data)
+
+        _LOGGER.debug("-->\tPUT /%s", end_url)
+        _LOGGER.debug("\t\t%s", data)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+
+        if len(resp.content) > 0:
+            return resp.json()
+
+    async def _do_delete_request(self, end_url: str):
+        resp = await self._send("DELETE", end_url)
+
+        _LOGGER.debug("-->\tDELETE /%s", end_url)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+        _LOGGER.debug("\t\t%s", resp.content)
+
+        if resp.status_code >= 400:
+            raise GrocyError(resp)
+
+        if len(resp.content) > 0:
+            return resp.json()
+
+    async def get_stock(self) -> List[CurrentStockResponse]:
+        parsed_json = await self._do_get_request("stock")
+        if parsed_json:
+            return decode_list(CurrentStockResponse, parsed_json, self._decode_mode)
+        return []
+
+    async def get_volatile_stock(self) -> CurrentVolatilStockResponse:
+        parsed_json = await self._do_get_request("stock/volatile")
+        return decode(CurrentVolatilStockResponse, parsed_json, self._decode_mode)
+
+    async def get_product(self, product_id) -> ProductDetailsResponse:
+        parsed_json = await self._do_get_request(f"stock/products/{product_id}")
+        if parsed_json:
+            return decode(ProductDetailsResponse, parsed_json, self._decode_mode)
+
+    async def get_product_by_barcode(self, barcode) -> ProductDetailsResponse:
+        url = f"stock/products/by-barcode/{barcode}"
+        parsed_json = await self._do_get_request(url)
+        if parsed_json:
+            return decode(ProductDetailsResponse, parsed_json, self._decode_mode)
+
+    async def get_chores(
+        self, query_filters: QueryFilters = None
+    ) -> List[CurrentChoreResponse]:
+        parsed_json = await self._do_get_request("chores", query_filters)
+        if parsed_json:
+            return decode_list(CurrentChoreResponse, parsed_json, self._decode_mode)
+        return []
+
+    async def get_chore(self, chore_id: int) -> ChoreDetailsResponse:
+        parsed_json = await self._do_get_request(f"chores/{chore_id}")
+        if parsed_json:
+            return decode(ChoreDetailsResponse, parsed_json, self._decode_mode)
+
+    async def execute_chore(
+        self,
+        chore_id: int,
+        done_by: int = None,
+        tracked_time: datetime = None,
+        skipped: bool = False,
+    ):
+        if tracked_time is None:
+            tracked_time = datetime.now()
+
+        localized_tracked_time = localize_datetime(tracked_time)
+
+        data = {
+            "tracked_time": grocy_datetime_str(localized_tracked_time),
+            "skipped": skipped,
+        }
+
+        if done_by is not None:
+            data["done_by"] = done_by
+
+        return await self._do_post_request(f"chores/{chore_id}/execute", data)
+
+    async def add_product(
+        self,
+        product_id,
+        amount: float,
+        price: float,
+        best_before_date: datetime = None,
+        transaction_type: TransactionType = TransactionType.PURCHASE,
+    ):
+        data = {
+            "amount": amount,
+            "transaction_type": transaction_type.value,
+            "price": price,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = best_before_date.strftime("%Y-%m-%d")
+
+        return await self._do_post_request(f"stock/products/{product_id}/add", data)
+
+    async def consume_product(
+        self,
+        product_id: int,
+        amount: float = 1,
+        spoiled: bool = False,
+        transaction_type: TransactionType = TransactionType.CONSUME,
+        allow_subproduct_substitution: bool = False,
+    ):
+        data = {
+            "amount": amount,
+            "spoiled": spoiled,
+            "transaction_type": transaction_type.value,
+            "allow_subproduct_substitution": allow_subproduct_substitution,
+        }
+
+        await self._do_post_request(f"stock/products/{product_id}/consume", data)
+
+    async def open_product(
+        self,
+        product_id: int,
+        amount: float = 1,
+        allow_subproduct_substitution: bool = False,
+    ):
+        data = {
+            "amount": amount,
+            "allow_subproduct_substitution": allow_subproduct_substitution,
+        }
+
+        await self._do_post_request(f"stock/products/{product_id}/open", data)
+
+    async def consume_recipe(self, recipe_id: int):
+        await self._do_post_request(f"recipes/{recipe_id}/consume", None)
+
+    async def inventory_product(
+        self,
+        product_id: int,
+        new_amount: float,
+        best_before_date: datetime = None,
+        shopping_location_id: int = None,
+        location_id: int = None,
+        price: float = None,
+    ) -> StockLogResponse:
+        data = {
+            "new_amount": new_amount,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = localize_datetime(best_before_date).strftime(
+                "%Y-%m-%d"
+            )
+        if shopping_location_id is not None:
+            data["shopping_location_id"] = shopping_location_id
+
+        if location_id is not None:
+            data["location_id"] = location_id
+
+        if price is not None:
+            data["price"] = price
+
+        parsed_json = await self._do_post_request(
+            f"stock/products/{product_id}/inventory", data
+        )
+
+        if parsed_json:
+            return decode(StockLogResponse, parsed_json[0], self._decode_mode)
+
+    async def add_product_by_barcode(
+        self,
+        barcode: str,
+        amount: float,
+        price: float,
+        best_before_date: datetime = None,
+    ) -> StockLogResponse:
+        data = {
+            "amount": amount,
+            "transaction_type": TransactionType.PURCHASE.value,
+            "price": price,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = localize_datetime(best_before_date).strftime(
+                "%Y-%m-%d"
+            )
+
+        parsed_json = await self._do_post_request(
+            f"stock/products/by-barcode/{barcode}/add", data
+        )
+
+        if parsed_json:
+            return decode(StockLogResponse, parsed_json[0], self._decode_mode)
+
+    async def consume_product_by_barcode(
+        self, barcode: str, amount: float = 1, spoiled: bool = False
+    ) -> StockLogResponse:
+        data = {
+            "amount": amount,
+            "spoiled": spoiled,
+            "transaction_type": TransactionType.CONSUME.value,
+        }
+
+        parsed_json = await self._do_post_request(
+            f"stock/products/by-barcode/{barcode}/consume", data
+        )
+
+        if parsed_json:
+            return decode(StockLogResponse, parsed_json[0], self._decode_mode)
+
+    async def inventory_product_by_barcode(
+        self,
+        barcode: str,
+        new_amount: float,
+        best_before_date: datetime = None,
+        location_id: int = None,
+        price: float = None,
+    ) -> StockLogResponse:
+        data = {
+            "new_amount": new_amount,
+        }
+
+        if best_before_date is not None:
+            data["best_before_date"] = localize_datetime(best_before_date).strftime(
+                "%Y-%m-%d"
+            )
+
+        if location_id is not None:
+            data["location_id"] = location_id
+
+        if price is not None:
+            data["price"] = price
+
+        parsed_json = await self._do_post_request(
+            f"stock/products/by-barcode/{barcode}/inventory", data
+        )
+
+        if parsed_json:
+            return decode(StockLogResponse, parsed_json[0], self._decode_mode)
+
+    async def get_shopping_list(
+        self, query_filters: QueryFilters = None
+    ) -> List[ShoppingListItem]:
+        parsed_json = await self._do_get_request("objects/shopping_list", query_filters)
+        if parsed_json:
+            return decode_list(ShoppingListItem, parsed_json, self._decode_mode)
+        return []
+
+    async def add_missing_product_to_shopping_list(self, shopping_list_id: int = None):
+        data = None
+        if shopping_list_id:
+            data = {"list_id": shopping_list_id}
+
+        await self._do_post_request("stock/shoppinglist/add-missing-products", data)
+
+    async def add_product_to_shopping_list(
+        self,
+        product_id: int,
+        shopping_list_id: int = 1,
+        amount: float = 1,
+        quantity_unit_id: int = None,
+    ):
+        data = {
+            "product_id": product_id,
+            "list_id": shopping_list_id,
+            "product_amount": amount,
+        }
+        if quantity_unit_id:
+            data["qu_id"] = quantity_unit_id
+        await self._do_post_request("stock/shoppinglist/add-product", data)
+
+    async def clear_shopping_list(self, shopping_list_id: int = 1):
+        data = {"list_id": shopping_list_id}
+
+        await self._do_post_request("stock/shoppinglist/clear", data)
+
+    async def remove_product_in_shopping_list(
+        self, product_id: int, shopping_list_id: int = 1, amount: float = 1
+    ):
+        data = {
+            "product_id": product_id,
+            "list_id": shopping_list_id,
+            "product_amount": amount,
+        }
+        await self._do_post_request("stock/shoppinglist/remove-product", data)
+
+    async def get_product_groups(
+        self, query_filters: QueryFilters = None
+    ) -> List[LocationData]:
+        parsed_json = await self._do_get_request(
+            "objects/product_groups", query_filters
+        )
+        if parsed_json:
+            return decode_list(LocationData, parsed_json, self._decode_mode)
+        return []
+
+    async def upload_product_picture(self, product_id: int, pic_path: str):
+        b64fn = base64.b64encode("{}.jpg".format(product_id).encode("ascii"))
+        req_url = "files/productpictures/" + str(b64fn, "utf-8")
+        with open(pic_path, "rb") as pic:
+            await self._do_put_request(req_url, pic.read())
+
+    async def update_product_pic(self, product_id: int):
+        pic_name = f"{product_id}.jpg"
+        data = {"picture_file_name": pic_name}
+        await self._do_put_request(f"objects/products/{product_id}", data)
+
+    async def get_userfields(self, entity: str, object_id: int):
+        return await self._do_get_request(f"userfields/{entity}/{object_id}")
+
+    async def set_userfields(self, entity: str, object_id: int, key: str, value):
+        data = {key: value}
+        await self._do_put_request(f"userfields/{entity}/{object_id}", data)
+
+    async def get_last_db_changed(self):
+        resp = await self._do_get_request("system/db-changed-time")
+        return parse_date(resp.get("changed_time"))
+
+    async def get_system_info(self) -> SystemInfoDto:
+        parsed_json = await self._do_get_request("system/info")
+        if parsed_json:
+            return decode(SystemInfoDto, parsed_json, self._decode_mode)
+
+    async def get_system_time(self) -> SystemTimeDto:
+        parsed_json = await self._do_get_request("system/time")
+        if parsed_json:
+            return decode(SystemTimeDto, parsed_json, self._decode_mode)
+
+    async def get_system_config(self) -> SystemConfigDto:
+        parsed_json = await self._do_get_request("system/config")
+        if parsed_json:
+            return decode(SystemConfigDto, parsed_json, self._decode_mode)
+
+    async def get_tasks(self, query_filters: QueryFilters = None) -> List[TaskResponse]:
+        parsed_json = await self._do_get_request("tasks", query_filters)
+        if parsed_json:
+            return decode_list(TaskResponse, parsed_json, self._decode_mode)
+        return []
+
+    async def get_task(self, task_id: int) -> TaskResponse:
+        parsed_json = await self._do_get_request(f"objects/tasks/{task_id}")
+        return decode(TaskResponse, parsed_json, self._decode_mode)
+
+    async def complete_task(self, task_id: int, done_time: datetime = None):
+        if done_time is None:
+            done_time = datetime.now()
+
+        localized_done_time = localize_datetime(done_time)
+
+        data = {"done_time": grocy_datetime_str(localized_done_time)}
+        await self._do_post_request(f"tasks/{task_id}/complete", data)
+
+    async def get_meal_plan(
+        self, query_filters: QueryFilters = None
+    ) -> List[MealPlanResponse]:
+        parsed_json = await self._do_get_request("objects/meal_plan", query_filters)
+        if parsed_json:
+            return decode_list(MealPlanResponse, parsed_json, self._decode_mode)
+        return []
+
+    async def get_recipe(self, object_id: int) -> RecipeDetailsResponse:
+        parsed_json = await self._do_get_request(f"objects/recipes/{object_id}")
+        if parsed_json:
+            return decode(RecipeDetailsResponse, parsed_json, self._decode_mode)
+
+    async def get_batteries(
+        self, query_filters: QueryFilters = None
+    ) -> List[CurrentBatteryResponse]:
+        parsed_json = await self._do_get_request("batteries", query_filters)
+        if parsed_json:
+            return decode_list(CurrentBatteryResponse, parsed_json, self._decode_mode)
+        return []
+
+    async def get_battery(self, battery_id: int) -> BatteryDetailsResponse:
+        parsed_json = await self._do_get_request(f"batteries/{battery_id}")
+        if parsed_json:
+            return decode(BatteryDetailsResponse, parsed_json, self._decode_mode)
+
+    async def charge_battery(self, battery_id: int, tracked_time: datetime = None):
+        if tracked_time is None:
+            tracked_time = datetime.now()
+
+        localized_tracked_time = localize_datetime(tracked_time)
+        data = {"tracked_time": grocy_datetime_str(localized_tracked_time)}
+
+        return await self._do_post_request(f"batteries/{battery_id}/charge", data)
+
+    async def add_generic(self, entity_type: str, data):
+        return await self._do_post_request(f"objects/{entity_type}", data)
+
+    async def update_generic(self, entity_type: str, object_id: int, data):
+        return await self._do_put_request(f"objects/{entity_type}/{object_id}", data)
+
+    async def delete_generic(self, entity_type: str, object_id: int):
+        return await self._do_delete_request(f"objects/{entity_type}/{object_id}")
+
+    async def get_generic_objects_for_type(
+        self, entity_type: str, query_filters: QueryFilters = None
+    ):
+        return await self._do_get_request(f"objects/{entity_type}", query_filters)
+
+    async def get_meal_plan_sections(
+        self, query_filters: QueryFilters = None
+    ) -> List[MealPlanSectionResponse]:
+        parsed_json = await self.get_generic_objects_for_type(
+            EntityType.MEAL_PLAN_SECTIONS.value, query_filters
+        )
+        if parsed_json:
+            return decode_list(MealPlanSectionResponse, parsed_json, self._decode_mode)
+        return []
+
+    async def get_meal_plan_section(
+        self, meal_plan_section_id
+    ) -> MealPlanSectionResponse:
+        parsed_json = await self.get_generic_objects_for_type(
+            EntityType.MEAL_PLAN_SECTIONS.value,
+            Query(MealPlanSectionResponse).where("id", "=", meal_plan_section_id),
+        )
+        if parsed_json and len(parsed_json) == 1:
+            return decode(MealPlanSectionResponse, parsed_json[0], self._decode_mode)
+
+    async def get_users(self) -> List[UserDto]:
+        parsed_json = await self._do_get_request("users")
+        if parsed_json:
+            return decode_list(UserDto, parsed_json, self._decode_mode)
+        return []
+
+    async def get_user(self, user_id: int) -> UserDto:
+        parsed_json = await self._do_get_request("users")
+        if parsed_json:
+            return decode(UserDto, parsed_json[0], self._decode_mode)
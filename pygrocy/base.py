@@ -1,20 +1,153 @@
 import json
+import math
+from json.encoder import encode_basestring_ascii
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+)
+
+FieldPlan = Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+_SCALARS = (str, int, float, bool, type(None))
+_SCALAR_TYPES = frozenset(_SCALARS)
+_field_plans: Dict[type, FieldPlan] = {}
+
+
+def _field_plan(cls: type) -> FieldPlan:
+    """The ``(name, getter)`` of every property of ``cls``, inherited included."""
+    plan = _field_plans.get(cls)
+    if plan is None:
+        properties = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in klass.__dict__.items():
+                if isinstance(value, property):
+                    properties[name] = value.fget
+                else:
+                    properties.pop(name, None)
+        plan = tuple(properties.items())
+        _field_plans[cls] = plan
+    return plan
 
 
 def get_val(obj):
-    if hasattr(obj, "as_dict"):
-        as_attr = getattr(obj, "as_dict")
-        return as_attr()
+    if isinstance(obj, _SCALARS):
+        return obj
+    if isinstance(obj, DataModel):
+        return obj.as_dict()
+    if isinstance(obj, list):
+        return as_dicts(obj)
     return obj
 
 
+def as_dicts(models: Iterable[Any]) -> List[Any]:
+    """``as_dict`` of every model in ``models``, looking up each class plan once."""
+    result = []
+    plan_class = plan = None
+    for model in models:
+        if not isinstance(model, DataModel):
+            result.append(get_val(model))
+            continue
+        if model.__class__ is not plan_class:
+            plan_class = model.__class__
+            plan = _field_plan(plan_class)
+        result.append(_as_dict(model, plan))
+    return result
+
+
+def _as_dict(model: "DataModel", plan: FieldPlan) -> Dict[str, Any]:
+    values = {}
+    for name, getter in plan:
+        value = getter(model)
+        values[name] = value if value.__class__ in _SCALAR_TYPES else get_val(value)
+    return values
+
+
+class _StreamingEncoder(object):
+    """Encodes data models field by field, as ``json.dumps(as_dict())`` would."""
+
+    def __init__(self, default: Optional[Callable[[Any], Any]] = None):
+        self._encoder = json.JSONEncoder(default=default)
+        self._default = default
+        self._keys: Dict[type, FieldPlan] = {}
+
+    def _plan(self, cls: type):
+        keys = self._keys.get(cls)
+        if keys is None:
+            keys = tuple(
+                (encode_basestring_ascii(name) + ": ", getter)
+                for name, getter in _field_plan(cls)
+            )
+            self._keys[cls] = keys
+        return keys
+
+    def _append(self, obj: Any, parts: List[str]):
+        if obj is None:
+            parts.append("null")
+        elif obj is True:
+            parts.append("true")
+        elif obj is False:
+            parts.append("false")
+        elif isinstance(obj, str):
+            parts.append(encode_basestring_ascii(obj))
+        elif obj.__class__ is int:
+            parts.append(int.__repr__(obj))
+        elif obj.__class__ is float and math.isfinite(obj):
+            parts.append(float.__repr__(obj))
+        elif isinstance(obj, DataModel):
+            separator = "{"
+            for key, getter in self._plan(obj.__class__):
+                parts.append(separator + key)
+                self._append(getter(obj), parts)
+                separator = ", "
+            parts.append("}" if separator == ", " else "{}")
+        elif isinstance(obj, list):
+            separator = "["
+            for item in obj:
+                parts.append(separator)
+                self._append(item, parts)
+                separator = ", "
+            parts.append("]" if separator == ", " else "[]")
+        elif self._default is None or isinstance(obj, (dict, tuple, int, float)):
+            parts.append(self._encoder.encode(obj))
+        else:
+            self._append(self._default(obj), parts)
+
+    def encode(self, obj: Any) -> str:
+        parts = []
+        self._append(obj, parts)
+        return "".join(parts)
+
+
+def dump_json(
+    models: Iterable[Any],
+    fp: TextIO,
+    default: Optional[Callable[[Any], Any]] = None,
+):
+    """Write ``models`` to ``fp`` as a JSON array without building their dicts.
+
+    Each model is written as soon as it is encoded, so ``models`` can be a
+    generator such as ``Grocy.iter_stock()``. For sockets, pass
+    ``socket.makefile("w")``. ``default`` works as in ``json.dump``.
+    """
+    encoder = _StreamingEncoder(default)
+    separator = "["
+    for model in models:
+        fp.write(separator + encoder.encode(model))
+        separator = ", "
+    fp.write("]" if separator == ", " else "[]")
+
+
 class DataModel(object):
+    __slots__ = ()
+
     def toJson(self):
-        return json.dumps(self.as_dict())
+        return _StreamingEncoder().encode(self)
 
     def as_dict(self):
-        return {
-            k: get_val(getattr(self, k))
-            for k, v in self.__class__.__dict__.items()
-            if isinstance(v, property)
-        }
+        return _as_dict(self, _field_plan(self.__class__))
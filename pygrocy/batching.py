@@ -0,0 +1,203 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, List
+
+from .cache import MISSING
+from .data_models.generic import EntityType
+from .details import (
+    _ids_filter,
+    _join_battery_details,
+    _join_chore_details,
+    _rows_by_id,
+)
+from .errors import DeadlineExceededError
+from .grocy_api_client import (
+    GrocyApiClient,
+    MealPlanSectionResponse,
+    RecipeDetailsResponse,
+)
+from .timeouts import current_deadline
+from .utils import parse_int
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_WINDOW = 0.005
+DEFAULT_MAX_BATCH_SIZE = 100
+
+BatchFunction = Callable[[List[Hashable]], Dict[Hashable, Any]]
+
+
+class _Batch(object):
+    def __init__(self):
+        self.keys = {}
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results = {}
+        self.error = None
+
+
+class BatchLoader(object):
+    """Collects keys requested within ``window`` seconds into one batch call.
+
+    The first caller of a window waits for it to close (or for
+    ``max_batch_size`` keys) and runs ``batch_function`` for every key
+    collected; the other callers wait for that call and take their own value
+    from its result. Keys missing from the result, single-key batches and
+    batches whose call failed are loaded one by one with ``load_one``, so
+    callers see the same values and errors as without batching.
+    """
+
+    def __init__(
+        self,
+        batch_function: BatchFunction,
+        load_one: Callable[[Hashable], Any],
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self._batch_function = batch_function
+        self._load_one = load_one
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending = None
+        self._lock = threading.Lock()
+        self._loads = 0
+        self._batches = 0
+
+    @property
+    def loads(self) -> int:
+        return self._loads
+
+    @property
+    def batches(self) -> int:
+        """Batch calls made, each covering several loads."""
+        return self._batches
+
+    def load(self, key: Hashable) -> Any:
+        with self._lock:
+            self._loads += 1
+            batch = self._pending
+            leader = batch is None
+            if leader:
+                batch = _Batch()
+                self._pending = batch
+            batch.keys[key] = None
+            if len(batch.keys) >= self._max_batch_size:
+                self._pending = None
+                batch.full.set()
+
+        if leader:
+            self._dispatch(batch)
+        else:
+            self._wait(batch)
+
+        if leader and isinstance(batch.error, DeadlineExceededError):
+            raise batch.error
+        value = batch.results.get(key, MISSING)
+        if value is MISSING:
+            return self._load_one(key)
+        return value
+
+    def _dispatch(self, batch: _Batch):
+        batch.full.wait(self._window)
+        with self._lock:
+            if self._pending is batch:
+                self._pending = None
+            keys = list(batch.keys)
+            if len(keys) > 1:
+                self._batches += 1
+        try:
+            if len(keys) > 1:
+                batch.results = self._batch_function(keys)
+        except Exception as error:
+            _LOGGER.debug("Batch of %d keys failed, loading each: %s", len(keys), error)
+            batch.error = error
+        finally:
+            batch.done.set()
+
+    @staticmethod
+    def _wait(batch: _Batch):
+        deadline = current_deadline()
+        if deadline is None:
+            batch.done.wait()
+        elif not batch.done.wait(max(deadline.remaining(), 0)):
+            raise DeadlineExceededError(deadline.budget)
+
+
+def _by_key(keys: List[Hashable], values: Dict[int, Any]) -> Dict[Hashable, Any]:
+    return {key: values[parse_int(key)] for key in keys if parse_int(key) in values}
+
+
+class IdBatcher(object):
+    """Batching loaders behind ``GrocyApiClient``'s per-id lookups.
+
+    Chores and batteries are built from the tables used by
+    ``DetailsMode.JOIN``, filtered to the requested ids; recipes and meal plan
+    sections are fetched with one ``objects/<entity>`` query matching all
+    requested ids. Products are not batched: ``stock/products/<id>`` carries
+    purchase and price fields no table has.
+    """
+
+    def __init__(
+        self,
+        api_client: GrocyApiClient,
+        load_one: Dict[str, Callable[[Hashable], Any]],
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        self._api_client = api_client
+        batch_functions = {
+            "chore": self._chores,
+            "battery": self._batteries,
+            "recipe": self._recipes,
+            "meal_plan_section": self._meal_plan_sections,
+        }
+        self._loaders = {
+            name: BatchLoader(function, load_one[name], window, max_batch_size)
+            for name, function in batch_functions.items()
+        }
+
+    @property
+    def loaders(self) -> Dict[str, BatchLoader]:
+        return self._loaders
+
+    def load(self, name: str, key: Hashable) -> Any:
+        return self._loaders[name].load(key)
+
+    def _chores(self, keys):
+        current = {
+            chore.chore_id: (
+                chore.last_tracked_time,
+                chore.next_estimated_execution_time,
+            )
+            for chore in self._api_client.get_chores([_ids_filter("chore_id", keys)])
+        }
+        return _by_key(keys, _join_chore_details(current, self._api_client, by_id=True))
+
+    def _batteries(self, keys):
+        current = {
+            battery.id: (battery.last_tracked_time, battery.next_estimated_charge_time)
+            for battery in self._api_client.get_batteries([_ids_filter("id", keys)])
+        }
+        return _by_key(
+            keys, _join_battery_details(current, self._api_client, by_id=True)
+        )
+
+    def _objects(self, entity_type: EntityType, keys) -> Dict[int, dict]:
+        rows = self._api_client.get_generic_objects_for_type(
+            entity_type.value, [_ids_filter("id", keys)]
+        )
+        return _rows_by_id(rows or [])
+
+    def _recipes(self, keys):
+        rows = self._objects(EntityType.RECIPES, keys)
+        return {
+            key: RecipeDetailsResponse(**row)
+            for key, row in _by_key(keys, rows).items()
+        }
+
+    def _meal_plan_sections(self, keys):
+        rows = self._objects(EntityType.MEAL_PLAN_SECTIONS, keys)
+        return {
+            key: MealPlanSectionResponse(**row)
+            for key, row in _by_key(keys, rows).items()
+        }
@@ -0,0 +1,255 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable
+
+from .data_models.generic import EntityType
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_EXCLUDED_ENDPOINTS = (
+    "system/db-changed-time",
+    "system/time",
+    "stock/volatile",
+)
+
+MISSING = object()
+
+
+class ResponseCache(object):
+    """LRU cache for parsed GET responses, invalidated by db-changed-time.
+
+    Grocy bumps ``system/db-changed-time`` on every write, so cached responses
+    stay valid until that timestamp advances. ``stock/volatile`` depends on the
+    current date and is excluded by default, as are the system time endpoints.
+
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        excluded_endpoints: Iterable[str] = DEFAULT_EXCLUDED_ENDPOINTS,
+        validation_interval: float = 0,
+    ):
+        self._max_entries = max_entries
+        self._excluded_endpoints = set(excluded_endpoints)
+        self._validation_interval = validation_interval
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db_changed_time = None
+        self._validated_at = None
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def db_changed_time(self) -> str:
+        """The db-changed-time the current entries belong to."""
+        return self._db_changed_time
+
+    def exclude(self, endpoint: str):
+        self._excluded_endpoints.add(endpoint)
+
+    def is_cacheable(self, end_url: str) -> bool:
+        return not any(
+            end_url == endpoint or end_url.startswith(endpoint + "/")
+            for endpoint in self._excluded_endpoints
+        )
+
+    def needs_validation(self, now: float) -> bool:
+        validated_at = self._validated_at
+        return validated_at is None or now - validated_at >= self._validation_interval
+
+    def validate(self, db_changed_time: str, now: float):
+        """Drop all entries if the server's db-changed-time has advanced."""
+        with self._lock:
+            if db_changed_time != self._db_changed_time:
+                self._clear_entries()
+                self._db_changed_time = db_changed_time
+            self._validated_at = now
+
+    def _clear_entries(self):
+        self._entries.clear()
+
+    def _is_current(self, db_changed_time: str) -> bool:
+        return db_changed_time == self._db_changed_time
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key, MISSING)
+            if value is MISSING:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Return a cached value without touching the LRU order or counters."""
+        return self._entries.get(key, MISSING)
+
+    def set(self, key: Hashable, value: Any, db_changed_time: str = MISSING):
+        """Store ``value``, unless it was fetched under an older db-changed-time.
+
+        Pass the ``db_changed_time`` read before fetching; if the cache was
+        validated against a newer one meanwhile, the value is dropped.
+        """
+        with self._lock:
+            if db_changed_time is not MISSING and not self._is_current(db_changed_time):
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._clear_entries()
+            self._validated_at = None
+
+
+class CachePolicy(object):
+    """Caching rules for one entity type.
+
+    Entries are fresh for ``ttl`` seconds. For another
+    ``stale_while_revalidate`` seconds the stale entry is still served while
+    it is refreshed in the background. At most ``max_entries`` distinct
+    queries are kept per entity type.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_while_revalidate: float = 0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_entries = max_entries
+
+
+MASTER_DATA_CACHE_POLICIES = {
+    EntityType.LOCATIONS: CachePolicy(ttl=300, stale_while_revalidate=3600),
+    EntityType.QUANTITY_UNITS: CachePolicy(ttl=300, stale_while_revalidate=3600),
+    EntityType.PRODUCT_GROUPS: CachePolicy(ttl=300, stale_while_revalidate=3600),
+    EntityType.SHOPPING_LOCATIONS: CachePolicy(ttl=300, stale_while_revalidate=3600),
+    EntityType.TASK_CATEGORIES: CachePolicy(ttl=300, stale_while_revalidate=3600),
+    EntityType.MEAL_PLAN_SECTIONS: CachePolicy(ttl=300, stale_while_revalidate=3600),
+}
+
+
+class EntityCache(object):
+    """TTL cache for ``objects/<entity>`` responses with a policy per entity type."""
+
+    def __init__(
+        self,
+        policies: Dict[EntityType, CachePolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if policies is None:
+            policies = MASTER_DATA_CACHE_POLICIES
+        self._policies = {
+            EntityType(entity_type).value: policy
+            for entity_type, policy in policies.items()
+        }
+        self._clock = clock
+        self._entries = {entity_type: OrderedDict() for entity_type in self._policies}
+        self._generations = {entity_type: 0 for entity_type in self._policies}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def has_policy(self, entity_type: str) -> bool:
+        return entity_type in self._policies
+
+    def get_or_load(self, entity_type: str, key: Hashable, loader: Callable[[], Any]):
+        policy = self._policies[entity_type]
+        now = self._clock()
+        with self._lock:
+            generation = self._generations[entity_type]
+            entries = self._entries[entity_type]
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+                loaded_at, value = entry
+                age = now - loaded_at
+                if age < policy.ttl:
+                    return value
+                if age < policy.ttl + policy.stale_while_revalidate:
+                    self._refresh_in_background(entity_type, key, loader, generation)
+                    return value
+
+        value = loader()
+        self._store(entity_type, key, value, now, generation)
+        return value
+
+    def peek(self, entity_type: str, key: Hashable) -> Any:
+        """Return a fresh cached value, or ``MISSING``, without loading."""
+        policy = self._policies.get(entity_type)
+        if policy is None:
+            return MISSING
+        entry = self._entries[entity_type].get(key)
+        if entry is None or self._clock() - entry[0] >= policy.ttl:
+            return MISSING
+        return entry[1]
+
+    def _refresh_in_background(
+        self, entity_type: str, key: Hashable, loader, generation: int
+    ):
+        if (entity_type, key) in self._refreshing:
+            return
+        self._refreshing.add((entity_type, key))
+        thread = threading.Thread(
+            target=self._refresh,
+            args=(entity_type, key, loader, generation),
+            name="pygrocy-cache-refresh",
+            daemon=True,
+        )
+        thread.start()
+
+    def _refresh(self, entity_type: str, key: Hashable, loader, generation: int):
+        try:
+            started_at = self._clock()
+            self._store(entity_type, key, loader(), started_at, generation)
+        except Exception as error:
+            _LOGGER.warning("Refreshing cached %s failed: %s", entity_type, error)
+        finally:
+            with self._lock:
+                self._refreshing.discard((entity_type, key))
+
+    def _store(
+        self, entity_type: str, key: Hashable, value, loaded_at: float, generation: int
+    ):
+        policy = self._policies[entity_type]
+        with self._lock:
+            if generation != self._generations[entity_type]:
+                return
+            entries = self._entries[entity_type]
+            entries[key] = (loaded_at, value)
+            entries.move_to_end(key)
+            while len(entries) > policy.max_entries:
+                entries.popitem(last=False)
+
+    def invalidate(self, entity_type: str = None):
+        with self._lock:
+            for cached_type, entries in self._entries.items():
+                if entity_type is None or entity_type == cached_type:
+                    entries.clear()
+                    self._generations[cached_type] += 1
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import TYPE_CHECKING, Union
 
 from pygrocy.base import DataModel
 from pygrocy.grocy_api_client import (
@@ -7,89 +8,74 @@ from pygrocy.grocy_api_client import (
     GrocyApiClient,
 )
 
+if TYPE_CHECKING:
+    from pygrocy.async_grocy_api_client import AsyncGrocyApiClient
 
-class Battery(DataModel):
-    def __init__(self, response):
-        self._init_empty()
 
-        self._next_estimated_charge_time = response.next_estimated_charge_time
+class Battery(DataModel):
+    __slots__ = ("_response", "_details")
 
-        if isinstance(response, CurrentBatteryResponse):
-            self._init_from_CurrentBatteryResponse(response)
-        elif isinstance(response, BatteryDetailsResponse):
+    def __init__(self, response: Union[CurrentBatteryResponse, BatteryDetailsResponse]):
+        self._response = response
+        self._details = None
+        if isinstance(response, BatteryDetailsResponse):
             self._init_from_BatteryDetailsResponse(response)
 
-    def _init_from_CurrentBatteryResponse(self, response: CurrentBatteryResponse):
-        self._id = response.id
-        self._last_tracked_time = response.last_tracked_time
-
     def _init_from_BatteryDetailsResponse(self, response: BatteryDetailsResponse):
-        self._charge_cycles_count = response.charge_cycles_count
-        self._last_charged = response.last_charged
-        self._last_tracked_time = response.last_charged  # For compatibility
-        self._id = response.battery.id
-        self._name = response.battery.name
-        self._description = response.battery.description
-        self._used_in = response.battery.used_in
-        self._charge_interval_days = response.battery.charge_interval_days
-        self._created_timestamp = response.battery.created_timestamp
-        self._userfields = response.battery.userfields
-
-    def _init_empty(self):
-        self._last_tracked_time = None
-        self._charge_cycles_count = None
-        self._last_charged = None
-        self._name = None
-        self._description = None
-        self._used_in = None
-        self._charge_interval_days = None
-        self._created_timestamp = None
-        self._userfields = None
+        self._details = response
 
     def get_details(self, api_client: GrocyApiClient):
-        details = api_client.get_battery(self._id)
+        details = api_client.get_battery(self.id)
+        self._init_from_BatteryDetailsResponse(details)
+
+    async def async_get_details(self, api_client: "AsyncGrocyApiClient"):
+        details = await api_client.get_battery(self.id)
         self._init_from_BatteryDetailsResponse(details)
 
     @property
     def id(self) -> int:
-        return self._id
+        if self._details:
+            return self._details.battery.id
+        return self._response.id
 
     @property
     def name(self) -> str:
-        return self._name
+        return self._details.battery.name if self._details else None
 
     @property
     def description(self) -> str:
-        return self._description
+        return self._details.battery.description if self._details else None
 
     @property
     def used_in(self) -> str:
-        return self._used_in
+        return self._details.battery.used_in if self._details else None
 
     @property
     def charge_interval_days(self) -> int:
-        return self._charge_interval_days
+        return self._details.battery.charge_interval_days if self._details else None
 
     @property
     def created_timestamp(self) -> datetime:
-        return self._created_timestamp
+        return self._details.battery.created_timestamp if self._details else None
 
     @property
     def charge_cycles_count(self) -> int:
-        return self._charge_cycles_count
+        return self._details.charge_cycles_count if self._details else None
 
     @property
     def userfields(self):
-        return self._userfields
+        return self._details.battery.userfields if self._details else None
 
     @property
     def last_charged(self) -> datetime:
-        return self._last_charged
+        return self._details.last_charged if self._details else None
 
     @property
     def last_tracked_time(self) -> datetime:
-        return self._last_tracked_time
+        if self._details:
+            return self._details.last_charged  # For compatibility
+        return self._response.last_tracked_time
 
     @property
     def next_estimated_charge_time(self) -> datetime:
-        return self._next_estimated_charge_time
+        return self._response.next_estimated_charge_time
@@ -1,6 +1,6 @@
 from datetime import datetime
 from enum import Enum
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Union
 
 from pygrocy.base import DataModel
 from pygrocy.data_models.user import User
@@ -10,6 +10,9 @@ from pygrocy.grocy_api_client import (
     GrocyApiClient,
 )
 
+if TYPE_CHECKING:
+    from pygrocy.async_grocy_api_client import AsyncGrocyApiClient
+
 
 class PeriodType(str, Enum):
     MANUALLY = "manually"
@@ -30,55 +33,28 @@ class AssignmentType(str, Enum):
 
 
 class Chore(DataModel):
-    def __init__(self, response):
-        if isinstance(response, CurrentChoreResponse):
-            self._init_from_CurrentChoreResponse(response)
-        elif isinstance(response, ChoreDetailsResponse):
-            self._init_from_ChoreDetailsResponse(response)
-
-    # noinspection PyPep8Naming
-    def _init_from_CurrentChoreResponse(self, response: CurrentChoreResponse):
-        self._id = response.chore_id
-        self._last_tracked_time = response.last_tracked_time
-        self._next_estimated_execution_time = response.next_estimated_execution_time
-        self._name = None
+    __slots__ = (
+        "_response",
+        "_details",
+        "_last_done_by",
+        "_next_execution_assigned_user",
+    )
+
+    def __init__(self, response: Union[CurrentChoreResponse, ChoreDetailsResponse]):
+        self._response = response
+        self._details = None
         self._last_done_by = None
+        self._next_execution_assigned_user = None
+        if isinstance(response, ChoreDetailsResponse):
+            self._init_from_ChoreDetailsResponse(response)
 
     # noinspection PyPep8Naming
     def _init_from_ChoreDetailsResponse(self, response: ChoreDetailsResponse):
-        chore_data = response.chore
-        self._id = chore_data.id
-        self._name = chore_data.name
-        self._description = chore_data.description
-
-        if chore_data.period_type is not None:
-            self._period_type = PeriodType(chore_data.period_type)
-        else:
-            self._period_type = None
-
-        self._period_config = chore_data.period_config
-        self._period_days = chore_data.period_days
-        self._track_date_only = chore_data.track_date_only
-        self._rollover = chore_data.rollover
-
-        if chore_data.assignment_type is not None:
-            self._assignment_type = AssignmentType(chore_data.assignment_type)
-        else:
-            self._assignment_type = None
-
-        self._assignment_config = chore_data.assignment_config
-        self._next_execution_assigned_to_user_id = (
-            chore_data.next_execution_assigned_to_user_id
-        )
-        self._userfields = chore_data.userfields
-
-        self._last_tracked_time = response.last_tracked
-        self._next_estimated_execution_time = response.next_estimated_execution_time
+        self._details = response
         if response.last_done_by is not None:
             self._last_done_by = User(response.last_done_by)
         else:
             self._last_done_by = None
-        self._track_count = response.track_count
         if response.next_execution_assigned_user is not None:
             self._next_execution_assigned_user = User(
                 response.next_execution_assigned_user
@@ -90,61 +66,77 @@ class Chore(DataModel):
         details = api_client.get_chore(self.id)
         self._init_from_ChoreDetailsResponse(details)
 
+    async def async_get_details(self, api_client: "AsyncGrocyApiClient"):
+        details = await api_client.get_chore(self.id)
+        self._init_from_ChoreDetailsResponse(details)
+
     @property
     def id(self) -> int:
-        return self._id
+        if self._details:
+            return self._details.chore.id
+        return self._response.chore_id
 
     @property
     def name(self) -> str:
-        return self._name
+        return self._details.chore.name if self._details else None
 
     @property
     def description(self) -> str:
-        return self._description
+        return self._details.chore.description if self._details else None
 
     @property
     def period_type(self) -> PeriodType:
-        return self._period_type
+        if self._details and self._details.chore.period_type is not None:
+            return PeriodType(self._details.chore.period_type)
+        return None
 
     @property
     def period_config(self) -> str:
-        return self._period_config
+        return self._details.chore.period_config if self._details else None
 
     @property
     def period_days(self) -> int:
-        return self._period_days
+        return self._details.chore.period_days if self._details else None
 
     @property
     def track_date_only(self) -> bool:
-        return self._track_date_only
+        return self._details.chore.track_date_only if self._details else None
 
     @property
     def rollover(self) -> bool:
-        return self._rollover
+        return self._details.chore.rollover if self._details else None
 
     @property
     def assignment_type(self) -> AssignmentType:
-        return self._assignment_type
+        if self._details and self._details.chore.assignment_type is not None:
+            return AssignmentType(self._details.chore.assignment_type)
+        return None
 
     @property
     def assignment_config(self) -> str:
-        return self._assignment_config
+        return self._details.chore.assignment_config if self._details else None
 
     @property
     def next_execution_assigned_to_user_id(self) -> int:
-        return self._next_execution_assigned_to_user_id
+        if self._details:
+            return self._details.chore.next_execution_assigned_to_user_id
+        return None
 
     @property
     def userfields(self) -> Dict[str, str]:
-        return self._userfields
+        return self._details.chore.userfields if self._details else None
 
     @property
     def last_tracked_time(self) -> datetime:
-        return self._last_tracked_time
+        if self._details:
+            return self._details.last_tracked
+        return self._response.last_tracked_time
 
     @property
     def next_estimated_execution_time(self) -> datetime:
-        return self._next_estimated_execution_time
+        if self._details:
+            return self._details.next_estimated_execution_time
+        return self._response.next_estimated_execution_time
 
     @property
     def last_done_by(self) -> User:
@@ -152,7 +144,7 @@ class Chore(DataModel):
 
     @property
     def track_count(self) -> int:
-        return self._track_count
+        return self._details.track_count if self._details else None
 
     @property
     def next_execution_assigned_user(self) -> User:
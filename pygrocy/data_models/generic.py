@@ -4,8 +4,11 @@ from enum import Enum
 class EntityType(str, Enum):
     PRODUCTS = "products"
     CHORES = "chores"
+    CHORES_LOG = "chores_log"
     PRODUCT_BARCODES = "product_barcodes"
     BATTERIES = "batteries"
+    STOCK_LOG = "stock_log"
+    BATTERY_CHARGE_CYCLES = "battery_charge_cycles"
     LOCATIONS = "locations"
     QUANTITY_UNITS = "quantity_units"
     QUANTITY_UNIT_CONVERSIONS = "quantity_unit_conversions"
@@ -1,6 +1,7 @@
 import base64
 from datetime import datetime
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from pygrocy.base import DataModel
 from pygrocy.grocy_api_client import (
@@ -10,8 +11,20 @@ from pygrocy.grocy_api_client import (
     RecipeDetailsResponse,
 )
 
+if TYPE_CHECKING:
+    from pygrocy.async_grocy_api_client import AsyncGrocyApiClient
+
 
 class RecipeItem(DataModel):
+    __slots__ = (
+        "_id",
+        "_name",
+        "_description",
+        "_base_servings",
+        "_desired_servings",
+        "_picture_file_name",
+    )
+
     def __init__(self, response: RecipeDetailsResponse):
         self._id = response.id
         self._name = response.name
@@ -53,6 +66,8 @@ class RecipeItem(DataModel):
 
 
 class MealPlanSection(DataModel):
+    __slots__ = ("_id", "_name", "_sort_number", "_row_created_timestamp")
+
     def __init__(self, response: MealPlanSectionResponse):
         self._id = response.id
         self._name = response.name
@@ -83,36 +98,32 @@ class MealPlanItemType(str, Enum):
 
 
 class MealPlanItem(DataModel):
+    __slots__ = ("_response", "_recipe", "_section")
+
     def __init__(self, response: MealPlanResponse):
-        self._id = response.id
-        self._day = response.day
+        self._response = response
         self._recipe = None
-        self._recipe_id = response.recipe_id
-        self._recipe_servings = response.recipe_servings
-        self._note = response.note
-        self._section_id = response.section_id
-        self._type = MealPlanItemType(response.type)
-        self._product_id = response.product_id
+        self._section = None
 
     @property
     def id(self) -> int:
-        return self._id
+        return self._response.id
 
     @property
     def day(self) -> datetime.date:
-        return self._day
+        return self._response.day
 
     @property
     def recipe_id(self) -> int:
-        return self._recipe_id
+        return self._response.recipe_id
 
     @property
     def recipe_servings(self) -> int:
-        return self._recipe_servings
+        return self._response.recipe_servings
 
     @property
     def note(self) -> str:
-        return self._note
+        return self._response.note
 
     @property
     def recipe(self) -> RecipeItem:
@@ -120,7 +131,7 @@ class MealPlanItem(DataModel):
 
     @property
     def section_id(self) -> int:
-        return self._section_id
+        return self._response.section_id
 
     @property
     def section(self) -> MealPlanSection:
@@ -128,18 +139,34 @@ class MealPlanItem(DataModel):
 
     @property
     def type(self) -> MealPlanItemType:
-        return self._type
+        return MealPlanItemType(self._response.type)
 
     @property
     def product_id(self) -> int:
-        return self._product_id
+        return self._response.product_id
+
+    def _init_details(
+        self, recipe: RecipeDetailsResponse, section: MealPlanSectionResponse
+    ):
+        if recipe:
+            self._recipe = RecipeItem(recipe)
+        if section:
+            self._section = MealPlanSection(section)
 
     def get_details(self, api_client: GrocyApiClient):
+        recipe = None
+        section = None
         if self.recipe_id:
             recipe = api_client.get_recipe(self.recipe_id)
-            if recipe:
-                self._recipe = RecipeItem(recipe)
         if self.section_id:
             section = api_client.get_meal_plan_section(self.section_id)
-            if section:
-                self._section = MealPlanSection(section)
+        self._init_details(recipe, section)
+
+    async def async_get_details(self, api_client: "AsyncGrocyApiClient"):
+        recipe = None
+        section = None
+        if self.recipe_id:
+            recipe = await api_client.get_recipe(self.recipe_id)
+        if self.section_id:
+            section = await api_client.get_meal_plan_section(self.section_id)
+        self._init_details(recipe, section)
@@ -1,9 +1,10 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from pygrocy.base import DataModel
 from pygrocy.grocy_api_client import (
     CurrentStockResponse,
+    CurrentVolatilStockResponse,
     GrocyApiClient,
     LocationData,
     MissingProductResponse,
@@ -15,8 +16,13 @@ from pygrocy.grocy_api_client import (
     StockLogResponse,
 )
 
+if TYPE_CHECKING:
+    from pygrocy.async_grocy_api_client import AsyncGrocyApiClient
+
 
 class ProductBarcode(DataModel):
+    __slots__ = ("_barcode", "_amount")
+
     def __init__(self, data: ProductBarcodeData):
         self._barcode = data.barcode
         self._amount = float(data.amount) if data.amount else None
@@ -31,6 +37,8 @@ class ProductBarcode(DataModel):
 
 
 class QuantityUnit(DataModel):
+    __slots__ = ("_id", "_name", "_name_plural", "_description")
+
     def __init__(self, data: QuantityUnitData):
         self._id = data.id
         self._name = data.name
@@ -55,6 +63,22 @@ class QuantityUnit(DataModel):
 
 
 class Product(DataModel):
+    """View over the responses a product was built from.
+
+    Values are read from the responses on access rather than copied.
+    """
+
+    __slots__ = (
+        "_id",
+        "_product",
+        "_stock",
+        "_missing",
+        "_details",
+        "_best_before_date",
+        "_default_quantity_unit_purchase",
+        "_barcodes",
+    )
+
     def __init__(self, data):
         self._init_empty()
         if isinstance(data, CurrentStockResponse):
@@ -69,102 +93,96 @@ class Product(DataModel):
             self._init_from_StockLogResponse(data)
 
     def _init_empty(self):
-        self._name = None
         self._id = None
-        self._amount_missing = None
-        self._is_partly_in_stock = None
-
-        self._available_amount = None
-        self._amount_aggregated = None
-        self._amount_opened = None
-        self._amount_opened_aggregated = None
-        self._is_aggregated_amount = None
+        self._product = None
+        self._stock = None
+        self._missing = None
+        self._details = None
         self._best_before_date = None
-
         self._default_quantity_unit_purchase = None
-
         self._barcodes = []
-        self._product_group_id = None
 
     def _init_from_CurrentStockResponse(self, response: CurrentStockResponse):
         self._id = response.product_id
-        self._available_amount = response.amount
-        self._amount_aggregated = response.amount_aggregated
-        self._amount_opened = response.amount_opened
-        self._amount_opened_aggregated = response.amount_opened_aggregated
-        self._is_aggregated_amount = response.is_aggregated_amount
-        self._best_before_date = response.best_before_date
-
-        if response.product:
-            self._init_from_ProductData(response.product)
+        self._stock = response
+        self._product = response.product
 
     def _init_from_MissingProductResponse(self, response: MissingProductResponse):
         self._id = response.id
-        self._name = response.name
-        self._amount_missing = response.amount_missing
-        self._is_partly_in_stock = response.is_partly_in_stock
+        self._missing = response
 
     def _init_from_ProductDetailsResponse(self, response: ProductDetailsResponse):
-        self._available_amount = response.stock_amount
+        self._details = response
+        self._product = response.product
         self._best_before_date = response.next_best_before_date
         self._barcodes = [ProductBarcode(data) for data in response.barcodes]
         self._default_quantity_unit_purchase = QuantityUnit(
             response.default_quantity_unit_purchase
         )
 
-        if response.product:
-            self._init_from_ProductData(response.product)
-
     def _init_from_ProductData(self, product: ProductData):
-        self._id = product.id
-        self._product_group_id = product.product_group_id
-        self._name = product.name
+        self._product = product
 
     def _init_from_StockLogResponse(self, response: StockLogResponse):
         self._id = response.product_id
 
+    def _update_from_ProductDetailsResponse(self, details: ProductDetailsResponse):
+        self._details = details
+        self._product = details.product
+        self._barcodes = [ProductBarcode(barcode) for barcode in details.barcodes]
+
     def get_details(self, api_client: GrocyApiClient):
         details = api_client.get_product(self.id)
         if details:
-            self._name = details.product.name
-            self._barcodes = [ProductBarcode(barcode) for barcode in details.barcodes]
-            self._product_group_id = details.product.product_group_id
-            self._available_amount = details.stock_amount
+            self._update_from_ProductDetailsResponse(details)
+
+    async def async_get_details(self, api_client: "AsyncGrocyApiClient"):
+        details = await api_client.get_product(self.id)
+        if details:
+            self._update_from_ProductDetailsResponse(details)
 
     @property
     def name(self) -> str:
-        return self._name
+        if self._product:
+            return self._product.name
+        if self._missing:
+            return self._missing.name
+        return None
 
     @property
     def id(self) -> int:
-        return self._id
+        return self._product.id if self._product else self._id
 
     @property
     def product_group_id(self) -> int:
-        return self._product_group_id
+        return self._product.product_group_id if self._product else None
 
     @property
     def available_amount(self) -> float:
-        return self._available_amount
+        if self._details:
+            return self._details.stock_amount
+        return self._stock.amount if self._stock else None
 
     @property
     def amount_aggregated(self) -> float:
-        return self._amount_aggregated
+        return self._stock.amount_aggregated if self._stock else None
 
     @property
     def amount_opened(self) -> float:
-        return self._amount_opened
+        return self._stock.amount_opened if self._stock else None
 
     @property
     def amount_opened_aggregated(self) -> float:
-        return self._amount_opened_aggregated
+        return self._stock.amount_opened_aggregated if self._stock else None
 
     @property
     def is_aggregated_amount(self) -> bool:
-        return self._is_aggregated_amount
+        return self._stock.is_aggregated_amount if self._stock else None
 
     @property
     def best_before_date(self) -> datetime.date:
+        if self._stock:
+            return self._stock.best_before_date
         return self._best_before_date
 
     @property
@@ -177,18 +195,57 @@ class Product(DataModel):
 
     @property
     def amount_missing(self) -> float:
-        return self._amount_missing
+        return self._missing.amount_missing if self._missing else None
 
     @property
     def is_partly_in_stock(self) -> int:
-        return self._is_partly_in_stock
+        return self._missing.is_partly_in_stock if self._missing else None
 
     @property
     def default_quantity_unit_purchase(self) -> QuantityUnit:
         return self._default_quantity_unit_purchase
 
 
+class VolatileStock(DataModel):
+    __slots__ = (
+        "_due_products",
+        "_overdue_products",
+        "_expired_products",
+        "_missing_products",
+    )
+
+    def __init__(self, response: CurrentVolatilStockResponse):
+        self._due_products = [Product(resp) for resp in response.due_products or []]
+        self._overdue_products = [
+            Product(resp) for resp in response.overdue_products or []
+        ]
+        self._expired_products = [
+            Product(resp) for resp in response.expired_products or []
+        ]
+        self._missing_products = [
+            Product(resp) for resp in response.missing_products or []
+        ]
+
+    @property
+    def due_products(self) -> List[Product]:
+        return self._due_products
+
+    @property
+    def overdue_products(self) -> List[Product]:
+        return self._overdue_products
+
+    @property
+    def expired_products(self) -> List[Product]:
+        return self._expired_products
+
+    @property
+    def missing_products(self) -> List[Product]:
+        return self._missing_products
+
+
 class Group(DataModel):
+    __slots__ = ("_id", "_name", "_description")
+
     def __init__(self, raw_product_group: LocationData):
         self._id = raw_product_group.id
         self._name = raw_product_group.name
@@ -208,32 +265,38 @@ class Group(DataModel):
 
 
 class ShoppingListProduct(DataModel):
+    __slots__ = ("_response", "_product")
+
     def __init__(self, raw_shopping_list: ShoppingListItem):
-        self._id = raw_shopping_list.id
-        self._product_id = raw_shopping_list.product_id
-        self._note = raw_shopping_list.note
-        self._amount = raw_shopping_list.amount
+        self._response = raw_shopping_list
         self._product = None
 
+    def _init_product(self, details: ProductDetailsResponse):
+        self._product = Product(details)
+
     def get_details(self, api_client: GrocyApiClient):
-        if self._product_id:
-            self._product = Product(api_client.get_product(self._product_id))
+        if self.product_id:
+            self._init_product(api_client.get_product(self.product_id))
+
+    async def async_get_details(self, api_client: "AsyncGrocyApiClient"):
+        if self.product_id:
+            self._init_product(await api_client.get_product(self.product_id))
 
     @property
     def id(self) -> int:
-        return self._id
+        return self._response.id
 
     @property
     def product_id(self) -> int:
-        return self._product_id
+        return self._response.product_id
 
     @property
     def amount(self) -> float:
-        return self._amount
+        return self._response.amount
 
     @property
     def note(self) -> str:
-        return self._note
+        return self._response.note
 
     @property
     def product(self) -> Product:
@@ -6,6 +6,15 @@ from pygrocy.grocy_api_client import SystemConfigDto, SystemInfoDto, SystemTimeD
 
 
 class SystemInfo(DataModel):
+    __slots__ = (
+        "_grocy_version",
+        "_grocy_release_date",
+        "_php_version",
+        "_sqlite_version",
+        "_os",
+        "_client",
+    )
+
     def __init__(self, system_info_dto: SystemInfoDto):
         self._grocy_version = system_info_dto.grocy_version_info.version
         self._grocy_release_date = system_info_dto.grocy_version_info.release_date
@@ -40,6 +49,14 @@ class SystemInfo(DataModel):
 
 
 class SystemTime(DataModel):
+    __slots__ = (
+        "_timezone",
+        "_time_local",
+        "_time_local_sqlite3",
+        "_time_utc",
+        "_timestamp",
+    )
+
     def __init__(self, system_time_dto: SystemTimeDto):
         self._timezone = system_time_dto.timezone
         self._time_local = system_time_dto.time_local
@@ -69,6 +86,17 @@ class SystemTime(DataModel):
 
 
 class SystemConfig(DataModel):
+    __slots__ = (
+        "_username",
+        "_base_path",
+        "_base_url",
+        "_mode",
+        "_default_locale",
+        "_locale",
+        "_currency",
+        "_enabled_features",
+    )
+
     def __init__(self, system_config_dto: SystemConfigDto):
         self._username = system_config_dto.username
         self._base_path = system_config_dto.base_path
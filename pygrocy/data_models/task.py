@@ -7,6 +7,8 @@ from pygrocy.grocy_api_client import TaskCategoryDto, TaskResponse
 
 
 class TaskCategory(DataModel):
+    __slots__ = ("_id", "_name", "_description", "_row_created_timestamp")
+
     def __init__(self, data: TaskCategoryDto):
         self._id = data.id
         self._name = data.name
@@ -31,50 +33,44 @@ class TaskCategory(DataModel):
 
 
 class Task(DataModel):
+    __slots__ = ("_response", "_category", "_assigned_to_user")
+
     def __init__(self, response: TaskResponse):
-        self._id = response.id
-        self._name = response.name
-        self._description = response.description
-        self._due_date = response.due_date
-        self._done = response.done
-        self._done_timestamp = response.done_timestamp
-        self._category_id = response.category_id
+        self._response = response
         self._category = None
         if response.category:
             self._category = TaskCategory(response.category)
-        self._assigned_to_user_id = response.assigned_to_user_id
         self._assigned_to_user = None
         if response.assigned_to_user:
             self._assigned_to_user = User(response.assigned_to_user)
-        self._userfields = response.userfields
 
     @property
     def id(self) -> int:
-        return self._id
+        return self._response.id
 
     @property
     def name(self) -> str:
-        return self._name
+        return self._response.name
 
     @property
     def description(self) -> str:
-        return self._description
+        return self._response.description
 
     @property
     def due_date(self) -> datetime.date:
-        return self._due_date
+        return self._response.due_date
 
     @property
     def done(self) -> int:
-        return self._done
+        return self._response.done
 
     @property
     def done_timestamp(self) -> datetime:
-        return self._done_timestamp
+        return self._response.done_timestamp
 
     @property
     def category_id(self) -> int:
-        return self._category_id
+        return self._response.category_id
 
     @property
     def category(self) -> TaskCategory:
@@ -82,7 +78,7 @@ class Task(DataModel):
 
     @property
     def assigned_to_user_id(self) -> int:
-        return self._assigned_to_user_id
+        return self._response.assigned_to_user_id
 
     @property
     def assigned_to_user(self) -> User:
@@ -90,4 +86,4 @@ class Task(DataModel):
 
     @property
     def userfields(self) -> Dict[str, str]:
-        return self._userfields
+        return self._response.userfields
@@ -3,6 +3,8 @@ from pygrocy.grocy_api_client import UserDto
 
 
 class User(DataModel):
+    __slots__ = ("_id", "_username", "_first_name", "_last_name", "_display_name")
+
     def __init__(self, user_dto: UserDto):
         self._id = user_dto.id
         self._username = user_dto.username
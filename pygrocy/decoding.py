@@ -0,0 +1,332 @@
+import threading
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel, Extra, ValidationError
+from pydantic.datetime_parse import parse_date, parse_datetime
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
+from pydantic.validators import bool_validator, float_validator, int_validator
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class DecodeMode(str, Enum):
+    VALIDATED = "validated"
+    TRUSTED = "trusted"
+    LAZY = "lazy"
+
+
+class _Fallback(Exception):
+    pass
+
+
+def _str(value: Any) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise _Fallback()
+
+
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    bool: bool_validator,
+    date: parse_date,
+    datetime: parse_datetime,
+    float: float_validator,
+    int: int_validator,
+    str: _str,
+}
+
+
+def _converter(model: Type[BaseModel], field: ModelField):
+    """Fast conversion for ``field``, or ``None`` to let pydantic validate it."""
+    if field.post_validators or any(
+        validator.each_item for validator in field.class_validators.values()
+    ):
+        return None
+    nested = field.type_
+    if isinstance(nested, type) and issubclass(nested, BaseModel):
+        # Looked up on use, so compiling never recurses into nested models.
+        if field.shape == SHAPE_SINGLETON:
+            return lambda value: _compiled(nested)(value)
+        if field.shape == SHAPE_LIST:
+            return lambda rows: [_compiled(nested)(row) for row in rows]
+        return None
+    config = model.__config__
+    string_constraints = (
+        config.anystr_strip_whitespace,
+        config.anystr_lower,
+        config.anystr_upper,
+        config.min_anystr_length,
+        config.max_anystr_length,
+    )
+    if field.shape != SHAPE_SINGLETON or any(string_constraints):
+        return None
+    return _CONVERTERS.get(field.type_)
+
+
+def _new_model(model: Type[M], values: Dict[str, Any], fields_set: set) -> M:
+    if model.__private_attributes__:
+        return model.construct(fields_set, **values)
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    return instance
+
+
+def _compile(model: Type[M]) -> Callable[[Dict[str, Any]], M]:
+    """Generate a decoding function specialised to ``model``'s fields.
+
+    The function inlines each field's alias lookup, default, pre-validators,
+    ``None`` handling and type conversion, runs the root validators and sets
+    the instance ``__dict__`` directly, like ``construct`` does.
+    """
+    config = model.__config__
+    namespace = {
+        "_MISSING": object(),
+        "_Fallback": _Fallback,
+        "_new_model": _new_model,
+        "model": model,
+        "config": config,
+        "keys": set(),
+        "pre_root_validators": list(model.__pre_root_validators__),
+        "post_root_validators": [
+            validator for _, validator in model.__post_root_validators__
+        ],
+    }
+    lines = ["def decode(data):", "    if data.__class__ is not dict:"]
+    lines.append("        raise _Fallback()")
+    if model.__pre_root_validators__:
+        lines.append("    data = dict(data)")
+        lines.append("    for validator in pre_root_validators:")
+        lines.append("        data = validator(model, data)")
+    lines.append("    values = {}")
+    lines.append("    fields_set = set()")
+
+    for index, field in enumerate(model.__fields__.values()):
+        namespace["keys"].add(field.alias)
+        if config.allow_population_by_field_name:
+            namespace["keys"].add(field.name)
+        namespace[f"field_{index}"] = field
+        namespace[f"default_{index}"] = field.get_default
+        name, alias = repr(field.name), repr(field.alias)
+        lines.append(f"    value = data.get({alias}, _MISSING)")
+        if config.allow_population_by_field_name and field.name != field.alias:
+            lines.append("    if value is _MISSING:")
+            lines.append(f"        value = data.get({name}, _MISSING)")
+        lines.append("    if value is _MISSING:")
+        if field.required:
+            lines.append("        raise _Fallback()")
+        else:
+            lines.append(f"        values[{name}] = default_{index}()")
+        lines.append("    else:")
+        lines.append(f"        fields_set.add({name})")
+
+        convert = _converter(model, field)
+        if convert is None:
+            lines.append(f"        value, errors = field_{index}.validate(")
+            lines.append(f"            value, values, loc={alias}, cls=model")
+            lines.append("        )")
+            lines.append("        if errors:")
+            lines.append("            raise _Fallback()")
+            lines.append(f"        values[{name}] = value")
+            continue
+
+        namespace[f"convert_{index}"] = convert
+        for position, validator in enumerate(field.pre_validators or ()):
+            namespace[f"pre_{index}_{position}"] = validator
+            lines.append(
+                f"        value = pre_{index}_{position}"
+                f"(model, value, values, field_{index}, config)"
+            )
+        lines.append("        if value is None:")
+        if field.allow_none:
+            lines.append(f"            values[{name}] = None")
+        else:
+            lines.append("            raise _Fallback()")
+        if field.type_ is str:
+            lines.append("        elif value.__class__ is str:")
+            lines.append(f"            values[{name}] = value")
+        lines.append("        else:")
+        lines.append(f"            values[{name}] = convert_{index}(value)")
+
+    if config.extra == Extra.allow:
+        # Same iteration order as pydantic, which also uses a set difference.
+        lines.append("    for key in data.keys() - keys:")
+        lines.append("        values[key] = data[key]")
+        lines.append("        fields_set.add(key)")
+    if model.__post_root_validators__:
+        lines.append("    for validator in post_root_validators:")
+        lines.append("        values = validator(model, values)")
+    lines.append("    return _new_model(model, values, fields_set)")
+
+    exec("\n".join(lines), namespace)
+    return namespace["decode"]
+
+
+_compiled_models: Dict[type, Callable[[Dict[str, Any]], BaseModel]] = {}
+_compile_lock = threading.Lock()
+
+
+def _compiled(model: Type[M]) -> Callable[[Dict[str, Any]], M]:
+    compiled = _compiled_models.get(model)
+    if compiled is None:
+        with _compile_lock:
+            compiled = _compiled_models.get(model)
+            if compiled is None:
+                compiled = _compile(model)
+                _compiled_models[model] = compiled
+    return compiled
+
+
+class _LazyField(object):
+    """Non-data descriptor: decodes a field on first access into ``__dict__``.
+
+    Later reads find the value in the instance ``__dict__`` and never reach
+    the descriptor again.
+    """
+
+    def __init__(self, field: ModelField, nested: Optional[type]):
+        self._field = field
+        self._nested = nested
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        value = instance._decode_field(self._field, self._nested)
+        instance.__dict__[self._field.name] = value
+        return value
+
+
+class _LazyModel(object):
+    """Mixin for lazy model classes; the raw row lives in the ``_raw`` slot."""
+
+    __slots__ = ()
+
+    def _decode_field(self, field: ModelField, nested: Optional[type]):
+        if field.alias not in self._raw:
+            return field.get_default()
+        value = self._raw[field.alias]
+        if nested is not None and value.__class__ is dict:
+            return _lazy(nested, value)
+        value, errors = field.validate(
+            value, self.__dict__, loc=field.alias, cls=self._model
+        )
+        if errors:
+            raise ValidationError([errors], self._model)
+        return value
+
+    def _materialize(self):
+        """Decode every remaining field, keeping ``__dict__`` in field order."""
+        values = self.__dict__
+        if len(values) < len(self.__fields__):
+            decoded = {name: getattr(self, name) for name in self.__fields__}
+            values.clear()
+            values.update(decoded)
+
+    def _iter(self, *args, **kwargs):
+        self._materialize()
+        return super()._iter(*args, **kwargs)
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __reduce__(self):
+        # Lazy classes are built at runtime, so pickle as the plain model.
+        self._materialize()
+        return _new_model, (self._model, dict(self.__dict__), set(self.__fields_set__))
+
+
+_lazy_classes: Dict[type, Optional[type]] = {}
+
+
+def _lazy_class(model: Type[M]) -> Optional[Type[M]]:
+    """Lazy subclass of ``model``, or ``None`` if it needs whole-row validation."""
+    if model in _lazy_classes:
+        return _lazy_classes[model]
+    lazy_class = None
+    config = model.__config__
+    whole_row = (
+        model.__pre_root_validators__,
+        model.__post_root_validators__,
+        model.__private_attributes__,
+        config.extra == Extra.allow,
+        config.allow_population_by_field_name,
+    )
+    if not any(whole_row):
+        lazy_class = type(model)(
+            f"Lazy{model.__name__}",
+            (_LazyModel, model),
+            {"__slots__": ("_raw",), "__module__": model.__module__},
+        )
+        lazy_class._model = model
+        lazy_class._aliases = {
+            field.alias: field.name for field in model.__fields__.values()
+        }
+        lazy_class._required = {
+            field.alias for field in model.__fields__.values() if field.required
+        }
+        for field in model.__fields__.values():
+            nested = field.type_
+            if field.shape != SHAPE_SINGLETON or field.pre_validators:
+                nested = None
+            elif not (isinstance(nested, type) and issubclass(nested, BaseModel)):
+                nested = None
+            type.__setattr__(lazy_class, field.name, _LazyField(field, nested))
+    with _compile_lock:
+        return _lazy_classes.setdefault(model, lazy_class)
+
+
+def _lazy(model: Type[M], data: Dict[str, Any]) -> M:
+    lazy_class = _lazy_class(model)
+    if lazy_class is None or data.__class__ is not dict:
+        return model(**data)
+    if not lazy_class._required <= data.keys():
+        return model(**data)
+    aliases = lazy_class._aliases
+    instance = lazy_class.__new__(lazy_class)
+    object.__setattr__(instance, "__dict__", {})
+    object.__setattr__(
+        instance, "__fields_set__", {aliases[alias] for alias in aliases & data.keys()}
+    )
+    object.__setattr__(instance, "_raw", data)
+    return instance
+
+
+def decode(model: Type[M], data: Dict[str, Any], mode: DecodeMode) -> M:
+    """Build ``model`` from a Grocy JSON object.
+
+    ``DecodeMode.TRUSTED`` skips pydantic's validation machinery and applies
+    a plan precompiled per model: the same aliases, defaults, pre and root
+    validators (such as empty string to ``None``) and type coercions, then
+    ``construct``. Anything the plan doesn't expect, including invalid data,
+    is decoded by pydantic instead, so errors are unchanged.
+
+    ``DecodeMode.LAZY`` returns an instance of a subclass of ``model`` that
+    keeps the raw row and validates each field with pydantic on first access,
+    caching the result. Invalid values raise ``ValidationError`` on access
+    rather than here. Models with root validators or extra fields are
+    decoded eagerly.
+    """
+    if mode == DecodeMode.LAZY:
+        return _lazy(model, data)
+    if mode == DecodeMode.TRUSTED:
+        try:
+            return _compiled(model)(data)
+        except (_Fallback, TypeError, ValueError):
+            pass
+    return model(**data)
+
+
+def decode_list(
+    model: Type[M], rows: Iterable[Dict[str, Any]], mode: DecodeMode
+) -> List[M]:
+    if mode == DecodeMode.LAZY:
+        return [_lazy(model, row) for row in rows]
+    if mode == DecodeMode.TRUSTED:
+        return [decode(model, row, mode) for row in rows]
+    return [model(**row) for row in rows]
@@ -0,0 +1,415 @@
+import contextvars
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from enum import Enum
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .base import DataModel
+from .data_models.battery import Battery
+from .data_models.chore import Chore
+from .data_models.generic import EntityType
+from .data_models.meal_items import MealPlanItem
+from .data_models.product import Product, ShoppingListProduct
+from .errors import DeadlineExceededError
+from .grocy_api_client import (
+    BatteryData,
+    BatteryDetailsResponse,
+    ChoreData,
+    ChoreDetailsResponse,
+    GrocyApiClient,
+    LocationData,
+    MealPlanSectionResponse,
+    ProductBarcodeData,
+    ProductData,
+    ProductDetailsResponse,
+    QuantityUnitData,
+    RecipeDetailsResponse,
+)
+from .query import QueryFilters
+from .utils import parse_int
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DETAIL_WORKERS = 4
+
+DetailErrorHandler = Callable[[DataModel, Exception], None]
+
+
+class DetailsMode(str, Enum):
+    PER_ITEM = "per_item"
+    JOIN = "join"
+
+
+def _log_detail_error(item: DataModel, error: Exception):
+    _LOGGER.warning("Fetching details for %r failed: %s", item, error)
+
+
+def _get_rows(
+    api_client: GrocyApiClient,
+    entity_type: EntityType,
+    query_filters: QueryFilters = None,
+) -> List[dict]:
+    return (
+        api_client.get_generic_objects_for_type(entity_type.value, query_filters) or []
+    )
+
+
+def _rows_by_id(rows: Iterable[dict], key: str = "id") -> Dict[int, dict]:
+    return {parse_int(row.get(key)): row for row in rows}
+
+
+def _group_rows(rows: Iterable[dict], key: str) -> Dict[int, List[dict]]:
+    groups = {}
+    for row in rows:
+        groups.setdefault(parse_int(row.get(key)), []).append(row)
+    return groups
+
+
+def _ids_filter(field: str, ids: Iterable[int]) -> str:
+    return f"{field}§^({'|'.join(str(parse_int(id)) for id in ids)})$"
+
+
+def _latest_tracked(rows: List[dict]) -> Optional[dict]:
+    return max(
+        rows,
+        key=lambda row: (row.get("tracked_time") or "", parse_int(row.get("id"), 0)),
+        default=None,
+    )
+
+
+def _join_chore_details(
+    current: Dict[int, Tuple[Optional[datetime], Optional[datetime]]],
+    api_client: GrocyApiClient,
+    by_id: bool = False,
+) -> Dict[int, ChoreDetailsResponse]:
+    """Build chore details from bulk tables.
+
+    ``current`` maps chore ids to their ``(last_tracked, next_estimated)``
+    times from the ``chores`` endpoint. Only the log rows of those chores
+    are fetched; with ``by_id`` also only their chore rows and the users
+    they reference.
+    """
+    chore_filters = [_ids_filter("id", current)] if by_id else []
+    log_filters = ["undone=0", _ids_filter("chore_id", current)]
+    chore_rows = _rows_by_id(
+        _get_rows(api_client, EntityType.CHORES, chore_filters or None)
+    )
+    log_rows = _group_rows(
+        _get_rows(api_client, EntityType.CHORES_LOG, log_filters),
+        "chore_id",
+    )
+    if by_id:
+        user_ids = {
+            parse_int(row.get("next_execution_assigned_to_user_id"))
+            for row in chore_rows.values()
+        }
+        user_ids.update(
+            parse_int(row.get("done_by_user_id"))
+            for rows in log_rows.values()
+            for row in rows
+        )
+        user_ids.discard(None)
+        users = {}
+        if user_ids:
+            users = {
+                user.id: user
+                for user in api_client.get_users([_ids_filter("id", user_ids)])
+            }
+    else:
+        users = {user.id: user for user in api_client.get_users()}
+
+    details = {}
+    for chore_id, (last_tracked, next_estimated) in current.items():
+        row = chore_rows.get(chore_id)
+        if row is None:
+            continue
+
+        chore_data = ChoreData(**row)
+        chore_log = log_rows.get(chore_id, [])
+        last_execution = _latest_tracked(chore_log)
+        last_done_by = None
+        if last_execution is not None:
+            last_done_by = users.get(parse_int(last_execution.get("done_by_user_id")))
+
+        details[chore_id] = ChoreDetailsResponse(
+            chore=chore_data,
+            last_tracked=last_tracked,
+            next_estimated_execution_time=next_estimated,
+            track_count=len(chore_log),
+            last_done_by=last_done_by,
+            next_execution_assigned_user=users.get(
+                chore_data.next_execution_assigned_to_user_id
+            ),
+        )
+    return details
+
+
+def _join_chores(chores: List[Chore], api_client: GrocyApiClient) -> List[Chore]:
+    details = _join_chore_details(
+        {
+            chore.id: (chore.last_tracked_time, chore.next_estimated_execution_time)
+            for chore in chores
+        },
+        api_client,
+    )
+
+    unjoined = []
+    for chore in chores:
+        if chore.id in details:
+            chore._init_from_ChoreDetailsResponse(details[chore.id])
+        else:
+            unjoined.append(chore)
+    return unjoined
+
+
+def _join_battery_details(
+    current: Dict[int, Tuple[Optional[datetime], Optional[datetime]]],
+    api_client: GrocyApiClient,
+    by_id: bool = False,
+) -> Dict[int, BatteryDetailsResponse]:
+    """Build battery details from bulk tables.
+
+    ``current`` maps battery ids to their ``(last_tracked, next_estimated)``
+    times from the ``batteries`` endpoint. Only the charge cycles of those
+    batteries are fetched; with ``by_id`` also only their battery rows.
+    """
+    battery_filters = [_ids_filter("id", current)] if by_id else []
+    cycle_filters = ["undone=0", _ids_filter("battery_id", current)]
+    battery_rows = _rows_by_id(
+        _get_rows(api_client, EntityType.BATTERIES, battery_filters or None)
+    )
+    charge_cycles = _group_rows(
+        _get_rows(api_client, EntityType.BATTERY_CHARGE_CYCLES, cycle_filters),
+        "battery_id",
+    )
+
+    details = {}
+    for battery_id, (last_tracked, next_estimated) in current.items():
+        row = battery_rows.get(battery_id)
+        if row is None:
+            continue
+
+        cycles = charge_cycles.get(battery_id, [])
+        last_charge = _latest_tracked(cycles)
+        details[battery_id] = BatteryDetailsResponse(
+            battery=BatteryData(**row),
+            charge_cycles_count=len(cycles),
+            last_charged=last_charge.get("tracked_time") if last_charge else None,
+            last_tracked_time=last_tracked,
+            next_estimated_charge_time=next_estimated,
+        )
+    return details
+
+
+def _join_batteries(
+    batteries: List[Battery], api_client: GrocyApiClient
+) -> List[Battery]:
+    details = _join_battery_details(
+        {
+            battery.id: (battery.last_tracked_time, battery.next_estimated_charge_time)
+            for battery in batteries
+        },
+        api_client,
+    )
+
+    unjoined = []
+    for battery in batteries:
+        if battery.id in details:
+            battery._init_from_BatteryDetailsResponse(details[battery.id])
+        else:
+            unjoined.append(battery)
+    return unjoined
+
+
+def _join_product_details(
+    product_ids: Iterable[int], api_client: GrocyApiClient
+) -> Dict[int, ProductDetailsResponse]:
+    """Build product details from bulk tables.
+
+    ``last_purchased``, ``last_used`` and ``last_price`` are not carried by the
+    bulk tables and stay empty; none of the data models expose them.
+    """
+    product_ids = set(product_ids)
+    product_rows = _rows_by_id(_get_rows(api_client, EntityType.PRODUCTS))
+    barcodes = _group_rows(
+        _get_rows(api_client, EntityType.PRODUCT_BARCODES), "product_id"
+    )
+    quantity_units = _rows_by_id(_get_rows(api_client, EntityType.QUANTITY_UNITS))
+    locations = _rows_by_id(_get_rows(api_client, EntityType.LOCATIONS))
+    stock = {entry.product_id: entry for entry in api_client.get_stock()}
+
+    details = {}
+    for product_id in product_ids:
+        row = product_rows.get(product_id)
+        if row is None:
+            continue
+
+        product = ProductData(**row)
+        stock_entry = stock.get(product_id)
+        location = locations.get(product.location_id)
+        details[product_id] = ProductDetailsResponse(
+            product=product,
+            stock_amount=stock_entry.amount if stock_entry else 0,
+            stock_amount_opened=stock_entry.amount_opened if stock_entry else 0,
+            next_best_before_date=stock_entry.best_before_date if stock_entry else None,
+            quantity_unit_stock=QuantityUnitData(**quantity_units[product.qu_id_stock]),
+            default_quantity_unit_purchase=QuantityUnitData(
+                **quantity_units[product.qu_id_purchase]
+            ),
+            product_barcodes=[
+                ProductBarcodeData(**barcode)
+                for barcode in barcodes.get(product_id, [])
+            ],
+            location=LocationData(**location) if location else None,
+        )
+    return details
+
+
+def _join_products(products: List[Product], api_client: GrocyApiClient):
+    details = _join_product_details((product.id for product in products), api_client)
+
+    unjoined = []
+    for product in products:
+        if product.id in details:
+            product._update_from_ProductDetailsResponse(details[product.id])
+        else:
+            unjoined.append(product)
+    return unjoined
+
+
+def _join_shopping_list(
+    items: List[ShoppingListProduct], api_client: GrocyApiClient
+) -> List[ShoppingListProduct]:
+    items = [item for item in items if item.product_id]
+    if not items:
+        return []
+    details = _join_product_details((item.product_id for item in items), api_client)
+
+    unjoined = []
+    for item in items:
+        if item.product_id in details:
+            item._init_product(details[item.product_id])
+        else:
+            unjoined.append(item)
+    return unjoined
+
+
+def _join_meal_plan(
+    items: List[MealPlanItem], api_client: GrocyApiClient
+) -> List[MealPlanItem]:
+    recipes = {}
+    if any(item.recipe_id for item in items):
+        recipes = _rows_by_id(_get_rows(api_client, EntityType.RECIPES))
+    sections = {}
+    if any(item.section_id for item in items):
+        sections = _rows_by_id(_get_rows(api_client, EntityType.MEAL_PLAN_SECTIONS))
+
+    unjoined = []
+    for item in items:
+        recipe = recipes.get(item.recipe_id)
+        section = sections.get(item.section_id)
+        if (item.recipe_id and recipe is None) or (item.section_id and section is None):
+            unjoined.append(item)
+            continue
+
+        item._init_details(
+            RecipeDetailsResponse(**recipe) if recipe else None,
+            MealPlanSectionResponse(**section) if section else None,
+        )
+    return unjoined
+
+
+_JOINS = {
+    Battery: _join_batteries,
+    Chore: _join_chores,
+    MealPlanItem: _join_meal_plan,
+    Product: _join_products,
+    ShoppingListProduct: _join_shopping_list,
+}
+
+
+class DetailsFetcher(object):
+    """Runs ``get_details`` for a list of data models on a bounded thread pool.
+
+    Items are updated in place, so the order of the list is kept. A failing
+    item is passed to ``error_handler`` and keeps its summary fields instead
+    of aborting the whole list.
+
+    In ``DetailsMode.JOIN`` the details are joined locally from one bulk
+    ``objects/<entity>`` fetch per entity type. Items missing from the bulk
+    tables, or all items if a bulk table can't be fetched, fall back to
+    per-item ``get_details`` calls.
+
+    A ``DeadlineExceededError`` is never handed to ``error_handler``; it
+    cancels the remaining items and is raised to the caller.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_DETAIL_WORKERS,
+        error_handler: Optional[DetailErrorHandler] = None,
+        mode: DetailsMode = DetailsMode.PER_ITEM,
+    ):
+        self._max_workers = max(1, max_workers)
+        self._error_handler = error_handler or _log_detail_error
+        self._mode = mode
+        self._executor = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="pygrocy-details"
+            )
+        return self._executor
+
+    @property
+    def mode(self) -> DetailsMode:
+        return self._mode
+
+    def fetch(self, items: List[DataModel], api_client: GrocyApiClient):
+        join = _JOINS.get(type(items[0])) if items else None
+        if self._mode == DetailsMode.JOIN and join is not None:
+            try:
+                items = join(items, api_client)
+            except DeadlineExceededError:
+                raise
+            except Exception as error:
+                _LOGGER.debug("Joining details failed, fetching per item: %s", error)
+        self._fetch_each(items, api_client)
+
+    def _fetch_each(self, items: List[DataModel], api_client: GrocyApiClient):
+        if self._max_workers == 1 or len(items) <= 1:
+            for item in items:
+                try:
+                    item.get_details(api_client)
+                except DeadlineExceededError:
+                    raise
+                except Exception as error:
+                    self._error_handler(item, error)
+            return
+
+        executor = self._get_executor()
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run, item.get_details, api_client
+            )
+            for item in items
+        ]
+        for item, future in zip(items, futures):
+            error = future.exception()
+            if isinstance(error, DeadlineExceededError):
+                for pending in futures:
+                    pending.cancel()
+                raise error
+            if error is not None:
+                self._error_handler(item, error)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,139 @@
+import hashlib
+import json
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+from pydantic import BaseModel
+
+from .base import DataModel
+
+RowKey = Union[str, Callable[[Any], Hashable]]
+
+
+def _fields(row: Any) -> Dict[str, Any]:
+    if isinstance(row, dict):
+        return row
+    if isinstance(row, DataModel):
+        return row.as_dict()
+    if isinstance(row, BaseModel):
+        return row.dict()
+    return vars(row)
+
+
+def _content_hash(fields: Dict[str, Any]) -> str:
+    encoded = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+class RowChange(object):
+    def __init__(self, key: Hashable, old: Any, new: Any, fields: Dict[str, Tuple]):
+        self._key = key
+        self._old = old
+        self._new = new
+        self._fields = fields
+
+    @property
+    def key(self) -> Hashable:
+        return self._key
+
+    @property
+    def old(self) -> Any:
+        return self._old
+
+    @property
+    def new(self) -> Any:
+        return self._new
+
+    @property
+    def fields(self) -> Dict[str, Tuple[Any, Any]]:
+        """Changed fields mapped to ``(old, new)`` values."""
+        return self._fields
+
+    def __repr__(self) -> str:
+        return f"RowChange({self._key!r}, {self._fields!r})"
+
+
+class SnapshotDiff(object):
+    def __init__(self, added: List, removed: List, changed: List[RowChange]):
+        self._added = added
+        self._removed = removed
+        self._changed = changed
+
+    @property
+    def added(self) -> List[Any]:
+        return self._added
+
+    @property
+    def removed(self) -> List[Any]:
+        return self._removed
+
+    @property
+    def changed(self) -> List[RowChange]:
+        return self._changed
+
+    def __bool__(self) -> bool:
+        return bool(self._added or self._removed or self._changed)
+
+    def __repr__(self) -> str:
+        return (
+            f"SnapshotDiff(added={len(self._added)}, removed={len(self._removed)}, "
+            f"changed={len(self._changed)})"
+        )
+
+
+class SnapshotDiffer(object):
+    """Diffs successive snapshots of one dataset by row key in linear time.
+
+    Rows can be data models, pydantic responses or raw dicts. Each row is
+    reduced to its fields and a content hash; only rows whose hash differs
+    from the previous snapshot are compared field by field. The previous
+    snapshot's hashes are kept, so each ``update`` only hashes the new rows.
+    """
+
+    def __init__(self, key: RowKey = "id"):
+        self._key = key
+        self._index: Dict[Hashable, Tuple[str, Dict[str, Any], Any]] = {}
+
+    def _build_index(self, rows: Iterable[Any]):
+        index = {}
+        key_function = self._key if callable(self._key) else None
+        for row in rows:
+            fields = _fields(row)
+            if key_function is None:
+                key = fields.get(self._key)
+            else:
+                key = key_function(row)
+            if key in index:
+                raise ValueError(f"Duplicate row key {key!r}")
+            index[key] = (_content_hash(fields), fields, row)
+        return index
+
+    def update(self, rows: Iterable[Any]) -> SnapshotDiff:
+        """Record ``rows`` as the current snapshot and return what changed."""
+        previous = self._index
+        current = self._build_index(rows)
+
+        added = []
+        changed = []
+        for key, (content_hash, fields, row) in current.items():
+            old = previous.get(key)
+            if old is None:
+                added.append(row)
+            elif old[0] != content_hash:
+                old_fields = old[1]
+                changes = {
+                    name: (old_fields.get(name), fields.get(name))
+                    for name in old_fields.keys() | fields.keys()
+                    if old_fields.get(name) != fields.get(name)
+                }
+                changed.append(RowChange(key, old[2], row, changes))
+        removed = [row for key, (_, _, row) in previous.items() if key not in current]
+
+        self._index = current
+        return SnapshotDiff(added, removed, changed)
+
+
+def diff_snapshots(old: Iterable[Any], new: Iterable[Any], key: RowKey = "id"):
+    """Compare two snapshots of the same dataset by row key."""
+    differ = SnapshotDiffer(key)
+    differ.update(old)
+    return differ.update(new)
@@ -1 +1,3 @@
+from .circuit_open_error import CircuitOpenError  # noqa: F401
+from .deadline_exceeded_error import DeadlineExceededError  # noqa: F401
 from .grocy_error import GrocyError  # noqa: F401
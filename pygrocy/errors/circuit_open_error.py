@@ -0,0 +1,10 @@
+class CircuitOpenError(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Grocy circuit breaker is open, retry in {retry_after:.1f} seconds"
+        )
+        self._retry_after = retry_after
+
+    @property
+    def retry_after(self) -> float:
+        return self._retry_after
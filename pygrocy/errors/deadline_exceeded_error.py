@@ -0,0 +1,11 @@
+from requests.exceptions import Timeout
+
+
+class DeadlineExceededError(Timeout):
+    def __init__(self, budget: float):
+        super().__init__(f"Grocy request deadline of {budget:.1f} seconds exceeded")
+        self._budget = budget
+
+    @property
+    def budget(self) -> float:
+        return self._budget
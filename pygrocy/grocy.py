@@ -1,18 +1,27 @@
 import logging
+import time
 from datetime import datetime
-from typing import List
+from typing import Iterator, List, Optional
 
 import deprecation
 
 from .base import DataModel  # noqa: F401
+from .cache import EntityCache, ResponseCache
 from .data_models.battery import Battery
 from .data_models.chore import Chore
 from .data_models.generic import EntityType
 from .data_models.meal_items import MealPlanItem, MealPlanSection, RecipeItem
-from .data_models.product import Group, Product, ShoppingListProduct
+from .data_models.product import Group, Product, ShoppingListProduct, VolatileStock
 from .data_models.system import SystemConfig, SystemInfo, SystemTime
 from .data_models.task import Task
 from .data_models.user import User  # noqa: F401
+from .decoding import DecodeMode
+from .details import (
+    DEFAULT_DETAIL_WORKERS,
+    DetailErrorHandler,
+    DetailsFetcher,
+    DetailsMode,
+)
 from .errors import GrocyError  # noqa: F401
 from .grocy_api_client import ChoreDetailsResponse  # noqa: F401
 from .grocy_api_client import CurrentChoreResponse  # noqa: F401
@@ -25,7 +34,21 @@ from .grocy_api_client import RecipeDetailsResponse  # noqa: F401
 from .grocy_api_client import ShoppingListItem  # noqa: F401
 from .grocy_api_client import TaskResponse  # noqa: F401
 from .grocy_api_client import UserDto  # noqa: F401
-from .grocy_api_client import DEFAULT_PORT_NUMBER, GrocyApiClient, TransactionType
+from .grocy_api_client import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_PORT_NUMBER,
+    CurrentVolatilStockResponse,
+    GrocyApiClient,
+    TransactionType,
+)
+from .mirror import GrocyMirror
+from .pagination import DEFAULT_PAGE_SIZE, Paginator
+from .query import QueryFilters
+from .resilience import CircuitBreaker, RetryPolicy
+from .singleflight import SingleFlight
+from .timeouts import RequestTimeouts
+from .watcher import DEFAULT_MAX_INTERVAL, DEFAULT_MIN_INTERVAL, ChangeWatcher
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
@@ -40,57 +63,137 @@ class Grocy(object):
         path: str = None,
         verify_ssl=True,
         debug=False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: float = None,
+        detail_workers: int = DEFAULT_DETAIL_WORKERS,
+        detail_error_handler: DetailErrorHandler = None,
+        details_mode: DetailsMode = DetailsMode.PER_ITEM,
+        volatile_stock_ttl: float = 0,
+        response_cache: ResponseCache = None,
+        entity_cache: EntityCache = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        timeouts: RequestTimeouts = None,
+        local_queries: bool = False,
+        mirror: GrocyMirror = None,
+        coalesce_requests: bool = True,
+        batch_window: float = None,
+        decode_mode: DecodeMode = DecodeMode.VALIDATED,
     ):
         self._api_client = GrocyApiClient(
-            base_url, api_key, port, path, verify_ssl, debug
+            base_url,
+            api_key,
+            port,
+            path,
+            verify_ssl,
+            debug,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_idle_timeout=pool_idle_timeout,
+            response_cache=response_cache,
+            entity_cache=entity_cache,
+            retry_policy=retry_policy,
+            circuit_breaker=circuit_breaker,
+            timeouts=timeouts,
+            local_queries=local_queries,
+            mirror=mirror,
+            coalesce_requests=coalesce_requests,
+            batch_window=batch_window,
+            decode_mode=decode_mode,
         )
+        self._details_fetcher = DetailsFetcher(
+            detail_workers, detail_error_handler, details_mode
+        )
+        self._volatile_stock_ttl = volatile_stock_ttl
+        self._volatile_stock_memo = None
 
         if debug:
             _LOGGER.setLevel(logging.DEBUG)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        self._details_fetcher.close()
+        self._api_client.close()
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        """Counters of coalesced GET requests, ``None`` if coalescing is off."""
+        return self._api_client.single_flight
+
     def stock(self) -> List[Product]:
         raw_stock = self._api_client.get_stock()
         stock = [Product(resp) for resp in raw_stock]
         return stock
 
+    def iter_stock(self) -> Iterator[Product]:
+        for resp in self._api_client.iter_stock():
+            yield Product(resp)
+
     @deprecation.deprecated(details="Use due_products instead")
     def expiring_products(self, get_details: bool = False) -> List[Product]:
         return self.due_products(get_details)
 
+    def _get_volatile_stock(self, use_memo: bool = True) -> CurrentVolatilStockResponse:
+        memo = self._volatile_stock_memo
+        if use_memo and memo is not None:
+            fetched_at, response = memo
+            if time.monotonic() - fetched_at < self._volatile_stock_ttl:
+                return response
+
+        response = self._api_client.get_volatile_stock()
+        if self._volatile_stock_ttl > 0:
+            self._volatile_stock_memo = (time.monotonic(), response)
+        return response
+
+    def volatile_stock(self, get_details: bool = False) -> VolatileStock:
+        volatile_stock = VolatileStock(self._get_volatile_stock(use_memo=False))
+
+        if get_details:
+            products = [
+                *volatile_stock.due_products,
+                *volatile_stock.overdue_products,
+                *volatile_stock.expired_products,
+                *volatile_stock.missing_products,
+            ]
+            self._details_fetcher.fetch(products, self._api_client)
+        return volatile_stock
+
     def due_products(self, get_details: bool = False) -> List[Product]:
-        raw_due_products = self._api_client.get_volatile_stock().due_products
+        raw_due_products = self._get_volatile_stock().due_products
         due_products = [Product(resp) for resp in raw_due_products]
 
         if get_details:
-            for item in due_products:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(due_products, self._api_client)
         return due_products
 
     def overdue_products(self, get_details: bool = False) -> List[Product]:
-        raw_overdue_products = self._api_client.get_volatile_stock().overdue_products
+        raw_overdue_products = self._get_volatile_stock().overdue_products
         overdue_products = [Product(resp) for resp in raw_overdue_products]
 
         if get_details:
-            for item in overdue_products:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(overdue_products, self._api_client)
         return overdue_products
 
     def expired_products(self, get_details: bool = False) -> List[Product]:
-        raw_expired_products = self._api_client.get_volatile_stock().expired_products
+        raw_expired_products = self._get_volatile_stock().expired_products
         expired_products = [Product(resp) for resp in raw_expired_products]
 
         if get_details:
-            for item in expired_products:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(expired_products, self._api_client)
         return expired_products
 
     def missing_products(self, get_details: bool = False) -> List[Product]:
-        raw_missing_products = self._api_client.get_volatile_stock().missing_products
+        raw_missing_products = self._get_volatile_stock().missing_products
         missing_products = [Product(resp) for resp in raw_missing_products]
 
         if get_details:
-            for item in missing_products:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(missing_products, self._api_client)
         return missing_products
 
     def product(self, product_id: int) -> Product:
@@ -111,14 +214,13 @@ class Grocy(object):
         return [Product(product) for product in product_datas]
 
     def chores(
-        self, get_details: bool = False, query_filters: List[str] = None
+        self, get_details: bool = False, query_filters: QueryFilters = None
     ) -> List[Chore]:
         raw_chores = self._api_client.get_chores(query_filters)
         chores = [Chore(chore) for chore in raw_chores]
 
         if get_details:
-            for chore in chores:
-                chore.get_details(self._api_client)
+            self._details_fetcher.fetch(chores, self._api_client)
         return chores
 
     def execute_chore(
@@ -252,16 +354,36 @@ class Grocy(object):
         return product
 
     def shopping_list(
-        self, get_details: bool = False, query_filters: List[str] = None
+        self, get_details: bool = False, query_filters: QueryFilters = None
     ) -> List[ShoppingListProduct]:
         raw_shoppinglist = self._api_client.get_shopping_list(query_filters)
         shopping_list = [ShoppingListProduct(resp) for resp in raw_shoppinglist]
 
         if get_details:
-            for item in shopping_list:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(shopping_list, self._api_client)
         return shopping_list
 
+    def iter_shopping_list(
+        self, query_filters: QueryFilters = None
+    ) -> Iterator[ShoppingListProduct]:
+        for resp in self._api_client.iter_shopping_list(query_filters):
+            yield ShoppingListProduct(resp)
+
+    def paginate_shopping_list(
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Paginator[ShoppingListProduct]:
+        def fetch_page(limit: int, offset: int):
+            raw_items = self._api_client.get_shopping_list(
+                query_filters, order, limit, offset
+            )
+            return [ShoppingListProduct(resp) for resp in raw_items]
+
+        return Paginator(fetch_page, page_size, prefetch)
+
     def add_missing_product_to_shopping_list(self, shopping_list_id: int = 1):
         return self._api_client.add_missing_product_to_shopping_list(shopping_list_id)
 
@@ -286,7 +408,7 @@ class Grocy(object):
             product_id, shopping_list_id, amount
         )
 
-    def product_groups(self, query_filters: List[str] = None) -> List[Group]:
+    def product_groups(self, query_filters: QueryFilters = None) -> List[Group]:
         raw_groups = self._api_client.get_product_groups(query_filters)
         return [Group(resp) for resp in raw_groups]
 
@@ -300,9 +422,22 @@ class Grocy(object):
     def set_userfields(self, entity: str, object_id: int, key: str, value):
         return self._api_client.set_userfields(entity, object_id, key, value)
 
+    def sync_mirror(self, force: bool = False) -> List[str]:
+        mirror = self._api_client.mirror
+        if mirror is None:
+            raise ValueError("Grocy was created without a mirror")
+        return mirror.sync(self._api_client, force)
+
     def get_last_db_changed(self):
         return self._api_client.get_last_db_changed()
 
+    def watch(
+        self,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+    ) -> ChangeWatcher:
+        return ChangeWatcher(self, min_interval, max_interval)
+
     def get_system_info(self) -> SystemInfo:
         raw_system_info = self._api_client.get_system_info()
         if raw_system_info:
@@ -318,10 +453,23 @@ class Grocy(object):
         if raw_system_config:
             return SystemConfig(raw_system_config)
 
-    def tasks(self, query_filters: List[str] = None) -> List[Task]:
+    def tasks(self, query_filters: QueryFilters = None) -> List[Task]:
         raw_tasks = self._api_client.get_tasks(query_filters)
         return [Task(task) for task in raw_tasks]
 
+    def paginate_tasks(
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Paginator[Task]:
+        def fetch_page(limit: int, offset: int):
+            raw_tasks = self._api_client.get_tasks(query_filters, order, limit, offset)
+            return [Task(task) for task in raw_tasks]
+
+        return Paginator(fetch_page, page_size, prefetch)
+
     def task(self, task_id: int) -> Task:
         resp = self._api_client.get_task(task_id)
         return Task(resp)
@@ -330,30 +478,43 @@ class Grocy(object):
         return self._api_client.complete_task(task_id, done_time)
 
     def meal_plan(
-        self, get_details: bool = False, query_filters: List[str] = None
+        self, get_details: bool = False, query_filters: QueryFilters = None
     ) -> List[MealPlanItem]:
         raw_meal_plan = self._api_client.get_meal_plan(query_filters)
         meal_plan = [MealPlanItem(data) for data in raw_meal_plan]
 
         if get_details:
-            for item in meal_plan:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(meal_plan, self._api_client)
         return meal_plan
 
+    def paginate_meal_plan(
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Paginator[MealPlanItem]:
+        def fetch_page(limit: int, offset: int):
+            raw_meal_plan = self._api_client.get_meal_plan(
+                query_filters, order, limit, offset
+            )
+            return [MealPlanItem(data) for data in raw_meal_plan]
+
+        return Paginator(fetch_page, page_size, prefetch)
+
     def recipe(self, recipe_id: int) -> RecipeItem:
         recipe = self._api_client.get_recipe(recipe_id)
         if recipe:
             return RecipeItem(recipe)
 
     def batteries(
-        self, query_filters: List[str] = None, get_details: bool = False
+        self, query_filters: QueryFilters = None, get_details: bool = False
     ) -> List[Battery]:
         raw_batteries = self._api_client.get_batteries(query_filters)
         batteries = [Battery(bat) for bat in raw_batteries]
 
         if get_details:
-            for item in batteries:
-                item.get_details(self._api_client)
+            self._details_fetcher.fetch(batteries, self._api_client)
         return batteries
 
     def battery(self, battery_id: int) -> Battery:
@@ -376,14 +537,36 @@ class Grocy(object):
         return self._api_client.delete_generic(entity_type.value, object_id)
 
     def get_generic_objects_for_type(
-        self, entity_type: EntityType, query_filters: List[str] = None
+        self, entity_type: EntityType, query_filters: QueryFilters = None
     ):
         return self._api_client.get_generic_objects_for_type(
             entity_type.value, query_filters
         )
 
+    def paginate_generic_objects(
+        self,
+        entity_type: EntityType,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ) -> Paginator[dict]:
+        def fetch_page(limit: int, offset: int):
+            return self._api_client.get_generic_objects_for_type(
+                entity_type, query_filters, order, limit, offset
+            )
+
+        return Paginator(fetch_page, page_size, prefetch)
+
+    def iter_generic_objects(
+        self, entity_type: EntityType, query_filters: QueryFilters = None
+    ) -> Iterator[dict]:
+        return self._api_client.iter_generic_objects_for_type(
+            entity_type, query_filters
+        )
+
     def meal_plan_sections(
-        self, query_filters: List[str] = None
+        self, query_filters: QueryFilters = None
     ) -> List[MealPlanSection]:
         raw_sections = self._api_client.get_meal_plan_sections(query_filters)
         return [MealPlanSection(section) for section in raw_sections]
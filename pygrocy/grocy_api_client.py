@@ -1,21 +1,35 @@
 import base64
 import json
 import logging
+import sys
+import time
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from urllib.parse import urljoin
 
 import requests
 from pydantic import BaseModel, Extra, Field, root_validator, validator
 from pydantic.schema import date
+from requests.adapters import HTTPAdapter
 
 from pygrocy import EntityType
+from pygrocy.cache import MISSING, EntityCache, ResponseCache
+from pygrocy.decoding import DecodeMode, decode, decode_list
+from pygrocy.mirror import GrocyMirror
+from pygrocy.query import Query, QueryFilters, normalize_query
+from pygrocy.query_engine import LocalTable
+from pygrocy.resilience import CircuitBreaker, RetryPolicy
+from pygrocy.singleflight import SingleFlight
+from pygrocy.streaming import DEFAULT_CHUNK_SIZE, iter_json_array
+from pygrocy.timeouts import RequestTimeouts, current_deadline
 from pygrocy.utils import grocy_datetime_str, localize_datetime, parse_date
 
-from .errors import GrocyError
+from .errors import DeadlineExceededError, GrocyError
 
 DEFAULT_PORT_NUMBER = 9192
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.setLevel(logging.INFO)
@@ -32,6 +46,17 @@ def _none_if_empty_str(value: Any):
     return value
 
 
+def _interned_str_validator(*field_names: str):
+    """Reusable Pydantic field pre-validator to intern low-cardinality strings."""
+    return validator(*field_names, allow_reuse=True, pre=True)(_intern_str)
+
+
+def _intern_str(value: Any):
+    if value.__class__ is str:
+        return sys.intern(value)
+    return value
+
+
 class ShoppingListItem(BaseModel):
     id: int
     product_id: Optional[int] = None
@@ -56,6 +81,8 @@ class MealPlanResponse(BaseModel):
     userfields: Optional[Dict] = None
     section_id: Optional[int] = None
 
+    interned_str_validator = _interned_str_validator("type", "product_qu_id")
+
 
 class RecipeDetailsResponse(BaseModel):
     id: Optional[int] = None
@@ -75,6 +102,8 @@ class QuantityUnitData(BaseModel):
     description: Optional[str] = None
     row_created_timestamp: datetime
 
+    interned_str_validator = _interned_str_validator("name", "name_plural")
+
 
 class LocationData(BaseModel):
     id: int
@@ -82,6 +111,8 @@ class LocationData(BaseModel):
     description: Optional[str] = None
     row_created_timestamp: datetime
 
+    interned_str_validator = _interned_str_validator("name")
+
 
 class ProductData(BaseModel):
     id: int
@@ -118,6 +149,9 @@ class ChoreData(BaseModel):
     next_execution_assigned_to_user_id_validator = _field_not_empty_validator(
         "next_execution_assigned_to_user_id"
     )
+    interned_str_validator = _interned_str_validator(
+        "period_type", "period_config", "assignment_type"
+    )
 
 
 class UserDto(BaseModel):
@@ -127,6 +161,10 @@ class UserDto(BaseModel):
     last_name: Optional[str] = None
     display_name: Optional[str] = None
 
+    interned_str_validator = _interned_str_validator(
+        "username", "first_name", "last_name", "display_name"
+    )
+
 
 class CurrentChoreResponse(BaseModel):
     chore_id: int
@@ -200,6 +238,8 @@ class TaskCategoryDto(BaseModel):
     description: Optional[str] = None
     row_created_timestamp: datetime
 
+    interned_str_validator = _interned_str_validator("name")
+
 
 class TaskResponse(BaseModel):
     id: int
@@ -234,6 +274,8 @@ class BatteryData(BaseModel):
     created_timestamp: datetime = Field(alias="row_created_timestamp")
     userfields: Optional[Dict] = None
 
+    interned_str_validator = _interned_str_validator("used_in")
+
 
 class BatteryDetailsResponse(BaseModel):
     battery: BatteryData
@@ -316,6 +358,49 @@ def _enable_debug_mode():
     _LOGGER.setLevel(logging.DEBUG)
 
 
+def _entity_type_value(entity_type) -> str:
+    if isinstance(entity_type, EntityType):
+        return entity_type.value
+    return entity_type
+
+
+def _build_base_url(base_url, port: int, path: str = None) -> str:
+    if path:
+        return "{}:{}/{}/api/".format(base_url, port, path)
+    return "{}:{}/api/".format(base_url, port)
+
+
+def _params_key(params: Optional[Dict[str, Any]]) -> tuple:
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in sorted((params or {}).items())
+    )
+
+
+def _build_params(
+    query_filters: QueryFilters = None,
+    order: str = None,
+    limit: int = None,
+    offset=None,
+) -> Optional[Dict[str, Any]]:
+    params = {}
+    if query_filters:
+        params["query[]"] = query_filters
+    if order:
+        params["order"] = order
+    if limit is not None:
+        params["limit"] = limit
+    if offset:
+        params["offset"] = offset
+    return params or None
+
+
+def _build_headers(api_key) -> Dict[str, str]:
+    if api_key == "demo_mode":
+        return {"accept": "application/json"}
+    return {"accept": "application/json", "GROCY-API-KEY": api_key}
+
+
 class GrocyApiClient(object):
     def __init__(
         self,
@@ -325,32 +410,270 @@ class GrocyApiClient(object):
         path: str = None,
         verify_ssl=True,
         debug=False,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_idle_timeout: float = None,
+        response_cache: ResponseCache = None,
+        entity_cache: EntityCache = None,
+        retry_policy: RetryPolicy = None,
+        circuit_breaker: CircuitBreaker = None,
+        timeouts: RequestTimeouts = None,
+        local_queries: bool = False,
+        mirror: GrocyMirror = None,
+        coalesce_requests: bool = True,
+        batch_window: float = None,
+        decode_mode: DecodeMode = DecodeMode.VALIDATED,
     ):
         if debug:
             _enable_debug_mode()
 
-        if path:
-            self._base_url = "{}:{}/{}/api/".format(base_url, port, path)
-        else:
-            self._base_url = "{}:{}/api/".format(base_url, port)
+        self._base_url = _build_base_url(base_url, port, path)
         _LOGGER.debug(f"generated base url: {self._base_url}")
 
         self._api_key = api_key
         self._verify_ssl = verify_ssl
-        if self._api_key == "demo_mode":
-            self._headers = {"accept": "application/json"}
-        else:
-            self._headers = {"accept": "application/json", "GROCY-API-KEY": api_key}
+        self._headers = _build_headers(api_key)
+
+        self._pool_idle_timeout = pool_idle_timeout
+        self._last_request_time = None
+        self._session = requests.Session()
+        for prefix in ("http://", "https://"):
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections, pool_maxsize=pool_maxsize
+            )
+            self._session.mount(prefix, adapter)
+
+        self._response_cache = response_cache
+        self._entity_cache = entity_cache
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
+        self._timeouts = timeouts or RequestTimeouts()
+        self._local_queries = local_queries
+        self._local_tables = {}
+        self._mirror = mirror
+        self._single_flight = SingleFlight() if coalesce_requests else None
+        self._decode_mode = DecodeMode(decode_mode)
+        self._id_batcher = None
+        if batch_window is not None:
+            from pygrocy.batching import IdBatcher
+
+            self._id_batcher = IdBatcher(
+                self,
+                {
+                    "chore": self._fetch_chore,
+                    "battery": self._fetch_battery,
+                    "recipe": self._fetch_recipe,
+                    "meal_plan_section": self._fetch_meal_plan_section,
+                },
+                window=batch_window,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close all pooled connections held by this client."""
+        self._session.close()
+
+    def _evict_idle_connections(self):
+        now = time.monotonic()
+        last_request_time, self._last_request_time = self._last_request_time, now
+        if self._pool_idle_timeout is None or last_request_time is None:
+            return
+
+        if now - last_request_time > self._pool_idle_timeout:
+            _LOGGER.debug("evicting idle pooled connections")
+            for adapter in self._session.adapters.values():
+                adapter.close()
 
-    def _do_get_request(self, end_url: str, query_filters: List[str] = None):
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self._response_cache
+
+    @property
+    def entity_cache(self) -> Optional[EntityCache]:
+        return self._entity_cache
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self._circuit_breaker
+
+    @property
+    def timeouts(self) -> RequestTimeouts:
+        return self._timeouts
+
+    @property
+    def mirror(self) -> Optional[GrocyMirror]:
+        return self._mirror
+
+    @property
+    def decode_mode(self) -> DecodeMode:
+        return self._decode_mode
+
+    @property
+    def single_flight(self) -> Optional[SingleFlight]:
+        return self._single_flight
+
+    @property
+    def id_batcher(self):
+        return self._id_batcher
+
+    def _send(self, method: str, end_url: str, **kwargs) -> requests.Response:
         req_url = urljoin(self._base_url, end_url)
-        params = None
-        if query_filters:
-            params = {"query[]": query_filters}
-        resp = requests.get(
-            req_url, verify=self._verify_ssl, headers=self._headers, params=params
+        kwargs.setdefault("headers", self._headers)
+        if method != "GET" and self._response_cache is not None:
+            self._response_cache.clear()
+        if method != "GET" and self._mirror is not None:
+            self._mirror.mark_stale()
+        if method != "GET" and self._single_flight is not None:
+            self._single_flight.forget()
+
+        deadline = current_deadline()
+        timeout = self._timeouts.for_endpoint(end_url)
+        attempt = 0
+        while True:
+            if deadline is not None:
+                kwargs["timeout"] = deadline.clamp(timeout)
+            else:
+                kwargs["timeout"] = timeout
+            try:
+                resp = self._send_once(method, req_url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                if deadline is not None and deadline.remaining() <= 0:
+                    raise DeadlineExceededError(deadline.budget) from error
+                if not self._can_retry(method, attempt):
+                    raise
+                delay = self._retry_policy.backoff(attempt)
+            else:
+                if resp.status_code not in self._retry_statuses():
+                    return resp
+                if not self._can_retry(method, attempt):
+                    return resp
+                delay = self._retry_policy.backoff(
+                    attempt, resp.headers.get("Retry-After")
+                )
+
+            if deadline is not None and deadline.remaining() <= delay:
+                raise DeadlineExceededError(deadline.budget)
+            attempt += 1
+            _LOGGER.debug("retrying %s /%s in %.2fs", method, end_url, delay)
+            time.sleep(delay)
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        return self._retry_policy is not None and self._retry_policy.can_retry(
+            method, attempt
         )
 
+    def _retry_statuses(self):
+        if self._retry_policy is None:
+            return ()
+        return self._retry_policy.retry_statuses
+
+    def _send_once(self, method: str, req_url: str, **kwargs) -> requests.Response:
+        breaker = self._circuit_breaker
+        if breaker is not None:
+            breaker.before_request()
+
+        self._evict_idle_connections()
+        try:
+            resp = self._session.request(
+                method, req_url, verify=self._verify_ssl, **kwargs
+            )
+        except requests.RequestException:
+            if breaker is not None:
+                breaker.record_failure()
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.release_probe()
+            raise
+
+        if breaker is not None:
+            if resp.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return resp
+
+    def _validate_response_cache(self):
+        cache = self._response_cache
+        now = time.monotonic()
+        if cache.needs_validation(now):
+            resp = self._get_json("system/db-changed-time")
+            cache.validate(resp.get("changed_time"), now)
+
+    def _do_get_request(
+        self,
+        end_url: str,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
+    ):
+        query_filters, order, limit, offset = normalize_query(
+            query_filters, order, limit, offset
+        )
+        if self._mirror is not None:
+            rows = self._mirror.get(end_url, query_filters, order, limit, offset)
+            if rows is not MISSING:
+                return rows
+
+        params = _build_params(query_filters, order, limit, offset)
+        cache = self._response_cache
+        if cache is None or not cache.is_cacheable(end_url):
+            return self._get_json(end_url, params)
+
+        self._validate_response_cache()
+        db_changed_time = cache.db_changed_time
+        key = (end_url, tuple(query_filters or ()), order, limit, offset)
+        parsed_json = cache.get(key)
+        if parsed_json is MISSING and self._local_queries and params:
+            rows = cache.peek((end_url, (), None, None, None))
+            if isinstance(rows, list):
+                return self._select_locally(
+                    end_url, rows, query_filters, order, limit, offset
+                )
+        if parsed_json is MISSING:
+            parsed_json = self._get_json(end_url, params)
+            cache.set(key, parsed_json, db_changed_time)
+        return parsed_json
+
+    def _select_locally(
+        self,
+        end_url: str,
+        rows: List[Any],
+        query_filters: List[str],
+        order: str,
+        limit: int,
+        offset: int,
+    ) -> List[Any]:
+        """Answer a filtered request from the cached unfiltered response."""
+        table = self._local_tables.get(end_url)
+        if table is None or table.rows is not rows:
+            table = LocalTable(rows)
+            self._local_tables[end_url] = table
+        _LOGGER.debug("-->\tGET /%s (evaluated locally)", end_url)
+        return table.select(query_filters, order, limit, offset)
+
+    def _get_json(self, end_url: str, params: Dict[str, Any] = None):
+        if self._single_flight is None:
+            content = self._fetch_content(end_url, params)
+        else:
+            # Only the body is shared; every caller parses its own objects so
+            # one caller mutating its result can't change another's.
+            key = (end_url, _params_key(params))
+            content = self._single_flight.do(
+                key, lambda: self._fetch_content(end_url, params)
+            )
+        if len(content) > 0:
+            return json.loads(content)
+
+    def _fetch_content(self, end_url: str, params: Dict[str, Any] = None) -> bytes:
+        resp = self._send("GET", end_url, params=params)
+
         _LOGGER.debug("-->\tGET /%s", end_url)
         _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
         _LOGGER.debug("\t\t%s", resp.content)
@@ -358,14 +681,25 @@ class GrocyApiClient(object):
         if resp.status_code >= 400:
             raise GrocyError(resp)
 
-        if len(resp.content) > 0:
-            return resp.json()
+        return resp.content
+
+    def _stream_get_request(
+        self, end_url: str, query_filters: QueryFilters = None
+    ) -> Iterator[Any]:
+        """Yield the rows of a list endpoint without buffering the whole body."""
+        params = _build_params(*normalize_query(query_filters))
+        resp = self._send("GET", end_url, params=params, stream=True)
+
+        _LOGGER.debug("-->\tGET /%s (streamed)", end_url)
+        _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
+
+        with resp:
+            if resp.status_code >= 400:
+                raise GrocyError(resp)
+            yield from iter_json_array(resp.iter_content(DEFAULT_CHUNK_SIZE))
 
     def _do_post_request(self, end_url: str, data: dict):
-        req_url = urljoin(self._base_url, end_url)
-        resp = requests.post(
-            req_url, verify=self._verify_ssl, headers=self._headers, json=data
-        )
+        resp = self._send("POST", end_url, json=data)
 
         _LOGGER.debug("-->\tPOST /%s", end_url)
         _LOGGER.debug("\t\t%s", data)
@@ -378,7 +712,6 @@ class GrocyApiClient(object):
             return resp.json()
 
     def _do_put_request(self, end_url: str, data):
-        req_url = urljoin(self._base_url, end_url)
         up_header = self._headers.copy()
         up_header["accept"] = "*/*"
         if isinstance(data, dict):
@@ -386,9 +719,7 @@ class GrocyApiClient(object):
             data = json.dumps(data)
         else:
             up_header["Content-Type"] = "application/octet-stream"
-        resp = requests.put(
-            req_url, verify=self._verify_ssl, headers=up_header, data=data
-        )
+        resp = self._send("PUT", end_url, headers=up_header, data=data)
 
         _LOGGER.debug("-->\tPUT /%s", end_url)
         _LOGGER.debug("\t\t%s", data)
@@ -402,8 +733,7 @@ class GrocyApiClient(object):
             return resp.json()
 
     def _do_delete_request(self, end_url: str):
-        req_url = urljoin(self._base_url, end_url)
-        resp = requests.delete(req_url, verify=self._verify_ssl, headers=self._headers)
+        resp = self._send("DELETE", end_url)
 
         _LOGGER.debug("-->\tDELETE /%s", end_url)
         _LOGGER.debug("<--\t%d for /%s", resp.status_code, end_url)
@@ -418,36 +748,47 @@ class GrocyApiClient(object):
     def get_stock(self) -> List[CurrentStockResponse]:
         parsed_json = self._do_get_request("stock")
         if parsed_json:
-            return [CurrentStockResponse(**response) for response in parsed_json]
+            return decode_list(CurrentStockResponse, parsed_json, self._decode_mode)
         return []
 
+    def iter_stock(self) -> Iterator[CurrentStockResponse]:
+        for response in self._stream_get_request("stock"):
+            yield decode(CurrentStockResponse, response, self._decode_mode)
+
     def get_volatile_stock(self) -> CurrentVolatilStockResponse:
         parsed_json = self._do_get_request("stock/volatile")
-        return CurrentVolatilStockResponse(**parsed_json)
+        return decode(CurrentVolatilStockResponse, parsed_json, self._decode_mode)
 
     def get_product(self, product_id) -> ProductDetailsResponse:
         url = f"stock/products/{product_id}"
         parsed_json = self._do_get_request(url)
         if parsed_json:
-            return ProductDetailsResponse(**parsed_json)
+            return decode(ProductDetailsResponse, parsed_json, self._decode_mode)
 
     def get_product_by_barcode(self, barcode) -> ProductDetailsResponse:
         url = f"stock/products/by-barcode/{barcode}"
         parsed_json = self._do_get_request(url)
         if parsed_json:
-            return ProductDetailsResponse(**parsed_json)
+            return decode(ProductDetailsResponse, parsed_json, self._decode_mode)
 
-    def get_chores(self, query_filters: List[str] = None) -> List[CurrentChoreResponse]:
+    def get_chores(
+        self, query_filters: QueryFilters = None
+    ) -> List[CurrentChoreResponse]:
         parsed_json = self._do_get_request("chores", query_filters)
         if parsed_json:
-            return [CurrentChoreResponse(**chore) for chore in parsed_json]
+            return decode_list(CurrentChoreResponse, parsed_json, self._decode_mode)
         return []
 
     def get_chore(self, chore_id: int) -> ChoreDetailsResponse:
+        if self._id_batcher is not None:
+            return self._id_batcher.load("chore", chore_id)
+        return self._fetch_chore(chore_id)
+
+    def _fetch_chore(self, chore_id: int) -> ChoreDetailsResponse:
         url = f"chores/{chore_id}"
         parsed_json = self._do_get_request(url)
         if parsed_json:
-            return ChoreDetailsResponse(**parsed_json)
+            return decode(ChoreDetailsResponse, parsed_json, self._decode_mode)
 
     def execute_chore(
         self,
@@ -557,7 +898,7 @@ class GrocyApiClient(object):
         )
 
         if parsed_json:
-            stockLog = [StockLogResponse(**response) for response in parsed_json]
+            stockLog = decode_list(StockLogResponse, parsed_json, self._decode_mode)
             return stockLog[0]
 
     def add_product_by_barcode(
@@ -583,7 +924,7 @@ class GrocyApiClient(object):
         )
 
         if parsed_json:
-            stockLog = [StockLogResponse(**response) for response in parsed_json]
+            stockLog = decode_list(StockLogResponse, parsed_json, self._decode_mode)
             return stockLog[0]
 
     def consume_product_by_barcode(
@@ -600,7 +941,7 @@ class GrocyApiClient(object):
         )
 
         if parsed_json:
-            stockLog = [StockLogResponse(**response) for response in parsed_json]
+            stockLog = decode_list(StockLogResponse, parsed_json, self._decode_mode)
             return stockLog[0]
 
     def inventory_product_by_barcode(
@@ -631,17 +972,31 @@ class GrocyApiClient(object):
         )
 
         if parsed_json:
-            stockLog = [StockLogResponse(**response) for response in parsed_json]
+            stockLog = decode_list(StockLogResponse, parsed_json, self._decode_mode)
             return stockLog[0]
 
     def get_shopping_list(
-        self, query_filters: List[str] = None
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
     ) -> List[ShoppingListItem]:
-        parsed_json = self._do_get_request("objects/shopping_list", query_filters)
+        parsed_json = self._do_get_request(
+            "objects/shopping_list", query_filters, order, limit, offset
+        )
         if parsed_json:
-            return [ShoppingListItem(**response) for response in parsed_json]
+            return decode_list(ShoppingListItem, parsed_json, self._decode_mode)
         return []
 
+    def iter_shopping_list(
+        self, query_filters: QueryFilters = None
+    ) -> Iterator[ShoppingListItem]:
+        for response in self._stream_get_request(
+            "objects/shopping_list", query_filters
+        ):
+            yield decode(ShoppingListItem, response, self._decode_mode)
+
     def add_missing_product_to_shopping_list(self, shopping_list_id: int = None):
         data = None
         if shopping_list_id:
@@ -680,10 +1035,14 @@ class GrocyApiClient(object):
         }
         self._do_post_request("stock/shoppinglist/remove-product", data)
 
-    def get_product_groups(self, query_filters: List[str] = None) -> List[LocationData]:
-        parsed_json = self._do_get_request("objects/product_groups", query_filters)
+    def get_product_groups(
+        self, query_filters: QueryFilters = None
+    ) -> List[LocationData]:
+        parsed_json = self.get_generic_objects_for_type(
+            EntityType.PRODUCT_GROUPS, query_filters
+        )
         if parsed_json:
-            return [LocationData(**response) for response in parsed_json]
+            return decode_list(LocationData, parsed_json, self._decode_mode)
         return []
 
     def upload_product_picture(self, product_id: int, pic_path: str):
@@ -696,6 +1055,7 @@ class GrocyApiClient(object):
         pic_name = f"{product_id}.jpg"
         data = {"picture_file_name": pic_name}
         self._do_put_request(f"objects/products/{product_id}", data)
+        self._invalidate_entity_cache(EntityType.PRODUCTS)
 
     def get_userfields(self, entity: str, object_id: int):
         url = f"userfields/{entity}/{object_id}"
@@ -713,28 +1073,34 @@ class GrocyApiClient(object):
     def get_system_info(self) -> SystemInfoDto:
         parsed_json = self._do_get_request("system/info")
         if parsed_json:
-            return SystemInfoDto(**parsed_json)
+            return decode(SystemInfoDto, parsed_json, self._decode_mode)
 
     def get_system_time(self) -> SystemTimeDto:
         parsed_json = self._do_get_request("system/time")
         if parsed_json:
-            return SystemTimeDto(**parsed_json)
+            return decode(SystemTimeDto, parsed_json, self._decode_mode)
 
     def get_system_config(self) -> SystemConfigDto:
         parsed_json = self._do_get_request("system/config")
         if parsed_json:
-            return SystemConfigDto(**parsed_json)
+            return decode(SystemConfigDto, parsed_json, self._decode_mode)
 
-    def get_tasks(self, query_filters: List[str] = None) -> List[TaskResponse]:
-        parsed_json = self._do_get_request("tasks", query_filters)
+    def get_tasks(
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> List[TaskResponse]:
+        parsed_json = self._do_get_request("tasks", query_filters, order, limit, offset)
         if parsed_json:
-            return [TaskResponse(**data) for data in parsed_json]
+            return decode_list(TaskResponse, parsed_json, self._decode_mode)
         return []
 
     def get_task(self, task_id: int) -> TaskResponse:
         url = f"objects/tasks/{task_id}"
         parsed_json = self._do_get_request(url)
-        return TaskResponse(**parsed_json)
+        return decode(TaskResponse, parsed_json, self._decode_mode)
 
     def complete_task(self, task_id: int, done_time: datetime = None):
         url = f"tasks/{task_id}/complete"
@@ -747,29 +1113,47 @@ class GrocyApiClient(object):
         data = {"done_time": grocy_datetime_str(localized_done_time)}
         self._do_post_request(url, data)
 
-    def get_meal_plan(self, query_filters: List[str] = None) -> List[MealPlanResponse]:
-        parsed_json = self._do_get_request("objects/meal_plan", query_filters)
+    def get_meal_plan(
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> List[MealPlanResponse]:
+        parsed_json = self._do_get_request(
+            "objects/meal_plan", query_filters, order, limit, offset
+        )
         if parsed_json:
-            return [MealPlanResponse(**data) for data in parsed_json]
+            return decode_list(MealPlanResponse, parsed_json, self._decode_mode)
         return []
 
     def get_recipe(self, object_id: int) -> RecipeDetailsResponse:
+        if self._id_batcher is not None:
+            return self._id_batcher.load("recipe", object_id)
+        return self._fetch_recipe(object_id)
+
+    def _fetch_recipe(self, object_id: int) -> RecipeDetailsResponse:
         parsed_json = self._do_get_request(f"objects/recipes/{object_id}")
         if parsed_json:
-            return RecipeDetailsResponse(**parsed_json)
+            return decode(RecipeDetailsResponse, parsed_json, self._decode_mode)
 
     def get_batteries(
-        self, query_filters: List[str] = None
+        self, query_filters: QueryFilters = None
     ) -> List[CurrentBatteryResponse]:
         parsed_json = self._do_get_request("batteries", query_filters)
         if parsed_json:
-            return [CurrentBatteryResponse(**data) for data in parsed_json]
+            return decode_list(CurrentBatteryResponse, parsed_json, self._decode_mode)
         return []
 
     def get_battery(self, battery_id: int) -> BatteryDetailsResponse:
+        if self._id_batcher is not None:
+            return self._id_batcher.load("battery", battery_id)
+        return self._fetch_battery(battery_id)
+
+    def _fetch_battery(self, battery_id: int) -> BatteryDetailsResponse:
         parsed_json = self._do_get_request(f"batteries/{battery_id}")
         if parsed_json:
-            return BatteryDetailsResponse(**parsed_json)
+            return decode(BatteryDetailsResponse, parsed_json, self._decode_mode)
 
     def charge_battery(self, battery_id: int, tracked_time: datetime = None):
         if tracked_time is None:
@@ -780,41 +1164,96 @@ class GrocyApiClient(object):
 
         return self._do_post_request(f"batteries/{battery_id}/charge", data)
 
+    def _invalidate_entity_cache(self, entity_type: str):
+        if self._entity_cache is not None:
+            self._entity_cache.invalidate(_entity_type_value(entity_type))
+
     def add_generic(self, entity_type: str, data):
-        return self._do_post_request(f"objects/{entity_type}", data)
+        entity_type = _entity_type_value(entity_type)
+        try:
+            return self._do_post_request(f"objects/{entity_type}", data)
+        finally:
+            self._invalidate_entity_cache(entity_type)
 
     def update_generic(self, entity_type: str, object_id: int, data):
-        return self._do_put_request(f"objects/{entity_type}/{object_id}", data)
+        entity_type = _entity_type_value(entity_type)
+        try:
+            return self._do_put_request(f"objects/{entity_type}/{object_id}", data)
+        finally:
+            self._invalidate_entity_cache(entity_type)
 
     def delete_generic(self, entity_type: str, object_id: int):
-        return self._do_delete_request(f"objects/{entity_type}/{object_id}")
+        entity_type = _entity_type_value(entity_type)
+        try:
+            return self._do_delete_request(f"objects/{entity_type}/{object_id}")
+        finally:
+            self._invalidate_entity_cache(entity_type)
 
     def get_generic_objects_for_type(
-        self, entity_type: str, query_filters: List[str] = None
+        self,
+        entity_type: str,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
     ):
-        return self._do_get_request(f"objects/{entity_type}", query_filters)
+        entity_type = _entity_type_value(entity_type)
+        end_url = f"objects/{entity_type}"
+        query_filters, order, limit, offset = normalize_query(
+            query_filters, order, limit, offset
+        )
+
+        def load():
+            return self._do_get_request(end_url, query_filters, order, limit, offset)
+
+        cache = self._entity_cache
+        if cache is None or not cache.has_policy(entity_type):
+            return load()
+
+        key = tuple(query_filters or ())
+        if order or limit is not None or offset:
+            key += (order, limit, offset)
+        if self._local_queries and key:
+            rows = cache.peek(entity_type, ())
+            if isinstance(rows, list):
+                return self._select_locally(
+                    end_url, rows, query_filters, order, limit, offset
+                )
+        return cache.get_or_load(entity_type, key, load)
+
+    def iter_generic_objects_for_type(
+        self, entity_type: str, query_filters: QueryFilters = None
+    ) -> Iterator[dict]:
+        entity_type = _entity_type_value(entity_type)
+        return self._stream_get_request(f"objects/{entity_type}", query_filters)
 
     def get_meal_plan_sections(
-        self, query_filters: List[str] = None
+        self, query_filters: QueryFilters = None
     ) -> List[MealPlanSectionResponse]:
         parsed_json = self.get_generic_objects_for_type(
             EntityType.MEAL_PLAN_SECTIONS, query_filters
         )
         if parsed_json:
-            return [MealPlanSectionResponse(**resp) for resp in parsed_json]
+            return decode_list(MealPlanSectionResponse, parsed_json, self._decode_mode)
         return []
 
     def get_meal_plan_section(self, meal_plan_section_id) -> MealPlanSectionResponse:
-        parsed_json = self._do_get_request(
-            f"objects/meal_plan_sections?query%5B%5D=id%3D{meal_plan_section_id}"
+        if self._id_batcher is not None:
+            return self._id_batcher.load("meal_plan_section", meal_plan_section_id)
+        return self._fetch_meal_plan_section(meal_plan_section_id)
+
+    def _fetch_meal_plan_section(self, meal_plan_section_id) -> MealPlanSectionResponse:
+        parsed_json = self.get_generic_objects_for_type(
+            EntityType.MEAL_PLAN_SECTIONS,
+            Query(MealPlanSectionResponse).where("id", "=", meal_plan_section_id),
         )
         if parsed_json and len(parsed_json) == 1:
-            return MealPlanSectionResponse(**parsed_json[0])
+            return decode(MealPlanSectionResponse, parsed_json[0], self._decode_mode)
 
-    def get_users(self) -> List[UserDto]:
-        parsed_json = self._do_get_request("users")
+    def get_users(self, query_filters: QueryFilters = None) -> List[UserDto]:
+        parsed_json = self._do_get_request("users", query_filters)
         if parsed_json:
-            return [UserDto(**user) for user in parsed_json]
+            return decode_list(UserDto, parsed_json, self._decode_mode)
         return []
 
     def get_user(self, user_id: int) -> UserDto:
@@ -823,4 +1262,4 @@ class GrocyApiClient(object):
             query_params.append(f"id={user_id}")
         parsed_json = self._do_get_request("users")
         if parsed_json:
-            return UserDto(**parsed_json[0])
+            return decode(UserDto, parsed_json[0], self._decode_mode)
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List
+
+import requests
+
+from .cache import MISSING
+from .data_models.generic import EntityType
+from .errors import GrocyError
+from .query import QueryFilters
+from .query_engine import LocalTable
+
+if TYPE_CHECKING:
+    from .grocy_api_client import GrocyApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_VIEWS = {
+    "view_stock": "stock",
+    "view_chores": "chores",
+    "view_batteries": "batteries",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror_meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS mirror_datasets (
+    name TEXT PRIMARY KEY,
+    end_url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _column_value(value: Any):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def _table_row(position: int, row: dict, columns: List[str]) -> list:
+    values = [_column_value(row.get(column)) for column in columns]
+    return [position, json.dumps(row), *values]
+
+
+def _content_hash(rows: List[Any]) -> str:
+    encoded = json.dumps(rows, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class GrocyMirror(object):
+    """Local SQLite copy of a Grocy instance.
+
+    Every ``EntityType`` table is stored under its entity name and the
+    ``stock``, ``chores`` and ``batteries`` views as ``view_<name>``. Each
+    table has one column per response field plus the raw row in ``_row``, so
+    it can be queried with plain SQL.
+
+    ``sync`` checks ``system/db-changed-time`` first and does nothing if the
+    server hasn't changed. Otherwise every dataset is downloaded and only the
+    tables whose content hash differs are rewritten. A dataset that fails to
+    download is dropped, so its reads go to the server, and the next ``sync``
+    downloads everything again.
+
+    Passed to ``Grocy(mirror=...)``, the mirror answers reads of mirrored
+    endpoints, including ``query_filters``, without contacting the server.
+    After a write through that client the mirror is bypassed until the next
+    ``sync``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        entity_types: Iterable[EntityType] = EntityType,
+        views: Dict[str, str] = None,
+    ):
+        self._datasets = {
+            EntityType(entity_type).value: f"objects/{EntityType(entity_type).value}"
+            for entity_type in entity_types
+        }
+        self._datasets.update(DEFAULT_VIEWS if views is None else views)
+        self._tables_by_url = {
+            end_url: name for name, end_url in self._datasets.items()
+        }
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._local_tables = {}
+        self._stale = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    @property
+    def db_changed_time(self) -> str:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM mirror_meta WHERE key = 'db_changed_time'"
+            ).fetchone()
+        return row[0] if row else None
+
+    @property
+    def stale(self) -> bool:
+        return self._stale
+
+    def mark_stale(self):
+        self._stale = True
+
+    def _hashes(self) -> Dict[str, str]:
+        with self._lock:
+            return dict(
+                self._connection.execute(
+                    "SELECT name, content_hash FROM mirror_datasets"
+                )
+            )
+
+    def sync(self, api_client: "GrocyApiClient", force: bool = False) -> List[str]:
+        """Bring the mirror up to date and return the names of changed tables."""
+        changed_time = api_client._get_json("system/db-changed-time")["changed_time"]
+        if not force and not self._stale and changed_time == self.db_changed_time:
+            return []
+
+        hashes = self._hashes()
+        changed = []
+        failed = []
+        for name, end_url in self._datasets.items():
+            try:
+                rows = api_client._get_json(end_url) or []
+            except (GrocyError, requests.RequestException) as error:
+                _LOGGER.warning("Mirroring %s failed: %s", end_url, error)
+                self._drop_table(name)
+                failed.append(name)
+                continue
+            content_hash = _content_hash(rows)
+            if hashes.get(name) != content_hash:
+                self._write_table(name, end_url, rows, content_hash)
+                changed.append(name)
+
+        if not failed:
+            with self._lock, self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO mirror_meta VALUES ('db_changed_time', ?)",
+                    (changed_time,),
+                )
+        self._stale = False
+        _LOGGER.debug("Mirror synced, changed tables: %s", changed)
+        return changed
+
+    def _drop_table(self, name: str):
+        with self._lock, self._connection:
+            self._connection.execute(f"DROP TABLE IF EXISTS {_quote(name)}")
+            self._connection.execute(
+                "DELETE FROM mirror_datasets WHERE name = ?", (name,)
+            )
+            self._local_tables.pop(name, None)
+
+    def _write_table(self, name: str, end_url: str, rows: List[dict], content_hash):
+        columns = []
+        for row in rows:
+            for column in row:
+                if column not in columns and not column.startswith("_"):
+                    columns.append(column)
+
+        table = _quote(name)
+        column_defs = "".join(f", {_quote(column)}" for column in columns)
+        placeholders = ", ".join("?" for _ in range(len(columns) + 2))
+        with self._lock, self._connection:
+            self._connection.execute(f"DROP TABLE IF EXISTS {table}")
+            self._connection.execute(
+                f"CREATE TABLE {table} "
+                f"(_position INTEGER PRIMARY KEY, _row TEXT NOT NULL{column_defs})"
+            )
+            self._connection.executemany(
+                f"INSERT INTO {table} VALUES ({placeholders})",
+                (
+                    _table_row(position, row, columns)
+                    for position, row in enumerate(rows)
+                ),
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO mirror_datasets VALUES (?, ?, ?, ?, ?)",
+                (
+                    name,
+                    end_url,
+                    content_hash,
+                    len(rows),
+                    datetime.now().isoformat(),
+                ),
+            )
+            self._local_tables.pop(name, None)
+
+    def _local_table(self, name: str):
+        with self._lock:
+            table = self._local_tables.get(name)
+            if table is None:
+                synced = self._connection.execute(
+                    "SELECT 1 FROM mirror_datasets WHERE name = ?", (name,)
+                ).fetchone()
+                if synced is None:
+                    return None
+                rows = [
+                    json.loads(row)
+                    for (row,) in self._connection.execute(
+                        f"SELECT _row FROM {_quote(name)} ORDER BY _position"
+                    )
+                ]
+                table = LocalTable(rows)
+                self._local_tables[name] = table
+            return table
+
+    def get(
+        self,
+        end_url: str,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
+    ):
+        """Answer a GET from the mirror, or return ``MISSING``."""
+        name = self._tables_by_url.get(end_url)
+        if name is None or self._stale:
+            return MISSING
+        table = self._local_table(name)
+        if table is None:
+            return MISSING
+        return table.select(query_filters, order, limit, offset)
+
+    def execute(self, sql: str, parameters: Iterable = ()) -> List[tuple]:
+        """Run a read-only SQL query against the mirrored tables."""
+        with self._lock:
+            return self._connection.execute(sql, tuple(parameters)).fetchall()
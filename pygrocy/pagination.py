@@ -0,0 +1,85 @@
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Generic, Iterator, List, TypeVar
+
+DEFAULT_PAGE_SIZE = 100
+
+T = TypeVar("T")
+
+PageFetcher = Callable[[int, int], List[T]]
+
+
+class Paginator(Generic[T]):
+    """Iterates over a list endpoint using Grocy's ``limit`` and ``offset``.
+
+    ``fetch_page(limit, offset)`` returns one page; iteration stops at the
+    first page shorter than ``page_size``. With ``prefetch`` the next page is
+    requested on a background thread while the current one is consumed.
+    Breaking out of the loop early stops further requests.
+    """
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: bool = False,
+    ):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._prefetch = prefetch
+
+    @property
+    def page_size(self) -> int:
+        return self._page_size
+
+    def __iter__(self) -> Iterator[T]:
+        for page in self.pages():
+            yield from page
+
+    def pages(self) -> Iterator[List[T]]:
+        if self._prefetch:
+            return self._prefetched_pages()
+        return self._sequential_pages()
+
+    def _sequential_pages(self) -> Iterator[List[T]]:
+        offset = 0
+        while True:
+            page = self._fetch_page(self._page_size, offset) or []
+            if page:
+                yield page
+            if len(page) < self._page_size:
+                return
+            offset += self._page_size
+
+    def _prefetched_pages(self) -> Iterator[List[T]]:
+        executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pygrocy-prefetch"
+        )
+
+        def submit(offset: int):
+            return executor.submit(
+                contextvars.copy_context().run,
+                self._fetch_page,
+                self._page_size,
+                offset,
+            )
+
+        offset = 0
+        pending = submit(offset)
+        try:
+            while True:
+                page = pending.result() or []
+                if len(page) < self._page_size:
+                    pending = None
+                    if page:
+                        yield page
+                    return
+                offset += self._page_size
+                pending = submit(offset)
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
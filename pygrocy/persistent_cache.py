@@ -0,0 +1,385 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+from .cache import DEFAULT_EXCLUDED_ENDPOINTS, MISSING, ResponseCache
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_ENTRY_SUFFIX = ".json.z"
+_META_FILE = "meta.json"
+
+
+def _encode(value: Any, level: int) -> bytes:
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode(), level)
+
+
+def _decode(data: bytes) -> Any:
+    return json.loads(zlib.decompress(data))
+
+
+class DiskResponseCache(ResponseCache):
+    """``ResponseCache`` persisted to a directory as zlib-compressed JSON.
+
+    Entries survive restarts together with the db-changed-time they were
+    stored under, so a new process only needs the one validation request to
+    reuse them. Entry files stored under another time are ignored. The
+    least recently used entries (by file mtime across restarts) are removed
+    once the files exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        excluded_endpoints: Iterable[str] = DEFAULT_EXCLUDED_ENDPOINTS,
+        validation_interval: float = 0,
+        compression_level: int = 6,
+    ):
+        super().__init__(
+            excluded_endpoints=excluded_endpoints,
+            validation_interval=validation_interval,
+        )
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._compression_level = compression_level
+        self._size = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load()
+
+    @property
+    def size(self) -> int:
+        """Bytes used by the entry files."""
+        return self._size
+
+    def _path(self, file_name: str) -> str:
+        return os.path.join(self._directory, file_name)
+
+    @staticmethod
+    def _file_name(key: Hashable) -> str:
+        return hashlib.sha1(repr(key).encode()).hexdigest() + _ENTRY_SUFFIX
+
+    def _load(self):
+        try:
+            with open(self._path(_META_FILE)) as meta_file:
+                self._db_changed_time = json.load(meta_file).get("db_changed_time")
+        except (OSError, ValueError):
+            self._db_changed_time = None
+
+        files = []
+        for file_name in os.listdir(self._directory):
+            if file_name.endswith(_ENTRY_SUFFIX):
+                stat = os.stat(self._path(file_name))
+                files.append((stat.st_mtime, file_name, stat.st_size))
+        self._entries = OrderedDict(
+            (file_name, [size, MISSING]) for _, file_name, size in sorted(files)
+        )
+        self._size = sum(size for _, _, size in files)
+
+    def _write_meta(self):
+        meta_path = self._path(_META_FILE)
+        with open(meta_path + ".tmp", "w") as meta_file:
+            json.dump({"db_changed_time": self._db_changed_time}, meta_file)
+        os.replace(meta_path + ".tmp", meta_path)
+
+    def validate(self, db_changed_time: str, now: float):
+        changed = db_changed_time != self._db_changed_time
+        super().validate(db_changed_time, now)
+        if changed:
+            with self._lock:
+                self._write_meta()
+
+    def _remove(self, file_name: str):
+        size, _ = self._entries.pop(file_name)
+        self._size -= size
+        try:
+            os.remove(self._path(file_name))
+        except OSError:
+            pass
+
+    def _clear_entries(self):
+        for file_name in list(self._entries):
+            self._remove(file_name)
+
+    def _read(self, file_name: str) -> Any:
+        entry = self._entries.get(file_name)
+        if entry is None:
+            return MISSING
+        if entry[1] is MISSING:
+            try:
+                with open(self._path(file_name), "rb") as entry_file:
+                    changed_time, value = _decode(entry_file.read())
+            except (OSError, ValueError, TypeError, zlib.error) as error:
+                _LOGGER.debug(
+                    "Dropping unreadable cache entry %s: %s", file_name, error
+                )
+                self._remove(file_name)
+                return MISSING
+            if not self._is_current(changed_time):
+                _LOGGER.debug("Dropping outdated cache entry %s", file_name)
+                self._remove(file_name)
+                return MISSING
+            entry[1] = value
+        return entry[1]
+
+    def get(self, key: Hashable) -> Any:
+        file_name = self._file_name(key)
+        with self._lock:
+            value = self._read(file_name)
+            if value is MISSING:
+                self._misses += 1
+                return value
+            self._hits += 1
+            self._entries.move_to_end(file_name)
+        try:
+            os.utime(self._path(file_name))
+        except OSError:
+            pass
+        return value
+
+    def peek(self, key: Hashable) -> Any:
+        with self._lock:
+            return self._read(self._file_name(key))
+
+    def set(self, key: Hashable, value: Any, db_changed_time: str = MISSING):
+        file_name = self._file_name(key)
+        path = self._path(file_name)
+        with self._lock:
+            if db_changed_time is MISSING:
+                db_changed_time = self._db_changed_time
+            elif not self._is_current(db_changed_time):
+                return
+            data = _encode([db_changed_time, value], self._compression_level)
+            with open(path + ".tmp", "wb") as entry_file:
+                entry_file.write(data)
+            os.replace(path + ".tmp", path)
+            if file_name in self._entries:
+                self._size -= self._entries[file_name][0]
+            self._entries[file_name] = [len(data), value]
+            self._entries.move_to_end(file_name)
+            self._size += len(data)
+            while self._size > self._max_bytes and len(self._entries) > 1:
+                self._remove(next(iter(self._entries)))
+
+
+_SHARED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    changed_time TEXT
+);
+CREATE INDEX IF NOT EXISTS cache_entries_accessed ON cache_entries (accessed);
+CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class SharedResponseCache(ResponseCache):
+    """``ResponseCache`` shared by processes on one host through SQLite in WAL mode.
+
+    Readers never block each other or the single writer, and every process
+    sees the same entries, so N workers keep one copy of the data and
+    fetch it from Grocy once. The db-changed-time is stored alongside the
+    entries: whichever worker first sees it advance clears the cache for
+    all of them. Connections are reopened after a fork.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        excluded_endpoints: Iterable[str] = DEFAULT_EXCLUDED_ENDPOINTS,
+        validation_interval: float = 0,
+        compression_level: int = 6,
+        busy_timeout: float = 30,
+        clock=time.time,
+    ):
+        super().__init__(
+            excluded_endpoints=excluded_endpoints,
+            validation_interval=validation_interval,
+        )
+        self._path = path
+        self._max_bytes = max_bytes
+        self._compression_level = compression_level
+        self._busy_timeout = busy_timeout
+        self._clock = clock
+        self._pid = None
+        self._connection = None
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self._path,
+                timeout=self._busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(_SHARED_SCHEMA)
+            columns = [
+                row[1] for row in connection.execute("PRAGMA table_info(cache_entries)")
+            ]
+            if "changed_time" not in columns:
+                connection.execute(
+                    "ALTER TABLE cache_entries ADD COLUMN changed_time TEXT"
+                )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return repr(key)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            (size,) = (
+                self._connect()
+                .execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries")
+                .fetchone()
+            )
+        return size
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = (
+                self._connect().execute("SELECT COUNT(*) FROM cache_entries").fetchone()
+            )
+        return count
+
+    def validate(self, db_changed_time: str, now: float):
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT value FROM cache_meta WHERE key = 'db_changed_time'"
+            ).fetchone()
+            if row is None or row[0] != db_changed_time:
+                connection.execute("BEGIN IMMEDIATE")
+                try:
+                    row = connection.execute(
+                        "SELECT value FROM cache_meta WHERE key = 'db_changed_time'"
+                    ).fetchone()
+                    if row is None or row[0] != db_changed_time:
+                        connection.execute("DELETE FROM cache_entries")
+                        connection.execute(
+                            "INSERT OR REPLACE INTO cache_meta "
+                            "VALUES ('db_changed_time', ?)",
+                            (db_changed_time,),
+                        )
+                    connection.execute("COMMIT")
+                except BaseException:
+                    connection.execute("ROLLBACK")
+                    raise
+            self._db_changed_time = db_changed_time
+            self._validated_at = now
+
+    def _clear_entries(self):
+        self._connect().execute("DELETE FROM cache_entries")
+
+    def _read(self, key: Hashable) -> Any:
+        row = (
+            self._connect()
+            .execute(
+                "SELECT value FROM cache_entries WHERE key = ? AND changed_time IS "
+                "(SELECT value FROM cache_meta WHERE key = 'db_changed_time')",
+                (self._key(key),),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return MISSING
+        try:
+            return _decode(row[0])
+        except (ValueError, zlib.error):
+            return MISSING
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._read(key)
+            if value is MISSING:
+                self._misses += 1
+                return value
+            self._hits += 1
+            # Only refresh the LRU timestamp occasionally to keep readers
+            # from queueing up behind the write lock.
+            now = self._clock()
+            self._connect().execute(
+                "UPDATE cache_entries SET accessed = ? WHERE key = ? AND accessed < ?",
+                (now, self._key(key), now - 60),
+            )
+            return value
+
+    def peek(self, key: Hashable) -> Any:
+        with self._lock:
+            return self._read(key)
+
+    def set(self, key: Hashable, value: Any, db_changed_time: str = MISSING):
+        """Store ``value`` with the db-changed-time it was fetched under.
+
+        Without ``db_changed_time`` the time this process last validated is
+        used. The value is dropped when another process has stored a
+        different time since.
+        """
+        data = _encode(value, self._compression_level)
+        with self._lock:
+            if db_changed_time is MISSING:
+                db_changed_time = self._db_changed_time
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT value FROM cache_meta WHERE key = 'db_changed_time'"
+                ).fetchone()
+                if (row[0] if row else None) == db_changed_time:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO cache_entries "
+                        "(key, value, size, accessed, changed_time) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (
+                            self._key(key),
+                            data,
+                            len(data),
+                            self._clock(),
+                            db_changed_time,
+                        ),
+                    )
+                    self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def _evict(self, connection: sqlite3.Connection):
+        (size,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()
+        if size <= self._max_bytes:
+            return
+        evicted = []
+        for key, entry_size in connection.execute(
+            "SELECT key, size FROM cache_entries ORDER BY accessed, rowid"
+        ).fetchall()[:-1]:
+            if size <= self._max_bytes:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        connection.executemany("DELETE FROM cache_entries WHERE key = ?", evicted)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,184 @@
+import re
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, List, Optional, Tuple, Type, Union
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+
+from .utils import grocy_datetime_str
+
+_FIELD_NAME = re.compile(r"^\w+$")
+
+
+class Operator(str, Enum):
+    EQUAL = "="
+    NOT_EQUAL = "!="
+    LIKE = "~"
+    NOT_LIKE = "!~"
+    LESS = "<"
+    GREATER = ">"
+    LESS_OR_EQUAL = "<="
+    GREATER_OR_EQUAL = ">="
+    REGEX = "§"
+
+
+def _format_value(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, datetime):
+        return grocy_datetime_str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class Condition(object):
+    def __init__(self, field: str, operator: Operator, value: Any):
+        self._field = field
+        self._operator = Operator(operator)
+        self._value = value
+
+    @property
+    def field(self) -> str:
+        return self._field
+
+    @property
+    def operator(self) -> Operator:
+        return self._operator
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    def compile(self) -> str:
+        return f"{self._field}{self._operator.value}{_format_value(self._value)}"
+
+    def __repr__(self) -> str:
+        return f"<Condition {self.compile()!r}>"
+
+
+class Query(object):
+    """Typed builder for Grocy's ``query[]``, ``order`` and ``limit`` parameters.
+
+    Conditions are ANDed. If ``model`` is given, field names are checked
+    against its fields and ``=``/``!=`` values against the field types, so
+    typos fail before a request is sent. Fields may be given by name or by
+    their API alias and are always sent as the alias. Builder methods return
+    a new query.
+
+        Query(TaskResponse).where("done", "=", False).order_by("due_date")
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel] = None,
+        conditions: List[Condition] = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
+    ):
+        self._model = model
+        self._conditions = list(conditions or [])
+        self._order = order
+        self._limit = limit
+        self._offset = offset
+
+    @property
+    def model(self) -> Optional[Type[BaseModel]]:
+        return self._model
+
+    @property
+    def conditions(self) -> List[Condition]:
+        return list(self._conditions)
+
+    @property
+    def order(self) -> Optional[str]:
+        return self._order
+
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @property
+    def offset(self) -> Optional[int]:
+        return self._offset
+
+    def _copy(self, **changes) -> "Query":
+        values = {
+            "model": self._model,
+            "conditions": self._conditions,
+            "order": self._order,
+            "limit": self._limit,
+            "offset": self._offset,
+        }
+        values.update(changes)
+        return Query(**values)
+
+    def _model_field(self, field: str) -> Optional[ModelField]:
+        if not _FIELD_NAME.match(field):
+            raise ValueError(f"Invalid field name {field!r}")
+        if self._model is None:
+            return None
+        model_field = self._model.__fields__.get(field)
+        if model_field is None:
+            for candidate in self._model.__fields__.values():
+                if candidate.alias == field:
+                    return candidate
+            raise ValueError(f"{self._model.__name__} has no field {field!r}")
+        return model_field
+
+    def where(self, field: str, operator: Union[Operator, str], value: Any) -> "Query":
+        operator = Operator(operator)
+        model_field = self._model_field(field)
+        if model_field is not None:
+            if operator in (Operator.EQUAL, Operator.NOT_EQUAL) and value is not None:
+                _, errors = model_field.validate(value, {}, loc=field)
+                if errors:
+                    raise ValueError(f"Invalid value {value!r} for {field!r}")
+            field = model_field.alias
+        condition = Condition(field, operator, value)
+        return self._copy(conditions=self._conditions + [condition])
+
+    def order_by(self, field: str, descending: bool = False) -> "Query":
+        model_field = self._model_field(field)
+        if model_field is not None:
+            field = model_field.alias
+        return self._copy(order=f"{field}:desc" if descending else field)
+
+    def paginate(self, limit: int = None, offset: int = None) -> "Query":
+        return self._copy(limit=limit, offset=offset)
+
+    def filters(self) -> List[str]:
+        return [condition.compile() for condition in self._conditions]
+
+    def __repr__(self) -> str:
+        return f"<Query {self.filters()!r} order={self._order!r} limit={self._limit!r}>"
+
+
+QueryFilters = Union[List[str], Query, None]
+
+
+def normalize_query(
+    query_filters: QueryFilters,
+    order: str = None,
+    limit: int = None,
+    offset: int = None,
+) -> Tuple[Optional[List[str]], Optional[str], Optional[int], Optional[int]]:
+    """Split ``query_filters`` into filter strings and paging parameters.
+
+    Explicit ``order``/``limit``/``offset`` arguments win over the query's own.
+    """
+    if not isinstance(query_filters, Query):
+        return query_filters, order, limit, offset
+    query = query_filters
+    return (
+        query.filters(),
+        order or query.order,
+        query.limit if limit is None else limit,
+        query.offset if offset is None else offset,
+    )
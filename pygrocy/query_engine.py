@@ -0,0 +1,239 @@
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .query import Operator, QueryFilters, _format_value, normalize_query
+
+_FILTER = re.compile(r"^(\w+)(!=|!~|<=|>=|=|~|<|>|§)(.*)$", re.DOTALL)
+
+_RANGE_OPERATORS = (
+    Operator.LESS,
+    Operator.LESS_OR_EQUAL,
+    Operator.GREATER,
+    Operator.GREATER_OR_EQUAL,
+)
+
+
+def parse_filter(query_filter: str) -> Tuple[str, Operator, str]:
+    match = _FILTER.match(query_filter)
+    if match is None:
+        raise ValueError(f"Invalid query filter {query_filter!r}")
+    field, operator, value = match.groups()
+    return field, Operator(operator), value
+
+
+def _number(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compare(left: Any, right: Any) -> int:
+    """Compare like Grocy's SQLite backend: numerically if both are numbers."""
+    left_number, right_number = _number(left), _number(right)
+    if left_number is not None and right_number is not None:
+        left, right = left_number, right_number
+    else:
+        left, right = _format_value(left), _format_value(right)
+    return (left > right) - (left < right)
+
+
+def _matches(row_value: Any, operator: Operator, value: str) -> bool:
+    if row_value is None:
+        return False
+    if operator == Operator.LIKE:
+        return value.casefold() in _format_value(row_value).casefold()
+    if operator == Operator.NOT_LIKE:
+        return value.casefold() not in _format_value(row_value).casefold()
+    if operator == Operator.REGEX:
+        return re.search(value, _format_value(row_value)) is not None
+
+    comparison = _compare(row_value, value)
+    if operator == Operator.EQUAL:
+        return comparison == 0
+    if operator == Operator.NOT_EQUAL:
+        return comparison != 0
+    if operator == Operator.LESS:
+        return comparison < 0
+    if operator == Operator.LESS_OR_EQUAL:
+        return comparison <= 0
+    if operator == Operator.GREATER:
+        return comparison > 0
+    return comparison >= 0
+
+
+def _equality_key(value: Any):
+    number = _number(value)
+    if number is not None:
+        return True, number
+    return False, _format_value(value)
+
+
+def _row_value(row, field: str):
+    if isinstance(row, dict):
+        return row.get(field)
+    return getattr(row, field, None)
+
+
+class _SortedColumn(object):
+    def __init__(self, pairs: Iterable[Tuple[Any, int]]):
+        pairs = sorted(pairs)
+        self.keys = [key for key, _ in pairs]
+        self.positions = [position for _, position in pairs]
+
+    def range(self, operator: Operator, key) -> List[int]:
+        if operator in (Operator.LESS, Operator.GREATER_OR_EQUAL):
+            split = bisect_left(self.keys, key)
+        else:
+            split = bisect_right(self.keys, key)
+        if operator in (Operator.LESS, Operator.LESS_OR_EQUAL):
+            return self.positions[:split]
+        return self.positions[split:]
+
+
+class _RangeIndex(object):
+    def __init__(self, values: List[Any]):
+        numeric, text, all_text = [], [], []
+        for position, value in enumerate(values):
+            if value is None:
+                continue
+            number = _number(value)
+            if number is None:
+                text.append((_format_value(value), position))
+            else:
+                numeric.append((number, position))
+            all_text.append((_format_value(value), position))
+        self._numeric = _SortedColumn(numeric)
+        self._text = _SortedColumn(text)
+        self._all_text = _SortedColumn(all_text)
+
+    def range(self, operator: Operator, value: str) -> List[int]:
+        number = _number(value)
+        if number is None:
+            return self._all_text.range(operator, value)
+        return self._numeric.range(operator, number) + self._text.range(operator, value)
+
+
+class LocalTable(object):
+    """Evaluates Grocy ``query[]`` filters against rows held in memory.
+
+    Rows can be response dicts or pydantic models. Equality and range
+    indexes are built per column the first time a filter needs them;
+    ``~``, ``!~``, ``!=`` and ``§`` filters scan the remaining candidates.
+    """
+
+    def __init__(self, rows: List[Any]):
+        self._rows = rows
+        self._columns = {}
+        self._equality_indexes = {}
+        self._range_indexes = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rows(self) -> List[Any]:
+        return self._rows
+
+    def _column(self, field: str) -> List[Any]:
+        column = self._columns.get(field)
+        if column is None:
+            column = [_row_value(row, field) for row in self._rows]
+            self._columns[field] = column
+        return column
+
+    def _equality_index(self, field: str) -> Dict[Any, Set[int]]:
+        with self._lock:
+            index = self._equality_indexes.get(field)
+            if index is None:
+                index = {}
+                for position, value in enumerate(self._column(field)):
+                    if value is not None:
+                        index.setdefault(_equality_key(value), set()).add(position)
+                self._equality_indexes[field] = index
+            return index
+
+    def _range_index(self, field: str) -> _RangeIndex:
+        with self._lock:
+            index = self._range_indexes.get(field)
+            if index is None:
+                index = _RangeIndex(self._column(field))
+                self._range_indexes[field] = index
+            return index
+
+    def _candidates(self, field: str, operator: Operator, value: str):
+        if operator == Operator.EQUAL:
+            return self._equality_index(field).get(_equality_key(value), set())
+        if operator in _RANGE_OPERATORS:
+            return self._range_index(field).range(operator, value)
+        return None
+
+    def select(
+        self,
+        query_filters: QueryFilters = None,
+        order: str = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> List[Any]:
+        query_filters, order, limit, offset = normalize_query(
+            query_filters, order, limit, offset
+        )
+        conditions = [
+            parse_filter(query_filter) for query_filter in query_filters or ()
+        ]
+
+        # Drive the selection from the most selective index. Other equality
+        # conditions are checked by set membership, everything else by scanning
+        # the remaining candidates.
+        indexed = []
+        scans = []
+        for condition in conditions:
+            candidates = self._candidates(*condition)
+            if candidates is None:
+                scans.append(condition)
+            else:
+                indexed.append((candidates, condition))
+
+        if indexed:
+            indexed.sort(key=lambda item: len(item[0]))
+            positions = sorted(indexed[0][0])
+            for candidates, condition in indexed[1:]:
+                if isinstance(candidates, set):
+                    positions = [p for p in positions if p in candidates]
+                else:
+                    scans.append(condition)
+        else:
+            positions = range(len(self._rows))
+        rows = [
+            self._rows[position]
+            for position in positions
+            if all(
+                _matches(_row_value(self._rows[position], field), operator, value)
+                for field, operator, value in scans
+            )
+        ]
+
+        if order:
+            rows = self._sort(rows, order)
+        if offset:
+            rows = rows[offset:]
+        if limit is not None:
+            rows = rows[:limit]
+        return rows
+
+    @staticmethod
+    def _sort(rows: List[Any], order: str) -> List[Any]:
+        field, _, direction = order.partition(":")
+
+        def sort_key(row):
+            value = _row_value(row, field)
+            if value is None:
+                return (0, 0, "")
+            number = _number(value)
+            if number is None:
+                return (2, 0, _format_value(value))
+            return (1, number, "")
+
+        return sorted(rows, key=sort_key, reverse=direction.lower() == "desc")
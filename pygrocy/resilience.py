@@ -0,0 +1,173 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from typing import Callable, Iterable, Optional
+
+from .errors import CircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy(object):
+    """Exponential backoff with full jitter for idempotent requests.
+
+    The n-th retry waits a random time up to ``backoff_factor * 2 ** n``
+    seconds, capped at ``max_backoff``. A ``Retry-After`` header from the
+    server takes precedence when ``respect_retry_after`` is set.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        methods: Iterable[str] = ("GET",),
+        respect_retry_after: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.respect_retry_after = respect_retry_after
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        return method in self.methods and attempt < self.max_retries
+
+    def backoff(self, attempt: int, retry_after: str = None) -> float:
+        if self.respect_retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+
+        delay = min(self.backoff_factor * 2**attempt, self.max_backoff)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker(object):
+    """Fails fast while the Grocy server keeps failing.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests raise ``CircuitOpenError`` without touching the network. Once
+    ``reset_timeout`` has passed a single probe request is let through
+    (half-open); its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        on_state_change: Callable[[CircuitState, CircuitState], None] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._on_state_change = on_state_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        transition = None
+        with self._lock:
+            if self._state == CircuitState.OPEN and self._retry_after() <= 0:
+                transition = self._set_state(CircuitState.HALF_OPEN)
+            state = self._state
+        self._notify(transition)
+        return state
+
+    @property
+    def failure_count(self) -> int:
+        return self._failure_count
+
+    def _retry_after(self) -> float:
+        return self._reset_timeout - (self._clock() - self._opened_at)
+
+    def _set_state(self, state: CircuitState):
+        """Change the state under ``_lock`` and return the transition, if any.
+
+        Pass the result to ``_notify`` once the lock is released, so the
+        callback can use the breaker.
+        """
+        previous, self._state = self._state, state
+        if previous != state:
+            return previous, state
+        return None
+
+    def _notify(self, transition):
+        if transition is None:
+            return
+        previous, state = transition
+        _LOGGER.info("Grocy circuit breaker %s -> %s", previous.value, state.value)
+        if self._on_state_change is not None:
+            self._on_state_change(previous, state)
+
+    def before_request(self):
+        state = self.state
+        with self._lock:
+            if state == CircuitState.OPEN:
+                raise CircuitOpenError(self._retry_after())
+            if state == CircuitState.HALF_OPEN:
+                if self._probe_in_flight:
+                    raise CircuitOpenError(0)
+                self._probe_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self._failure_count = 0
+            self._probe_in_flight = False
+            transition = self._set_state(CircuitState.CLOSED)
+        self._notify(transition)
+
+    def release_probe(self):
+        """Let another probe through after one ended without an outcome."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failure_count += 1
+            self._probe_in_flight = False
+            threshold_reached = self._failure_count >= self._failure_threshold
+            transition = None
+            if threshold_reached or self._state == CircuitState.HALF_OPEN:
+                self._opened_at = self._clock()
+                transition = self._set_state(CircuitState.OPEN)
+        self._notify(transition)
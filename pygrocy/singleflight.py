@@ -0,0 +1,89 @@
+import threading
+from typing import Any, Callable, Hashable
+
+from .errors import DeadlineExceededError
+from .timeouts import current_deadline
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """Collapses concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while it
+    is in flight wait for it and receive the same result or exception.
+    Waiting callers still honour their own ``deadline``.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._coalesced = 0
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def coalesced(self) -> int:
+        """Calls that were answered by another caller's execution."""
+        return self._coalesced
+
+    @property
+    def coalesce_ratio(self) -> float:
+        return self._coalesced / self._requests if self._requests else 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        with self._lock:
+            self._requests += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            return self._wait(call)
+
+        try:
+            call.result = function()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+            call.done.set()
+        return call.result
+
+    @staticmethod
+    def _wait(call: _Call) -> Any:
+        deadline = current_deadline()
+        if deadline is None:
+            call.done.wait()
+        elif not call.done.wait(max(deadline.remaining(), 0)):
+            raise DeadlineExceededError(deadline.budget)
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def forget(self):
+        """Make later callers start new executions instead of joining.
+
+        Used after a write so no caller receives a result fetched before it.
+        """
+        with self._lock:
+            self._calls.clear()
@@ -0,0 +1,85 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Buffer(object):
+    """Decoded text from a chunk iterator, trimmed as elements are consumed."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        consumed, self.pos = self.pos, 0
+        self.text = self.text[consumed:]
+        for chunk in self._chunks:
+            if chunk:
+                self.text += self._decoder.decode(chunk)
+                return True
+        self.text += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return True
+
+    def next_char(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def decode_value(self) -> Any:
+        self.next_char()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.text) and not self.eof:
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a JSON array while it is being downloaded.
+
+    Only the current element and the unconsumed part of the last chunk are
+    held in memory. An empty body yields nothing, like an empty response does
+    for the list endpoints.
+    """
+    buffer = _Buffer(chunks)
+    first = buffer.next_char()
+    if first == "":
+        return
+    if first != "[":
+        raise ValueError(f"Expected a JSON array, got {first!r}")
+    buffer.pos += 1
+
+    if buffer.next_char() == "]":
+        return
+    while True:
+        yield buffer.decode_value()
+        separator = buffer.next_char()
+        buffer.pos += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
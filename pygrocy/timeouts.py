@@ -0,0 +1,91 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+
+from .errors import DeadlineExceededError
+
+DEFAULT_CONNECT_TIMEOUT = 10
+DEFAULT_READ_TIMEOUT = 60
+
+TimeoutPair = Tuple[Optional[float], Optional[float]]
+
+
+class RequestTimeouts(object):
+    """Connect and read timeouts, optionally overridden per endpoint class.
+
+    ``endpoints`` maps an endpoint prefix such as ``"files"`` or
+    ``"objects/products"`` to a ``(connect, read)`` pair; the longest
+    matching prefix wins.
+    """
+
+    def __init__(
+        self,
+        connect: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read: Optional[float] = DEFAULT_READ_TIMEOUT,
+        endpoints: Dict[str, TimeoutPair] = None,
+    ):
+        self.connect = connect
+        self.read = read
+        self._endpoints = sorted(
+            (endpoints or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def for_endpoint(self, end_url: str) -> TimeoutPair:
+        for prefix, timeout in self._endpoints:
+            if end_url == prefix or end_url.startswith(prefix + "/"):
+                return timeout
+        return self.connect, self.read
+
+
+class Deadline(object):
+    def __init__(self, budget: float, clock=time.monotonic):
+        self._budget = budget
+        self._clock = clock
+        self._expires_at = clock() + budget
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    def remaining(self) -> float:
+        return self._expires_at - self._clock()
+
+    def check(self):
+        if self.remaining() <= 0:
+            raise DeadlineExceededError(self._budget)
+
+    def clamp(self, timeout: TimeoutPair) -> TimeoutPair:
+        """Shorten ``timeout`` so the request can't outlive the deadline."""
+        self.check()
+        remaining = self.remaining()
+        return tuple(
+            remaining if part is None else min(part, remaining) for part in timeout
+        )
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "pygrocy_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(seconds: float):
+    """Bound every Grocy request made inside the block by one time budget.
+
+    Nested deadlines never extend the outer one. Once the budget is spent,
+    further requests raise ``DeadlineExceededError`` without being sent.
+    """
+    new_deadline = Deadline(seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.remaining() < new_deadline.remaining():
+        new_deadline = outer
+    token = _current_deadline.set(new_deadline)
+    try:
+        yield new_deadline
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,227 @@
+import asyncio
+import logging
+import threading
+from enum import Enum
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Set
+
+from requests.exceptions import RequestException
+
+from .diff import SnapshotDiff, SnapshotDiffer
+from .errors import CircuitOpenError, GrocyError
+
+if TYPE_CHECKING:
+    from .grocy import Grocy
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_INTERVAL = 5
+DEFAULT_MAX_INTERVAL = 300
+
+ChangeCallback = Callable[["Dataset", List[Any]], None]
+
+# Errors that mean the server can't be reached or refused the request.
+_UNAVAILABLE = (GrocyError, RequestException, CircuitOpenError)
+
+
+class Dataset(str, Enum):
+    STOCK = "stock"
+    CHORES = "chores"
+    TASKS = "tasks"
+    BATTERIES = "batteries"
+    SHOPPING_LIST = "shopping_list"
+    MEAL_PLAN = "meal_plan"
+
+
+_LOADERS = {
+    Dataset.STOCK: lambda grocy: grocy.stock(),
+    Dataset.CHORES: lambda grocy: grocy.chores(),
+    Dataset.TASKS: lambda grocy: grocy.tasks(),
+    Dataset.BATTERIES: lambda grocy: grocy.batteries(),
+    Dataset.SHOPPING_LIST: lambda grocy: grocy.shopping_list(),
+    Dataset.MEAL_PLAN: lambda grocy: grocy.meal_plan(),
+}
+
+
+class ChangeWatcher(object):
+    """Polls ``system/db-changed-time`` and refreshes subscribed datasets.
+
+    Only the cheap db-changed-time request is made while nothing changes.
+    The polling interval starts at ``min_interval``, grows by ``backoff``
+    after every idle poll up to ``max_interval`` and drops back to
+    ``min_interval`` as soon as a change is seen. Subscribers receive the
+    full new snapshot of their dataset, either through a callback or by
+    iterating ``updates()`` in asyncio code. A dataset whose refresh failed
+    is loaded again on the next poll.
+    """
+
+    def __init__(
+        self,
+        grocy: "Grocy",
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        backoff: float = 2,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must satisfy 0 < min_interval <= max_interval")
+        self._grocy = grocy
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._interval = min_interval
+        self._last_changed = None
+        self._snapshots: Dict[Dataset, List[Any]] = {}
+        self._failed: Set[Dataset] = set()
+        self._callbacks: Dict[Dataset, List[ChangeCallback]] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def interval(self) -> float:
+        """Seconds until the next poll."""
+        return self._interval
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def snapshot(self, dataset: Dataset) -> List[Any]:
+        return self._snapshots.get(Dataset(dataset))
+
+    def subscribe(
+        self, dataset: Dataset, callback: ChangeCallback
+    ) -> Callable[[], None]:
+        """Call ``callback(dataset, snapshot)`` on every change of ``dataset``.
+
+        Returns a function that removes the subscription.
+        """
+        dataset = Dataset(dataset)
+        with self._lock:
+            self._callbacks.setdefault(dataset, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                callbacks = self._callbacks.get(dataset, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+                if not callbacks:
+                    self._callbacks.pop(dataset, None)
+                    self._snapshots.pop(dataset, None)
+                    self._failed.discard(dataset)
+
+        return unsubscribe
+
+    def subscribe_diffs(
+        self, dataset: Dataset, callback: Callable[[Dataset, SnapshotDiff], None]
+    ) -> Callable[[], None]:
+        """Like ``subscribe``, but ``callback`` receives a row-level diff.
+
+        The first call reports every row as added; empty diffs are skipped.
+        """
+        differ = SnapshotDiffer()
+
+        def on_snapshot(changed_dataset, snapshot):
+            diff = differ.update(snapshot)
+            if diff:
+                callback(changed_dataset, diff)
+
+        return self.subscribe(dataset, on_snapshot)
+
+    async def updates(self, dataset: Dataset) -> AsyncIterator[List[Any]]:
+        """Yield every new snapshot of ``dataset`` in the running event loop."""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        unsubscribe = self.subscribe(
+            dataset,
+            lambda _, snapshot: loop.call_soon_threadsafe(queue.put_nowait, snapshot),
+        )
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            unsubscribe()
+
+    def poll(self) -> List[Dataset]:
+        """Check for changes once and return the datasets that were refreshed."""
+        with self._lock:
+            subscribed = list(self._callbacks)
+        try:
+            changed_time = self._grocy.get_last_db_changed()
+        except _UNAVAILABLE as error:
+            _LOGGER.warning("Polling db-changed-time failed: %s", error)
+            self._idle()
+            return []
+
+        changed = changed_time != self._last_changed
+        self._last_changed = changed_time
+        stale = [
+            dataset
+            for dataset in subscribed
+            if changed or dataset not in self._snapshots or dataset in self._failed
+        ]
+        refreshed = []
+        for dataset in stale:
+            try:
+                snapshot = _LOADERS[dataset](self._grocy)
+            except Exception as error:
+                if isinstance(error, _UNAVAILABLE):
+                    _LOGGER.warning("Refreshing %s failed: %s", dataset.value, error)
+                else:
+                    _LOGGER.exception("Refreshing %s failed", dataset.value)
+                with self._lock:
+                    if dataset in self._callbacks:
+                        self._failed.add(dataset)
+                continue
+            with self._lock:
+                self._failed.discard(dataset)
+                if dataset not in self._callbacks:
+                    continue
+                self._snapshots[dataset] = snapshot
+                callbacks = list(self._callbacks[dataset])
+            for callback in callbacks:
+                try:
+                    callback(dataset, snapshot)
+                except Exception:
+                    _LOGGER.exception("Change callback for %s failed", dataset.value)
+            refreshed.append(dataset)
+
+        if changed:
+            self._interval = self._min_interval
+        else:
+            self._idle()
+        return refreshed
+
+    def _idle(self):
+        self._interval = min(self._interval * self._backoff, self._max_interval)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                _LOGGER.exception("Polling Grocy for changes failed")
+                self._interval = self._max_interval
+            self._stop.wait(self._interval)
+
+    def start(self):
+        """Poll on a background thread until ``stop`` is called."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pygrocy-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
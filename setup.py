@@ -20,6 +20,9 @@ setuptools.setup(
         "deprecation~=2.1.0",
         "pydantic>=1.8.2,<1.11.0",
     ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
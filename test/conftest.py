@@ -1,14 +1,35 @@
-from test.test_const import CONST_BASE_URL, CONST_PORT, CONST_SSL
+import time
+from test.test_const import CONST_API_URL, CONST_BASE_URL, CONST_PORT, CONST_SSL
 from typing import List
 
 import pytest
+import responses
 
 from pygrocy import Grocy
 
 
 @pytest.fixture
-def grocy():
-    yield Grocy(CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT)
+def make_grocy():
+    """Build ``Grocy`` clients for the test server, closed after the test."""
+    clients = []
+
+    def make(**kwargs) -> Grocy:
+        grocy = Grocy(
+            CONST_BASE_URL, "demo_mode", verify_ssl=CONST_SSL, port=CONST_PORT, **kwargs
+        )
+        clients.append(grocy)
+        return grocy
+
+    yield make
+    for grocy in clients:
+        grocy.close()
+
+
+@pytest.fixture
+def grocy(make_grocy):
+    # vcrpy briefly unpatches the connection classes while opening a
+    # connection, so cassettes can only be replayed from one thread.
+    yield make_grocy(detail_workers=1)
 
 
 # noinspection PyProtectedMember
@@ -25,3 +46,60 @@ def vcr_config():
 @pytest.fixture
 def invalid_query_filter() -> List[str]:
     yield ["invalid"]
+
+
+@pytest.fixture
+def add_db_changed_time():
+    """Register a ``system/db-changed-time`` response with ``responses``."""
+
+    def add(changed_time: str = "2022-01-01 10:00:00"):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/system/db-changed-time",
+            json={"changed_time": changed_time},
+        )
+
+    return add
+
+
+@pytest.fixture
+def called_urls():
+    """The paths below ``/api/`` requested so far, in order."""
+
+    def urls() -> List[str]:
+        return [call.request.url.split("/api/", 1)[1] for call in responses.calls]
+
+    return urls
+
+
+@pytest.fixture
+def chore_details_payload():
+    """A minimal ``chores/<id>`` response body."""
+
+    def payload(chore_id: int) -> dict:
+        return {
+            "chore": {
+                "id": chore_id,
+                "name": f"Chore {chore_id}",
+                "period_type": "daily",
+                "track_date_only": "0",
+                "rollover": "0",
+                "userfields": None,
+            },
+            "track_count": 2,
+        }
+
+    return payload
+
+
+@pytest.fixture
+def wait_for():
+    """Poll ``condition`` until it is true, failing after ``timeout`` seconds."""
+
+    def wait(condition, timeout: float = 5):
+        deadline = time.monotonic() + timeout
+        while not condition():
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
+    return wait
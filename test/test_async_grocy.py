@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+from aiohttp import test_utils, web
+
+from pygrocy.async_grocy import AsyncGrocy
+from pygrocy.data_models.chore import Chore
+from pygrocy.errors import GrocyError
+
+
+def _run(routes, call, max_concurrency: int = 2):
+    async def run():
+        app = web.Application()
+        app.add_routes(routes)
+        async with test_utils.TestServer(app) as server:
+            async with AsyncGrocy(
+                "http://127.0.0.1",
+                "demo_mode",
+                port=server.port,
+                max_concurrency=max_concurrency,
+            ) as grocy:
+                return await call(grocy)
+
+    return asyncio.run(run())
+
+
+class TestAsyncGrocy:
+    def test_chores_with_details(self, chore_details_payload):
+        async def chores(request):
+            return web.json_response([{"chore_id": i} for i in (1, 2, 3)])
+
+        async def chore(request):
+            return web.json_response(
+                chore_details_payload(int(request.match_info["id"]))
+            )
+
+        routes = [web.get("/api/chores", chores), web.get("/api/chores/{id}", chore)]
+        chores = _run(routes, lambda grocy: grocy.chores(get_details=True))
+
+        assert [chore.id for chore in chores] == [1, 2, 3]
+        assert all(isinstance(chore, Chore) for chore in chores)
+        assert chores[1].name == "Chore 2"
+        assert chores[1].track_count == 2
+
+    def test_get_details_respects_concurrency_limit(self, chore_details_payload):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def chores(request):
+            return web.json_response([{"chore_id": i} for i in range(1, 7)])
+
+        async def chore(request):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return web.json_response(
+                chore_details_payload(int(request.match_info["id"]))
+            )
+
+        routes = [web.get("/api/chores", chores), web.get("/api/chores/{id}", chore)]
+        chores = _run(routes, lambda grocy: grocy.chores(get_details=True))
+
+        assert len(chores) == 6
+        assert max_in_flight == 2
+
+    def test_query_filters(self):
+        async def sections(request):
+            assert request.query.getall("query[]") == ["id=1"]
+            return web.json_response(
+                [
+                    {
+                        "id": 1,
+                        "name": "Breakfast",
+                        "sort_number": "",
+                        "row_created_timestamp": "2020-08-12 19:59:30",
+                    }
+                ]
+            )
+
+        routes = [web.get("/api/objects/meal_plan_sections", sections)]
+        section = _run(routes, lambda grocy: grocy.meal_plan_section(1))
+
+        assert section.name == "Breakfast"
+        assert section.sort_number is None
+
+    def test_error_response(self):
+        async def execute(request):
+            return web.json_response(
+                {"error_message": "Chore does not exist"}, status=400
+            )
+
+        routes = [web.post("/api/chores/1000/execute", execute)]
+        with pytest.raises(GrocyError) as exc_info:
+            _run(routes, lambda grocy: grocy.execute_chore(1000))
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.message == "Chore does not exist"
@@ -0,0 +1,170 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+
+from pygrocy.batching import BatchLoader
+from pygrocy.errors import GrocyError
+
+
+def _recipe(recipe_id: int) -> dict:
+    return {
+        "id": recipe_id,
+        "name": f"Recipe {recipe_id}",
+        "base_servings": 1,
+        "desired_servings": 1,
+        "picture_file_name": None,
+        "row_created_timestamp": "2022-01-01 10:00:00",
+    }
+
+
+def _load_concurrently(load, keys):
+    with ThreadPoolExecutor(len(keys)) as executor:
+        return list(executor.map(load, keys))
+
+
+class TestBatchLoader:
+    def test_concurrent_loads_share_one_batch(self):
+        batches = []
+
+        def batch(keys):
+            batches.append(sorted(keys))
+            return {key: key * 10 for key in keys}
+
+        loader = BatchLoader(batch, lambda key: pytest.fail("not batched"), 0.2)
+
+        assert _load_concurrently(loader.load, [1, 2, 3, 2]) == [10, 20, 30, 20]
+        assert batches == [[1, 2, 3]]
+        assert (loader.loads, loader.batches) == (4, 1)
+
+    def test_single_key_and_missing_keys_load_one(self):
+        loaded = []
+
+        def load_one(key):
+            loaded.append(key)
+            return -key
+
+        loader = BatchLoader(lambda keys: {1: 10}, load_one, 0.2)
+
+        assert loader.load(5) == -5
+        assert sorted(_load_concurrently(loader.load, [1, 2])) == [-2, 10]
+        assert sorted(loaded) == [2, 5]
+        assert loader.batches == 1
+
+    def test_failed_batch_loads_each_key(self):
+        def batch(keys):
+            raise ValueError("bulk tables unavailable")
+
+        loader = BatchLoader(batch, lambda key: key, 0.2)
+
+        assert _load_concurrently(loader.load, [1, 2, 3]) == [1, 2, 3]
+
+    def test_full_batch_is_dispatched_early(self):
+        started = threading.Event()
+
+        def batch(keys):
+            started.set()
+            return {key: key for key in keys}
+
+        loader = BatchLoader(batch, lambda key: key, window=30, max_batch_size=2)
+
+        assert _load_concurrently(loader.load, [1, 2]) == [1, 2]
+        assert started.is_set()
+
+
+class TestIdBatcher:
+    @responses.activate
+    def test_recipes_are_fetched_with_one_query(self, make_grocy, called_urls):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/recipes",
+            json=[_recipe(1), _recipe(2), _recipe(3)],
+        )
+        grocy = make_grocy(batch_window=0.2)
+
+        recipes = _load_concurrently(grocy.recipe, [3, 1, 2])
+
+        assert [recipe.name for recipe in recipes] == [
+            "Recipe 3",
+            "Recipe 1",
+            "Recipe 2",
+        ]
+        assert len(called_urls()) == 1
+        assert "recipes?query%5B%5D=id%C2%A7%5E%28" in called_urls()[0]
+
+    @responses.activate
+    def test_chores_are_joined_from_tables_filtered_by_id(
+        self, make_grocy, called_urls, chore_details_payload
+    ):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/chores",
+            json=[{"chore_id": 1}, {"chore_id": 2}],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/chores",
+            json=[chore_details_payload(1)["chore"], chore_details_payload(2)["chore"]],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/chores_log",
+            json=[
+                {
+                    "id": 1,
+                    "chore_id": 2,
+                    "tracked_time": "2022-01-01 10:00:00",
+                    "done_by_user_id": "3",
+                }
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/users",
+            json=[{"id": 3, "username": "ann", "display_name": "Ann"}],
+        )
+        grocy = make_grocy(batch_window=0.2)
+
+        chores = _load_concurrently(grocy.chore, [1, 2])
+
+        assert [chore.name for chore in chores] == ["Chore 1", "Chore 2"]
+        assert chores[1].last_done_by.username == "ann"
+        assert grocy._api_client.id_batcher.loaders["chore"].batches == 1
+        urls = called_urls()
+        assert len(urls) == 4
+        assert all("query%5B%5D=" in url for url in urls)
+        assert any("chore_id%C2%A7%5E%28" in url for url in urls)
+        assert any("users?query%5B%5D=id%C2%A7%5E%283%29%24" in url for url in urls)
+
+    def test_products_are_not_batched(self, make_grocy):
+        grocy = make_grocy(batch_window=0.2)
+
+        assert "product" not in grocy._api_client.id_batcher.loaders
+
+    @responses.activate
+    def test_missing_id_keeps_per_item_error(self, make_grocy):
+        responses.add(
+            responses.GET, f"{CONST_API_URL}/objects/meal_plan_sections", json=[]
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/recipes",
+            json=[_recipe(1)],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/recipes/2",
+            json={"error_message": "Not found"},
+            status=400,
+        )
+        grocy = make_grocy(batch_window=0.2)
+
+        def load(recipe_id):
+            try:
+                return grocy.recipe(recipe_id).name
+            except GrocyError as error:
+                return error.status_code
+
+        assert _load_concurrently(load, [1, 2]) == ["Recipe 1", 400]
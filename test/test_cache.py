@@ -0,0 +1,207 @@
+import threading
+from test.test_const import CONST_API_URL
+
+import responses
+
+from pygrocy import EntityType
+from pygrocy.cache import MISSING, CachePolicy, EntityCache, ResponseCache
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert (cache.hits, cache.misses) == (3, 1)
+
+    def test_validate_clears_on_change(self):
+        cache = ResponseCache()
+        cache.validate("2022-01-01 10:00:00", 0)
+        cache.set("a", 1)
+
+        cache.validate("2022-01-01 10:00:00", 1)
+        assert len(cache) == 1
+
+        cache.validate("2022-01-01 10:00:05", 2)
+        assert len(cache) == 0
+
+    def test_set_drops_values_fetched_before_a_change(self):
+        cache = ResponseCache()
+        cache.validate("2022-01-01 10:00:00", 0)
+        fetched_under = cache.db_changed_time
+
+        cache.validate("2022-01-01 10:00:05", 1)
+        cache.set("a", "stale", fetched_under)
+        cache.set("b", "fresh", cache.db_changed_time)
+
+        assert cache.get("a") is MISSING
+        assert cache.get("b") == "fresh"
+
+    def test_excluded_endpoints(self):
+        cache = ResponseCache(excluded_endpoints=["system/time"])
+        cache.exclude("stock/products")
+
+        assert not cache.is_cacheable("system/time")
+        assert not cache.is_cacheable("stock/products/1")
+        assert cache.is_cacheable("stock")
+
+    def test_validation_interval(self):
+        cache = ResponseCache(validation_interval=5)
+        assert cache.needs_validation(0)
+
+        cache.validate("2022-01-01 10:00:00", 10)
+        assert not cache.needs_validation(12)
+        assert cache.needs_validation(15)
+
+    @responses.activate
+    def test_grocy_reuses_responses_until_db_changes(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        cache = ResponseCache()
+        grocy = make_grocy(
+            response_cache=cache,
+        )
+        add_db_changed_time()
+        add_db_changed_time()
+        add_db_changed_time("2022-01-01 10:00:05")
+        responses.add(
+            responses.GET, f"{CONST_API_URL}/users", json=[{"id": 1, "username": "a"}]
+        )
+
+        grocy.users()
+        grocy.users()
+        assert called_urls() == [
+            "system/db-changed-time",
+            "users",
+            "system/db-changed-time",
+        ]
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        grocy.users()
+        assert called_urls()[3:] == ["system/db-changed-time", "users"]
+
+    @responses.activate
+    def test_grocy_does_not_cache_response_outdated_while_fetching(
+        self, make_grocy, add_db_changed_time
+    ):
+        cache = ResponseCache()
+        grocy = make_grocy(
+            response_cache=cache,
+        )
+        add_db_changed_time()
+
+        def users(request):
+            # Another thread sees the database change while this fetch runs.
+            cache.validate("2022-01-01 10:00:05", 1)
+            return 200, {}, '[{"id": 1, "username": "stale"}]'
+
+        responses.add_callback(responses.GET, f"{CONST_API_URL}/users", callback=users)
+
+        grocy.users()
+
+        assert len(cache) == 0
+
+    @responses.activate
+    def test_grocy_writes_clear_cache(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        cache = ResponseCache(validation_interval=60)
+        grocy = make_grocy(
+            response_cache=cache,
+        )
+        add_db_changed_time()
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/locations", json=[])
+        responses.add(responses.POST, f"{CONST_API_URL}/objects/locations", json={})
+
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+        grocy.add_generic(EntityType.LOCATIONS, {"name": "Fridge"})
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+
+        assert called_urls() == [
+            "system/db-changed-time",
+            "objects/locations",
+            "objects/locations",
+            "system/db-changed-time",
+            "objects/locations",
+        ]
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEntityCache:
+    def test_ttl_and_stale_while_revalidate(self):
+        clock = _Clock()
+        cache = EntityCache(
+            {EntityType.LOCATIONS: CachePolicy(ttl=10, stale_while_revalidate=5)},
+            clock=clock,
+        )
+        loads = []
+
+        def loader():
+            loads.append(clock.now)
+            return len(loads)
+
+        assert cache.get_or_load("locations", (), loader) == 1
+        clock.now = 9
+        assert cache.get_or_load("locations", (), loader) == 1
+
+        clock.now = 12
+        assert cache.get_or_load("locations", (), loader) == 1
+        for thread in threading.enumerate():
+            if thread.name == "pygrocy-cache-refresh":
+                thread.join(1)
+        assert cache.get_or_load("locations", (), loader) == 2
+
+        clock.now = 100
+        assert cache.get_or_load("locations", (), loader) == 3
+
+    def test_max_entries(self):
+        cache = EntityCache({EntityType.LOCATIONS: CachePolicy(ttl=10, max_entries=1)})
+
+        cache.get_or_load("locations", ("id=1",), lambda: 1)
+        cache.get_or_load("locations", ("id=2",), lambda: 2)
+
+        assert cache.get_or_load("locations", ("id=1",), lambda: 3) == 3
+
+    def test_policy_lookup(self):
+        cache = EntityCache()
+
+        assert cache.has_policy("quantity_units")
+        assert not cache.has_policy("products")
+
+    @responses.activate
+    def test_grocy_generic_writes_invalidate(self, make_grocy, called_urls):
+        grocy = make_grocy(
+            entity_cache=EntityCache(),
+        )
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/locations", json=[])
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/products", json=[])
+        responses.add(responses.PUT, f"{CONST_API_URL}/objects/locations/1")
+
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+        grocy.get_generic_objects_for_type(EntityType.PRODUCTS)
+        grocy.get_generic_objects_for_type(EntityType.PRODUCTS)
+        grocy.update_generic(EntityType.LOCATIONS, 1, {"name": "Pantry"})
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+
+        assert called_urls() == [
+            "objects/locations",
+            "objects/products",
+            "objects/products",
+            "objects/locations/1",
+            "objects/locations",
+        ]
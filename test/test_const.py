@@ -1,3 +1,4 @@
 CONST_BASE_URL = "https://localhost"
 CONST_PORT = 443
 CONST_SSL = False
+CONST_API_URL = f"{CONST_BASE_URL}:{CONST_PORT}/api"
@@ -0,0 +1,72 @@
+from datetime import date
+
+from benchmarks._cassettes import DATA_MODELS, cassette_payloads
+from pygrocy.data_models.battery import Battery
+from pygrocy.data_models.chore import Chore
+from pygrocy.data_models.product import Product
+from pygrocy.decoding import DecodeMode, decode
+from pygrocy.grocy_api_client import (
+    CurrentBatteryResponse,
+    CurrentChoreResponse,
+    CurrentStockResponse,
+    ProductDetailsResponse,
+)
+
+
+def _rows(model):
+    return [
+        row for payload, rows in cassette_payloads() if payload is model for row in rows
+    ]
+
+
+class TestDataModelViews:
+    def test_views_read_the_same_values_in_every_decode_mode(self):
+        for model, rows in cassette_payloads():
+            data_model = DATA_MODELS.get(model)
+            if data_model is None:
+                continue
+            for row in rows:
+                expected = data_model(decode(model, row, DecodeMode.VALIDATED))
+                for mode in (DecodeMode.TRUSTED, DecodeMode.LAZY):
+                    actual = data_model(decode(model, row, mode))
+                    assert actual.as_dict() == expected.as_dict()
+
+    def test_lazy_product_decodes_only_read_fields(self):
+        response = decode(
+            CurrentStockResponse, _rows(CurrentStockResponse)[0], DecodeMode.LAZY
+        )
+
+        product = Product(response)
+
+        assert product.available_amount == response.amount
+        assert set(response.__dict__) == {"product_id", "product", "amount"}
+
+    def test_product_details_update_keeps_stock_values(self):
+        stock = CurrentStockResponse(**_rows(CurrentStockResponse)[0])
+        details = ProductDetailsResponse(**_rows(ProductDetailsResponse)[0])
+        product = Product(stock)
+
+        product._update_from_ProductDetailsResponse(details)
+
+        assert product.name == details.product.name
+        assert product.available_amount == details.stock_amount
+        assert product.best_before_date == stock.best_before_date
+        assert product.amount_opened == stock.amount_opened
+        assert product.default_quantity_unit_purchase is None
+
+    def test_views_without_details(self):
+        chore = Chore(CurrentChoreResponse(chore_id=3))
+        battery = Battery(
+            CurrentBatteryResponse(id=2, last_tracked_time="2022-01-01 10:00:00")
+        )
+
+        assert (chore.id, chore.name, chore.period_type) == (3, None, None)
+        assert battery.id == 2
+        assert battery.name is None
+        assert battery.last_tracked_time.date() == date(2022, 1, 1)
+
+    def test_data_models_have_no_instance_dict(self):
+        for model, rows in cassette_payloads():
+            data_model = DATA_MODELS.get(model)
+            if data_model is not None and rows:
+                assert not hasattr(data_model(model(**rows[0])), "__dict__")
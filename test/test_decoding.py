@@ -0,0 +1,186 @@
+import json
+import pickle
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+from pydantic import ValidationError
+
+from benchmarks._cassettes import cassette_payloads
+from pygrocy.decoding import DecodeMode, decode, decode_list
+from pygrocy.grocy_api_client import (
+    CurrentStockResponse,
+    SystemConfigDto,
+    TaskResponse,
+    UserDto,
+)
+
+CONFIG_ROW = {
+    "USER_USERNAME": "admin",
+    "BASE_PATH": "",
+    "BASE_URL": "/",
+    "MODE": "demo",
+    "DEFAULT_LOCALE": "en",
+    "LOCALE": "en",
+    "CURRENCY": "EUR",
+    "FEATURE_FLAG_STOCK": True,
+    "CALENDAR_FIRST_DAY_OF_WEEK": "",
+}
+
+
+def _assert_same(validated, trusted):
+    assert type(trusted) is type(validated)
+    assert trusted == validated
+    assert trusted.__fields_set__ == validated.__fields_set__
+    assert list(trusted.__dict__) == list(validated.__dict__)
+
+
+class TestDecoding:
+    def test_trusted_matches_validated_for_cassettes(self):
+        decoded = 0
+        for model, rows in cassette_payloads():
+            for row in rows:
+                _assert_same(
+                    decode(model, row, DecodeMode.VALIDATED),
+                    decode(model, row, DecodeMode.TRUSTED),
+                )
+                decoded += 1
+        assert decoded > 100
+
+    def test_empty_strings_and_aliases(self):
+        row = {
+            "id": 1,
+            "name": "Taxes",
+            "due_date": "",
+            "done": "0",
+            "category_id": "",
+            "assigned_to_user_id": "2",
+        }
+
+        task = decode(TaskResponse, row, DecodeMode.TRUSTED)
+
+        _assert_same(TaskResponse(**row), task)
+        assert (task.due_date, task.category_id, task.assigned_to_user_id) == (
+            None,
+            None,
+            2,
+        )
+
+    def test_root_validator_and_extras(self):
+        row = dict(CONFIG_ROW)
+
+        config = decode(SystemConfigDto, row, DecodeMode.TRUSTED)
+
+        _assert_same(SystemConfigDto(**row), config)
+        assert config.feature_flags == {"FEATURE_FLAG_STOCK": True}
+        assert "feature_flags" not in row
+
+    def test_invalid_data_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            decode(TaskResponse, {"id": "one", "name": "Taxes", "done": 0}, "trusted")
+        with pytest.raises(ValidationError):
+            decode_list(UserDto, [{"username": "admin"}], DecodeMode.TRUSTED)
+
+    @responses.activate
+    def test_grocy_trusted_mode(self, make_grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json=[{"id": "1", "name": "Taxes", "done": "1", "due_date": ""}],
+        )
+        grocy = make_grocy(
+            decode_mode=DecodeMode.TRUSTED,
+        )
+
+        tasks = grocy.tasks()
+
+        assert (tasks[0].id, tasks[0].done, tasks[0].due_date) == (1, True, None)
+
+
+class TestLazyDecoding:
+    def test_lazy_matches_validated_for_cassettes(self):
+        for model, rows in cassette_payloads():
+            for row in rows:
+                validated = decode(model, row, DecodeMode.VALIDATED)
+                lazy = decode(model, row, DecodeMode.LAZY)
+                assert isinstance(lazy, model)
+                assert lazy == validated
+                assert lazy.__fields_set__ == validated.__fields_set__
+                assert list(lazy.__dict__) == list(validated.__dict__)
+
+    def test_fields_decoded_on_first_access(self):
+        row = {"id": "1", "name": "Taxes", "done": "1", "due_date": ""}
+
+        task = decode(TaskResponse, row, DecodeMode.LAZY)
+
+        assert task.__dict__ == {}
+        assert (task.id, task.done, task.due_date) == (1, True, None)
+        assert task.__dict__ == {"id": 1, "done": True, "due_date": None}
+        assert task.__fields_set__ == {"id", "name", "done", "due_date"}
+        assert task.description is None
+
+    def test_nested_models_are_lazy(self):
+        rows = [
+            row
+            for model, rows in cassette_payloads()
+            if model is CurrentStockResponse
+            for row in rows
+        ]
+
+        stock = decode_list(CurrentStockResponse, rows, DecodeMode.LAZY)
+
+        assert stock[0].product.__dict__ == {}
+        assert stock[0].product.name == CurrentStockResponse(**rows[0]).product.name
+
+    def test_invalid_field_raises_on_access(self):
+        task = decode(
+            TaskResponse, {"id": "one", "name": "Taxes", "done": 0}, DecodeMode.LAZY
+        )
+
+        assert task.name == "Taxes"
+        with pytest.raises(ValidationError):
+            task.id
+
+    def test_missing_required_field_raises_immediately(self):
+        with pytest.raises(ValidationError):
+            decode(TaskResponse, {"id": 1, "done": 0}, DecodeMode.LAZY)
+
+    def test_root_validated_models_decode_eagerly(self):
+        config = decode(SystemConfigDto, CONFIG_ROW, DecodeMode.LAZY)
+
+        assert type(config) is SystemConfigDto
+
+    def test_pickle_and_copy(self):
+        task = decode(TaskResponse, {"id": 1, "name": "Taxes", "done": 0}, "lazy")
+
+        restored = pickle.loads(pickle.dumps(task))
+
+        assert type(restored) is TaskResponse
+        assert restored == task
+        assert task.copy(update={"name": "Bills"}).name == "Bills"
+
+    @responses.activate
+    def test_grocy_lazy_mode(self, make_grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json=[{"id": "1", "name": "Taxes", "done": "1", "due_date": ""}],
+        )
+        grocy = make_grocy(
+            decode_mode=DecodeMode.LAZY,
+        )
+
+        tasks = grocy.tasks()
+
+        assert (tasks[0].id, tasks[0].done, tasks[0].due_date) == (1, True, None)
+
+
+class TestInterning:
+    def test_low_cardinality_strings_are_interned(self):
+        payload = json.dumps({"id": 1, "username": "admin", "display_name": "Ad Min"})
+        for mode in DecodeMode:
+            first = decode(UserDto, json.loads(payload), mode)
+            second = decode(UserDto, json.loads(payload), mode)
+
+            assert first.username is second.username
+            assert first.display_name is second.display_name
@@ -0,0 +1,258 @@
+import json
+import re
+import threading
+from test.test_const import CONST_API_URL
+from urllib.parse import parse_qs, urlparse
+
+import responses
+
+from pygrocy import DetailsMode
+from pygrocy.details import DetailsFetcher
+
+
+class _Item(object):
+    def __init__(self, item_id: int, fail: bool = False):
+        self.id = item_id
+        self.fail = fail
+        self.thread = None
+
+    def get_details(self, api_client):
+        self.thread = threading.current_thread().name
+        if self.fail:
+            raise ValueError(self.id)
+
+
+class TestDetailsFetcher:
+    def test_sequential_fetch_reports_errors(self):
+        errors = []
+        items = [_Item(1), _Item(2, fail=True), _Item(3)]
+
+        DetailsFetcher(1, lambda item, error: errors.append(item.id)).fetch(items, None)
+
+        assert errors == [2]
+        assert all(item.thread == threading.current_thread().name for item in items)
+
+    def test_parallel_fetch_reports_errors_in_order(self):
+        errors = []
+        items = [_Item(i, fail=i % 3 == 0) for i in range(1, 10)]
+        fetcher = DetailsFetcher(4, lambda item, error: errors.append(item.id))
+
+        fetcher.fetch(items, None)
+        fetcher.close()
+
+        assert errors == [3, 6, 9]
+        assert all(item.thread.startswith("pygrocy-details") for item in items)
+
+    def test_default_fetches_in_parallel(self):
+        items = [_Item(i) for i in range(1, 4)]
+        fetcher = DetailsFetcher()
+
+        fetcher.fetch(items, None)
+        fetcher.close()
+
+        assert fetcher.max_workers > 1
+        assert all(item.thread.startswith("pygrocy-details") for item in items)
+
+    @responses.activate
+    def test_grocy_chores_parallel_details(self, make_grocy, chore_details_payload):
+        errors = []
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/chores",
+            json=[{"chore_id": i} for i in range(1, 6)],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/chores/4",
+            json={"error_message": "Chore does not exist"},
+            status=400,
+        )
+
+        def chore_details(request):
+            chore_id = int(request.url.rsplit("/", 1)[-1])
+            return 200, {}, json.dumps(chore_details_payload(chore_id))
+
+        responses.add_callback(
+            responses.GET, re.compile(rf"{CONST_API_URL}/chores/\d+"), chore_details
+        )
+
+        with make_grocy(
+            detail_workers=3,
+            detail_error_handler=lambda item, error: errors.append(item.id),
+        ) as grocy:
+            chores = grocy.chores(get_details=True)
+
+        assert [chore.id for chore in chores] == [1, 2, 3, 4, 5]
+        assert [chore.name for chore in chores] == [
+            "Chore 1",
+            "Chore 2",
+            "Chore 3",
+            None,
+            "Chore 5",
+        ]
+        assert errors == [4]
+
+    @responses.activate
+    def test_grocy_chores_join_details(self, make_grocy, chore_details_payload):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/chores",
+            json=[
+                {"chore_id": 1, "last_tracked_time": "2022-01-02 10:00:00"},
+                {"chore_id": 2},
+                {"chore_id": 3},
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/chores",
+            json=[
+                dict(
+                    chore_details_payload(chore_id)["chore"],
+                    next_execution_assigned_to_user_id="2",
+                )
+                for chore_id in (1, 2)
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/chores_log",
+            json=[
+                {"id": 1, "chore_id": 1, "tracked_time": "2022-01-01 10:00:00"},
+                {
+                    "id": 2,
+                    "chore_id": 1,
+                    "tracked_time": "2022-01-02 10:00:00",
+                    "done_by_user_id": "2",
+                },
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/users",
+            json=[{"id": 1, "username": "alice"}, {"id": 2, "username": "bob"}],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/chores/3",
+            json=chore_details_payload(3),
+            status=200,
+        )
+
+        grocy = make_grocy(
+            details_mode=DetailsMode.JOIN,
+        )
+        chores = grocy.chores(get_details=True)
+
+        assert len(responses.calls) == 5
+        log_request = responses.calls[2].request
+        assert log_request.path_url.startswith("/api/objects/chores_log?")
+        assert parse_qs(urlparse(log_request.url).query)["query[]"] == [
+            "undone=0",
+            "chore_id§^(1|2|3)$",
+        ]
+        assert [chore.name for chore in chores] == ["Chore 1", "Chore 2", "Chore 3"]
+        assert chores[0].track_count == 2
+        assert chores[0].last_done_by.username == "bob"
+        assert chores[0].next_execution_assigned_user.username == "bob"
+        assert chores[1].track_count == 0
+        assert chores[1].last_done_by is None
+
+    @responses.activate
+    def test_grocy_join_falls_back_to_per_item(self, make_grocy):
+        responses.add(responses.GET, f"{CONST_API_URL}/batteries", json=[{"id": 1}])
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/batteries", status=400)
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/batteries/1",
+            json={
+                "battery": {
+                    "id": 1,
+                    "name": "Remote",
+                    "description": "",
+                    "used_in": "TV",
+                    "charge_interval_days": 30,
+                    "row_created_timestamp": "2022-01-01 10:00:00",
+                },
+                "charge_cycles_count": 4,
+            },
+        )
+
+        grocy = make_grocy(
+            details_mode=DetailsMode.JOIN,
+        )
+        batteries = grocy.batteries(get_details=True)
+
+        assert batteries[0].name == "Remote"
+        assert batteries[0].charge_cycles_count == 4
+
+    @responses.activate
+    def test_grocy_shopping_list_join_details(self, make_grocy):
+        timestamp = "2022-01-01 10:00:00"
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/shopping_list",
+            json=[
+                {
+                    "id": 1,
+                    "product_id": "7",
+                    "amount": "2",
+                    "row_created_timestamp": timestamp,
+                    "shopping_list_id": "1",
+                    "done": "0",
+                },
+                {
+                    "id": 2,
+                    "note": "Something sweet",
+                    "amount": "1",
+                    "row_created_timestamp": timestamp,
+                    "shopping_list_id": "1",
+                    "done": "0",
+                },
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/products",
+            json=[
+                {
+                    "id": "7",
+                    "name": "Milk",
+                    "location_id": "",
+                    "product_group_id": "3",
+                    "qu_id_stock": "1",
+                    "qu_id_purchase": "2",
+                    "row_created_timestamp": timestamp,
+                    "min_stock_amount": "0",
+                    "default_best_before_days": "5",
+                }
+            ],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/product_barcodes",
+            json=[{"id": 1, "product_id": "7", "barcode": "4001", "amount": None}],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/quantity_units",
+            json=[
+                {"id": 1, "name": "Piece", "row_created_timestamp": timestamp},
+                {"id": 2, "name": "Pack", "row_created_timestamp": timestamp},
+            ],
+        )
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/locations", json=[])
+        responses.add(responses.GET, f"{CONST_API_URL}/stock", json=[])
+
+        grocy = make_grocy(
+            details_mode=DetailsMode.JOIN,
+        )
+        shopping_list = grocy.shopping_list(get_details=True)
+
+        product = shopping_list[0].product
+        assert product.name == "Milk"
+        assert product.product_group_id == 3
+        assert product.barcodes == ["4001"]
+        assert product.available_amount == 0
+        assert product.default_quantity_unit_purchase.name == "Pack"
+        assert shopping_list[1].product is None
@@ -0,0 +1,113 @@
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+
+from pygrocy.data_models.task import Task
+from pygrocy.diff import SnapshotDiffer, diff_snapshots
+from pygrocy.grocy_api_client import TaskResponse
+from pygrocy.watcher import Dataset
+
+OLD = [
+    {"id": 1, "name": "Fridge", "is_freezer": "0"},
+    {"id": 2, "name": "Freezer", "is_freezer": "1"},
+    {"id": 3, "name": "Pantry", "is_freezer": "0"},
+]
+NEW = [
+    {"id": 3, "name": "Pantry", "is_freezer": "0"},
+    {"id": 1, "name": "Fridge", "is_freezer": "0", "description": "Kitchen"},
+    {"id": 4, "name": "Cellar", "is_freezer": "0"},
+]
+
+
+class TestSnapshotDiff:
+    def test_added_removed_changed(self):
+        diff = diff_snapshots(OLD, NEW)
+
+        assert diff.added == [NEW[2]]
+        assert diff.removed == [OLD[1]]
+        assert [change.key for change in diff.changed] == [1]
+        assert diff.changed[0].fields == {"description": (None, "Kitchen")}
+        assert diff.changed[0].old is OLD[0]
+        assert diff.changed[0].new is NEW[1]
+
+    def test_identical_snapshots(self):
+        diff = diff_snapshots(OLD, [dict(row) for row in reversed(OLD)])
+
+        assert not diff
+        assert (diff.added, diff.removed, diff.changed) == ([], [], [])
+
+    def test_data_models(self):
+        old = [Task(TaskResponse(id=1, name="Taxes", done=0))]
+        new = [Task(TaskResponse(id=1, name="Taxes", done=1))]
+
+        diff = diff_snapshots(old, new)
+
+        assert diff.changed[0].fields == {"done": (0, 1)}
+
+    def test_data_model_fields_are_computed_once_per_row(self, monkeypatch):
+        calls = []
+        as_dict = Task.as_dict
+
+        def counting_as_dict(task):
+            calls.append(task.id)
+            return as_dict(task)
+
+        monkeypatch.setattr(Task, "as_dict", counting_as_dict)
+        rows = [Task(TaskResponse(id=i, name="Taxes", done=0)) for i in (1, 2)]
+
+        SnapshotDiffer().update(rows)
+
+        assert calls == [1, 2]
+
+    def test_custom_key_and_duplicates(self):
+        rows = [{"product_id": 1, "amount": 2}, {"product_id": 1, "amount": 3}]
+
+        with pytest.raises(ValueError):
+            diff_snapshots([], rows, key="product_id")
+        diff = diff_snapshots(rows[:1], rows[1:], key=lambda row: row["product_id"])
+        assert diff.changed[0].fields == {"amount": (2, 3)}
+
+    def test_differ_tracks_successive_snapshots(self):
+        differ = SnapshotDiffer()
+
+        assert differ.update(OLD).added == OLD
+        assert differ.update(NEW).removed == [OLD[1]]
+        assert not differ.update(NEW)
+
+    def test_large_snapshot(self):
+        old = [{"id": i, "amount": i} for i in range(50000)]
+        new = [{"id": i, "amount": i + (i % 1000 == 0)} for i in range(1, 50001)]
+
+        diff = diff_snapshots(old, new)
+
+        assert len(diff.changed) == 49
+        assert [row["id"] for row in diff.added] == [50000]
+        assert [row["id"] for row in diff.removed] == [0]
+
+    @responses.activate
+    def test_watcher_diffs(self, make_grocy, add_db_changed_time):
+        add_db_changed_time("2022-01-01 10:00:00")
+        add_db_changed_time("2022-01-02 10:00:00")
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json=[{"id": 1, "name": "Taxes", "done": 0}],
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json=[
+                {"id": 1, "name": "Taxes", "done": 0},
+                {"id": 2, "name": "Vacuum", "done": 0},
+            ],
+        )
+        grocy = make_grocy()
+        watcher = grocy.watch()
+        diffs = []
+        watcher.subscribe_diffs(Dataset.TASKS, lambda _, diff: diffs.append(diff))
+
+        watcher.poll()
+        watcher.poll()
+
+        assert [[task.id for task in diff.added] for diff in diffs] == [[1], [2]]
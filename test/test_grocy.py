@@ -152,6 +152,56 @@ class TestGrocy(TestCase):
             responses.GET, f"{self.base_url}/stock/volatile", json=resp, status=200
         )
 
+    @responses.activate
+    def test_volatile_stock_single_request(self):
+        resp = {
+            "due_products": [],
+            "overdue_products": [],
+            "expired_products": [],
+            "missing_products": [
+                {
+                    "id": "2",
+                    "name": "Cheese",
+                    "amount_missing": "1",
+                    "is_partly_in_stock": "0",
+                }
+            ],
+        }
+        responses.add(
+            responses.GET, f"{self.base_url}/stock/volatile", json=resp, status=200
+        )
+
+        volatile_stock = self.grocy.volatile_stock()
+
+        self.assertEqual(len(responses.calls), 1)
+        self.assertEqual(volatile_stock.due_products, [])
+        self.assertEqual(volatile_stock.missing_products[0].name, "Cheese")
+
+    @responses.activate
+    def test_volatile_stock_memo(self):
+        resp = {"due_products": [], "expired_products": [], "missing_products": []}
+        responses.add(
+            responses.GET, f"{self.base_url}/stock/volatile", json=resp, status=200
+        )
+        grocy = Grocy(
+            CONST_BASE_URL,
+            "demo_mode",
+            verify_ssl=CONST_SSL,
+            port=CONST_PORT,
+            volatile_stock_ttl=60,
+        )
+
+        grocy.volatile_stock()
+        grocy.due_products()
+        grocy.expired_products()
+        grocy.missing_products()
+        self.assertEqual(len(responses.calls), 1)
+
+        fetched_at, response = grocy._volatile_stock_memo
+        grocy._volatile_stock_memo = (fetched_at - 61, response)
+        grocy.due_products()
+        self.assertEqual(len(responses.calls), 2)
+
     @responses.activate
     def test_get_userfields_valid(self):
         resp = {"uf1": 0, "uf2": "string"}
@@ -1,3 +1,7 @@
+from unittest.mock import patch
+
+import responses
+
 from pygrocy.grocy_api_client import GrocyApiClient
 
 
@@ -21,3 +25,49 @@ class TestGrocyApiClient:
             api_key="", base_url="http://grocy.de", path="my/custom/path"
         )
         assert client._base_url == "http://grocy.de:9192/my/custom/path/api/"
+
+    @responses.activate
+    def test_requests_share_pooled_session(self):
+        client = GrocyApiClient(api_key="", base_url="http://grocy.de")
+        responses.add(responses.GET, "http://grocy.de:9192/api/users", json=[])
+
+        with patch.object(
+            client._session, "request", wraps=client._session.request
+        ) as request:
+            client.get_users()
+            client.get_users()
+
+        assert request.call_count == 2
+
+    def test_pool_settings(self):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", pool_connections=2, pool_maxsize=4
+        )
+        adapter = client._session.get_adapter("https://grocy.de")
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 4
+
+    def test_context_manager_closes_session(self):
+        client = GrocyApiClient(api_key="", base_url="http://grocy.de")
+
+        with patch.object(client._session, "close") as close:
+            with client:
+                pass
+
+        close.assert_called_once()
+
+    @responses.activate
+    def test_idle_connections_are_evicted(self):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", pool_idle_timeout=30
+        )
+        responses.add(responses.GET, "http://grocy.de:9192/api/users", json=[])
+        adapter = client._session.get_adapter("http://grocy.de")
+
+        with patch.object(adapter, "close") as close:
+            client.get_users()
+            client._last_request_time -= 60
+            client.get_users()
+
+        close.assert_called_once()
@@ -0,0 +1,187 @@
+from test.test_const import CONST_API_URL
+
+import pytest
+import requests
+import responses
+
+from pygrocy import EntityType
+from pygrocy.mirror import GrocyMirror
+
+LOCATIONS = [
+    {"id": 1, "name": "Fridge", "is_freezer": "0", "userfields": {"shelf": "2"}},
+    {"id": 2, "name": "Freezer", "is_freezer": "1", "userfields": None},
+]
+CHORES = [
+    {
+        "chore_id": 1,
+        "chore_name": "Vacuum",
+        "next_estimated_execution_time": "2022-05-01 10:00:00",
+        "track_date_only": "0",
+    }
+]
+
+
+def _add_datasets(locations=LOCATIONS):
+    responses.add(responses.GET, f"{CONST_API_URL}/objects/locations", json=locations)
+    responses.add(responses.GET, f"{CONST_API_URL}/objects/tasks", json=[])
+    responses.add(responses.GET, f"{CONST_API_URL}/chores", json=CHORES)
+
+
+def _mirror(path=":memory:") -> GrocyMirror:
+    return GrocyMirror(
+        str(path),
+        entity_types=[EntityType.LOCATIONS, EntityType.TASKS],
+        views={"view_chores": "chores"},
+    )
+
+
+class TestGrocyMirror:
+    @responses.activate
+    def test_initial_sync_and_sql(self, make_grocy, add_db_changed_time):
+        add_db_changed_time()
+        _add_datasets()
+        mirror = _mirror()
+
+        changed = make_grocy(mirror=mirror).sync_mirror()
+
+        assert changed == ["locations", "tasks", "view_chores"]
+        assert mirror.db_changed_time == "2022-01-01 10:00:00"
+        assert mirror.execute(
+            "SELECT name FROM locations WHERE is_freezer = ? ORDER BY id", ["1"]
+        ) == [("Freezer",)]
+        assert mirror.execute("SELECT userfields FROM locations WHERE id = 1") == [
+            ('{"shelf": "2"}',)
+        ]
+
+    @responses.activate
+    def test_reads_are_served_from_mirror(self, make_grocy, add_db_changed_time):
+        add_db_changed_time()
+        _add_datasets()
+        grocy = make_grocy(mirror=_mirror())
+        grocy.sync_mirror()
+        responses.calls.reset()
+
+        locations = grocy.get_generic_objects_for_type(
+            EntityType.LOCATIONS, ["is_freezer=1"]
+        )
+        chores = grocy.chores()
+
+        assert locations == [LOCATIONS[1]]
+        assert chores[0].id == 1
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_unchanged_server_skips_sync(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        _add_datasets()
+        grocy = make_grocy(mirror=_mirror())
+        grocy.sync_mirror()
+        responses.calls.reset()
+
+        assert grocy.sync_mirror() == []
+        assert called_urls() == ["system/db-changed-time"]
+
+    @responses.activate
+    def test_only_changed_tables_are_rewritten(self, make_grocy, add_db_changed_time):
+        add_db_changed_time("2022-01-01 10:00:00")
+        add_db_changed_time("2022-01-02 10:00:00")
+        _add_datasets()
+        _add_datasets(LOCATIONS[:1])
+        grocy = make_grocy(mirror=_mirror())
+        grocy.sync_mirror()
+
+        assert grocy.sync_mirror() == ["locations"]
+        assert grocy.get_generic_objects_for_type(EntityType.LOCATIONS) == [
+            LOCATIONS[0]
+        ]
+
+    @responses.activate
+    def test_writes_bypass_mirror_until_next_sync(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        _add_datasets()
+        responses.add(responses.POST, f"{CONST_API_URL}/objects/locations", json={})
+        mirror = _mirror()
+        grocy = make_grocy(mirror=mirror)
+        grocy.sync_mirror()
+
+        grocy.add_generic(EntityType.LOCATIONS, {"name": "Pantry"})
+        responses.calls.reset()
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+
+        assert mirror.stale
+        assert called_urls() == ["objects/locations"]
+
+    @responses.activate
+    def test_failing_dataset_is_skipped(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        responses.add(
+            responses.GET, f"{CONST_API_URL}/objects/locations", json=LOCATIONS
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/tasks",
+            json={"error_message": "Not allowed"},
+            status=400,
+        )
+        responses.add(responses.GET, f"{CONST_API_URL}/chores", json=CHORES)
+        mirror = _mirror()
+        grocy = make_grocy(mirror=mirror)
+
+        assert grocy.sync_mirror() == ["locations", "view_chores"]
+        assert mirror.db_changed_time is None
+
+        _add_datasets()
+        responses.calls.reset()
+        grocy.get_generic_objects_for_type(EntityType.TASKS)
+        assert called_urls() == ["objects/tasks"]
+
+        assert grocy.sync_mirror() == ["tasks"]
+        assert mirror.db_changed_time == "2022-01-01 10:00:00"
+
+    @responses.activate
+    def test_connection_error_keeps_sync_pending(self, make_grocy, add_db_changed_time):
+        add_db_changed_time()
+        _add_datasets()
+        mirror = _mirror()
+        grocy = make_grocy(mirror=mirror)
+        grocy.sync_mirror()
+        add_db_changed_time("2022-01-02 10:00:00")
+        responses.replace(
+            responses.GET,
+            f"{CONST_API_URL}/chores",
+            body=requests.ConnectionError("unreachable"),
+        )
+
+        assert grocy.sync_mirror() == []
+        assert mirror.db_changed_time == "2022-01-01 10:00:00"
+        assert mirror.execute("SELECT name FROM mirror_datasets ORDER BY name") == [
+            ("locations",),
+            ("tasks",),
+        ]
+
+    def test_sync_without_mirror(self, make_grocy):
+        with pytest.raises(ValueError):
+            make_grocy().sync_mirror()
+
+    @responses.activate
+    def test_mirror_persists(
+        self, tmp_path, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        _add_datasets()
+        with _mirror(tmp_path / "grocy.sqlite") as mirror:
+            make_grocy(mirror=mirror).sync_mirror()
+        responses.calls.reset()
+
+        with _mirror(tmp_path / "grocy.sqlite") as mirror:
+            grocy = make_grocy(mirror=mirror)
+            assert grocy.sync_mirror() == []
+            assert len(grocy.get_generic_objects_for_type(EntityType.LOCATIONS)) == 2
+
+        assert called_urls() == ["system/db-changed-time"]
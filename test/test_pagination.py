@@ -0,0 +1,104 @@
+import threading
+from test.test_const import CONST_API_URL
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from pygrocy import EntityType
+from pygrocy.data_models.task import Task
+from pygrocy.pagination import Paginator
+
+
+class _Table:
+    def __init__(self, rows: int):
+        self.rows = list(range(rows))
+        self.calls = []
+        self.threads = []
+
+    def __call__(self, limit: int, offset: int):
+        self.calls.append((limit, offset))
+        self.threads.append(threading.current_thread().name)
+        return self.rows[offset:][:limit]
+
+
+def _query(call) -> dict:
+    return parse_qs(urlparse(call.request.url).query)
+
+
+class TestPaginator:
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iterates_all_rows(self, prefetch):
+        table = _Table(25)
+
+        assert list(Paginator(table, page_size=10, prefetch=prefetch)) == table.rows
+        assert table.calls == [(10, 0), (10, 10), (10, 20)]
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_exact_multiple_needs_one_empty_page(self, prefetch):
+        table = _Table(20)
+
+        pages = list(Paginator(table, page_size=10, prefetch=prefetch).pages())
+
+        assert [len(page) for page in pages] == [10, 10]
+        assert table.calls[-1] == (10, 20)
+
+    def test_stops_early(self):
+        table = _Table(100)
+
+        for row in Paginator(table, page_size=10):
+            if row == 15:
+                break
+
+        assert table.calls == [(10, 0), (10, 10)]
+
+    def test_prefetch_runs_in_background(self):
+        table = _Table(15)
+
+        list(Paginator(table, page_size=10, prefetch=True))
+
+        assert all(name.startswith("pygrocy-prefetch") for name in table.threads)
+
+    def test_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            Paginator(_Table(1), page_size=0)
+
+
+class TestGrocyPagination:
+    @responses.activate
+    def test_generic_objects_use_limit_offset_and_order(self, grocy):
+        url = f"{CONST_API_URL}/objects/products"
+        responses.add(responses.GET, url, json=[{"id": 1}, {"id": 2}])
+        responses.add(responses.GET, url, json=[{"id": 3}])
+
+        rows = grocy.paginate_generic_objects(
+            EntityType.PRODUCTS, ["active=1"], order="name:desc", page_size=2
+        )
+
+        assert [row["id"] for row in rows] == [1, 2, 3]
+        assert _query(responses.calls[0]) == {
+            "query[]": ["active=1"],
+            "order": ["name:desc"],
+            "limit": ["2"],
+        }
+        assert _query(responses.calls[1])["offset"] == ["2"]
+
+    @responses.activate
+    def test_tasks(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json=[
+                {
+                    "id": 1,
+                    "name": "Task",
+                    "done": 0,
+                    "row_created_timestamp": "2022-01-01 10:00:00",
+                }
+            ],
+        )
+
+        tasks = list(grocy.paginate_tasks(page_size=5))
+
+        assert isinstance(tasks[0], Task)
+        assert _query(responses.calls[0]) == {"limit": ["5"]}
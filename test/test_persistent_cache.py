@@ -0,0 +1,215 @@
+import multiprocessing
+import os
+from test.test_const import CONST_API_URL
+
+import responses
+
+from pygrocy.cache import MISSING
+from pygrocy.persistent_cache import DiskResponseCache, SharedResponseCache
+
+
+class TestDiskResponseCache:
+    def test_entries_survive_restart(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path))
+        cache.validate("2022-01-01 10:00:00", 0)
+        cache.set(("users", ()), [{"id": 1, "username": "admin"}])
+
+        restarted = DiskResponseCache(str(tmp_path))
+
+        assert len(restarted) == 1
+        assert restarted.get(("users", ())) == [{"id": 1, "username": "admin"}]
+        assert restarted.get(("tasks", ())) is MISSING
+        assert (restarted.hits, restarted.misses) == (1, 1)
+
+    def test_changed_db_time_drops_persisted_entries(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path))
+        cache.validate("2022-01-01 10:00:00", 0)
+        cache.set("key", {"a": 1})
+
+        restarted = DiskResponseCache(str(tmp_path))
+        restarted.validate("2022-01-02 10:00:00", 0)
+
+        assert len(restarted) == 0
+        assert restarted.size == 0
+        assert os.listdir(tmp_path) == ["meta.json"]
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        value = [str(i) * 20 for i in range(200)]
+        cache = DiskResponseCache(str(tmp_path), compression_level=0)
+        cache.set("probe", value)
+        entry_size = cache.size
+        cache.clear()
+
+        cache = DiskResponseCache(
+            str(tmp_path), max_bytes=entry_size * 2, compression_level=0
+        )
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.get("a")
+        cache.set("c", value)
+
+        assert cache.peek("a") == value
+        assert cache.peek("b") is MISSING
+        assert cache.peek("c") == value
+        assert cache.size <= entry_size * 2
+
+    def test_corrupt_entry_is_dropped(self, tmp_path):
+        cache = DiskResponseCache(str(tmp_path))
+        cache.set("key", [1, 2, 3])
+        (entry,) = [name for name in os.listdir(tmp_path) if name.endswith(".z")]
+        (tmp_path / entry).write_bytes(b"garbage")
+
+        restarted = DiskResponseCache(str(tmp_path))
+
+        assert restarted.get("key") is MISSING
+        assert len(restarted) == 0
+
+    def test_entry_written_under_older_time_is_ignored(self, tmp_path):
+        worker = DiskResponseCache(str(tmp_path))
+        worker.validate("2022-01-01 10:00:00", 0)
+        restarted = DiskResponseCache(str(tmp_path))
+        restarted.validate("2022-01-02 10:00:00", 0)
+        worker.set("key", "stale")
+
+        assert DiskResponseCache(str(tmp_path)).get("key") is MISSING
+        assert restarted.get("key") is MISSING
+        assert len(restarted) == 0
+
+    @responses.activate
+    def test_restarted_client_is_warm_after_one_validation(
+        self, tmp_path, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/users",
+            json=[{"id": 1, "username": "admin", "display_name": "Admin"}],
+        )
+        make_grocy(response_cache=DiskResponseCache(str(tmp_path))).users()
+        responses.calls.reset()
+
+        users = make_grocy(response_cache=DiskResponseCache(str(tmp_path))).users()
+
+        assert users[0].display_name == "Admin"
+        assert called_urls() == ["system/db-changed-time"]
+
+
+def _share_worker(path, worker, results):
+    cache = SharedResponseCache(path)
+    cache.validate("2022-01-01 10:00:00", 0)
+    cache.set(("worker", worker), list(range(worker * 100)))
+    seen = [cache.get(("worker", other)) for other in range(4)]
+    results.put((worker, [value is not MISSING for value in seen]))
+    cache.close()
+
+
+class TestSharedResponseCache:
+    def test_instances_share_entries(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        first = SharedResponseCache(path)
+        second = SharedResponseCache(path)
+        first.validate("2022-01-01 10:00:00", 0)
+        second.validate("2022-01-01 10:00:00", 0)
+
+        first.set(("users", ()), [{"id": 1}])
+
+        assert second.get(("users", ())) == [{"id": 1}]
+        assert len(second) == 1
+
+    def test_changed_db_time_clears_for_every_instance(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        first = SharedResponseCache(path)
+        second = SharedResponseCache(path)
+        first.validate("2022-01-01 10:00:00", 0)
+        first.set("key", {"a": 1})
+
+        second.validate("2022-01-02 10:00:00", 0)
+
+        assert first.get("key") is MISSING
+        first.validate("2022-01-02 10:00:00", 0)
+        second.set("key", {"a": 2})
+        assert first.get("key") == {"a": 2}
+
+    def test_set_after_another_instance_cleared_is_dropped(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        first = SharedResponseCache(path)
+        second = SharedResponseCache(path)
+        first.validate("2022-01-01 10:00:00", 0)
+        second.validate("2022-01-02 10:00:00", 0)
+
+        first.set("fetched", "stale", "2022-01-01 10:00:00")
+        first.set("untagged", "stale")
+
+        assert second.get("fetched") is MISSING
+        assert second.get("untagged") is MISSING
+        assert len(second) == 0
+
+    def test_entries_from_another_time_are_not_served(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        cache = SharedResponseCache(path)
+        cache.validate("2022-01-01 10:00:00", 0)
+        cache.set("key", "value")
+        cache._connect().execute(
+            "UPDATE cache_entries SET changed_time = '2021-12-31 10:00:00'"
+        )
+
+        assert cache.get("key") is MISSING
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        clock = iter(range(100)).__next__
+        value = [str(i) * 20 for i in range(200)]
+        cache = SharedResponseCache(
+            str(tmp_path / "cache.sqlite"), compression_level=0, clock=clock
+        )
+        cache.set("probe", value)
+        entry_size = cache.size
+        cache.clear()
+        cache._max_bytes = entry_size * 2
+
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.set("a", value)
+        cache.set("c", value)
+
+        assert cache.peek("b") is MISSING
+        assert cache.peek("a") == value
+        assert cache.peek("c") == value
+
+    def test_concurrent_processes(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        SharedResponseCache(path).close()
+        results = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_share_worker, args=(path, i, results))
+            for i in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        seen = dict(results.get(timeout=30) for _ in workers)
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert all(seen[worker][worker] for worker in range(4))
+        assert len(SharedResponseCache(path)) == 4
+
+    @responses.activate
+    def test_grocy_workers_share_responses(
+        self, tmp_path, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/users",
+            json=[{"id": 1, "username": "admin", "display_name": "Admin"}],
+        )
+        path = str(tmp_path / "cache.sqlite")
+
+        make_grocy(response_cache=SharedResponseCache(path)).users()
+        make_grocy(response_cache=SharedResponseCache(path)).users()
+
+        assert called_urls() == [
+            "system/db-changed-time",
+            "users",
+            "system/db-changed-time",
+        ]
@@ -0,0 +1,120 @@
+from datetime import date, datetime
+from test.test_const import CONST_API_URL
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from pygrocy import EntityType, Operator, Query
+from pygrocy.grocy_api_client import BatteryData, ChoreData, TaskResponse
+from pygrocy.query import normalize_query
+
+
+class TestQuery:
+    def test_compiles_conditions(self):
+        query = (
+            Query(TaskResponse)
+            .where("done", "=", False)
+            .where("due_date", Operator.LESS, date(2022, 5, 1))
+            .where("name", "~", "clean")
+        )
+
+        assert query.filters() == ["done=0", "due_date<2022-05-01", "name~clean"]
+
+    def test_value_formatting(self):
+        query = (
+            Query()
+            .where("tracked_time", ">=", datetime(2022, 1, 2, 3, 4, 5))
+            .where("entity", "=", EntityType.PRODUCTS)
+            .where("id", "§", "^(1|2)$")
+        )
+
+        assert query.filters() == [
+            "tracked_time>=2022-01-02 03:04:05",
+            "entity=products",
+            "id§^(1|2)$",
+        ]
+
+    def test_builder_returns_new_queries(self):
+        base = Query(TaskResponse).where("done", "=", 0)
+        ordered = base.order_by("due_date", descending=True).paginate(10, 20)
+
+        assert base.order is None
+        assert ordered.filters() == ["done=0"]
+        assert (ordered.order, ordered.limit, ordered.offset) == (
+            "due_date:desc",
+            10,
+            20,
+        )
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError):
+            Query(ChoreData).where("nmae", "=", "Vacuum")
+        with pytest.raises(ValueError):
+            Query(ChoreData).order_by("nmae")
+
+    def test_fields_compile_to_aliases(self):
+        query = (
+            Query(BatteryData)
+            .where("created_timestamp", ">", "2022-01-01")
+            .where("row_created_timestamp", "<", "2023-01-01")
+            .order_by("created_timestamp", descending=True)
+        )
+
+        assert query.filters() == [
+            "row_created_timestamp>2022-01-01",
+            "row_created_timestamp<2023-01-01",
+        ]
+        assert query.order == "row_created_timestamp:desc"
+
+    def test_invalid_value(self):
+        with pytest.raises(ValueError):
+            Query(ChoreData).where("id", "=", "abc")
+
+    def test_invalid_operator_and_field_name(self):
+        with pytest.raises(ValueError):
+            Query().where("id", "==", 1)
+        with pytest.raises(ValueError):
+            Query().where("id=1&x", "=", 1)
+
+    def test_normalize_query(self):
+        query = Query().where("id", ">", 3).order_by("name").paginate(limit=5)
+
+        assert normalize_query(["id=1"]) == (["id=1"], None, None, None)
+        assert normalize_query(query) == (["id>3"], "name", 5, None)
+        assert normalize_query(query, limit=10, offset=20) == (
+            ["id>3"],
+            "name",
+            10,
+            20,
+        )
+
+
+class TestQueryRequests:
+    @responses.activate
+    def test_query_is_sent_as_parameters(self, grocy):
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=[])
+
+        grocy.tasks(
+            Query(TaskResponse)
+            .where("done", "=", 0)
+            .order_by("due_date")
+            .paginate(limit=3)
+        )
+
+        assert parse_qs(urlparse(responses.calls[0].request.url).query) == {
+            "query[]": ["done=0"],
+            "order": ["due_date"],
+            "limit": ["3"],
+        }
+
+    @responses.activate
+    def test_generic_objects_accept_query(self, grocy):
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/chores", json=[])
+
+        grocy.get_generic_objects_for_type(
+            EntityType.CHORES, Query(ChoreData).where("id", "!=", 2)
+        )
+
+        query = parse_qs(urlparse(responses.calls[0].request.url).query)
+        assert query == {"query[]": ["id!=2"]}
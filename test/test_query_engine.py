@@ -0,0 +1,132 @@
+import random
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+
+from pygrocy import EntityType, Query
+from pygrocy.cache import EntityCache, ResponseCache
+from pygrocy.grocy_api_client import TaskResponse
+from pygrocy.query import Operator
+from pygrocy.query_engine import LocalTable, _matches, parse_filter
+
+TASKS = [
+    {"id": 1, "name": "Clean kitchen", "due_date": "2022-05-01", "done": "0"},
+    {"id": 2, "name": "Vacuum", "due_date": "2022-04-01", "done": "1"},
+    {"id": 3, "name": "clean bathroom", "due_date": None, "done": "0"},
+    {"id": 10, "name": "Taxes", "due_date": "2022-06-15", "done": "0"},
+]
+
+
+def _ids(rows):
+    return [row["id"] for row in rows]
+
+
+class TestLocalTable:
+    def test_parse_filter(self):
+        assert parse_filter("due_date<=2022-01-01") == (
+            "due_date",
+            Operator.LESS_OR_EQUAL,
+            "2022-01-01",
+        )
+        assert parse_filter("name!~a=b") == ("name", Operator.NOT_LIKE, "a=b")
+        with pytest.raises(ValueError):
+            parse_filter("no operator")
+
+    @pytest.mark.parametrize(
+        "query_filter, expected",
+        [
+            ("id=10", [10]),
+            ("id!=1", [2, 3, 10]),
+            ("id>2", [3, 10]),
+            ("id<=2", [1, 2]),
+            ("name~CLEAN", [1, 3]),
+            ("name!~clean", [2, 10]),
+            ("name§^[A-Z]", [1, 2, 10]),
+            ("due_date<2022-05-01", [2]),
+            ("due_date>=2022-05-01", [1, 10]),
+        ],
+    )
+    def test_operators(self, query_filter, expected):
+        assert _ids(LocalTable(TASKS).select([query_filter])) == expected
+
+    def test_numeric_comparison(self):
+        # "10" sorts before "2" as text, but Grocy compares numbers numerically.
+        assert _ids(LocalTable(TASKS).select(["id>=2", "id<10"])) == [2, 3]
+
+    def test_and_order_and_limit(self):
+        table = LocalTable(TASKS)
+
+        rows = table.select(["done=0"], order="due_date:desc", limit=2)
+
+        assert _ids(rows) == [10, 1]
+
+    def test_accepts_query(self):
+        query = Query(TaskResponse).where("done", "=", False).order_by("id", True)
+
+        assert _ids(LocalTable(TASKS).select(query)) == [10, 3, 1]
+
+    def test_model_rows(self):
+        rows = [TaskResponse(**task) for task in TASKS]
+
+        selected = LocalTable(rows).select(["due_date<2022-06-01"])
+
+        assert [row.id for row in selected] == [1, 2]
+
+    def test_indexes_agree_with_scan(self):
+        rng = random.Random(4)
+        values = [None, "", "a", "B", "10", "2", "2.5", "-1", "2022-01-01"]
+        rows = [{"id": i, "value": rng.choice(values)} for i in range(200)]
+        table = LocalTable(rows)
+
+        for operator in ("=", "<", "<=", ">", ">="):
+            for value in values[1:]:
+                expected = [
+                    row
+                    for row in rows
+                    if _matches(row["value"], Operator(operator), value)
+                ]
+                assert table.select([f"value{operator}{value}"]) == expected
+
+
+class TestLocalQueries:
+    @responses.activate
+    def test_filtered_requests_use_cached_response(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time()
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/meal_plan", json=[])
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        grocy = make_grocy(
+            response_cache=ResponseCache(validation_interval=60),
+            local_queries=True,
+        )
+
+        grocy.tasks()
+        due = grocy.tasks(["due_date<2022-05-02", "done=0"])
+        grocy.meal_plan(query_filters=["day>=2022-01-01"])
+
+        assert [task.id for task in due] == [1]
+        assert called_urls() == [
+            "system/db-changed-time",
+            "tasks",
+            "objects/meal_plan?query%5B%5D=day%3E%3D2022-01-01",
+        ]
+
+    @responses.activate
+    def test_filtered_master_data_uses_entity_cache(self, make_grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/locations",
+            json=[{"id": 1, "name": "Fridge"}, {"id": 2, "name": "Pantry"}],
+        )
+        grocy = make_grocy(
+            entity_cache=EntityCache(),
+            local_queries=True,
+        )
+
+        grocy.get_generic_objects_for_type(EntityType.LOCATIONS)
+        rows = grocy.get_generic_objects_for_type(EntityType.LOCATIONS, ["name~pan"])
+
+        assert rows == [{"id": 2, "name": "Pantry"}]
+        assert len(responses.calls) == 1
@@ -0,0 +1,284 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+import requests
+import responses
+
+from pygrocy.errors import CircuitOpenError, GrocyError
+from pygrocy.grocy_api_client import GrocyApiClient
+from pygrocy.resilience import CircuitBreaker, CircuitState, RetryPolicy
+
+USERS_URL = "http://grocy.de:9192/api/users"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy:
+    def test_only_idempotent_methods_are_retried(self):
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.can_retry("GET", 0)
+        assert policy.can_retry("GET", 1)
+        assert not policy.can_retry("GET", 2)
+        assert not policy.can_retry("POST", 0)
+
+    def test_exponential_backoff_without_jitter(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        assert [policy.backoff(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+
+    def test_jitter_stays_below_backoff(self):
+        policy = RetryPolicy(backoff_factor=1)
+
+        assert all(0 <= policy.backoff(3) <= 8 for _ in range(20))
+
+    def test_retry_after_header_takes_precedence(self):
+        policy = RetryPolicy(jitter=False)
+
+        assert policy.backoff(0, "7") == 7
+        assert policy.backoff(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+        assert policy.backoff(0, "not a date") == 0.5
+
+    def test_retry_after_can_be_ignored(self):
+        policy = RetryPolicy(jitter=False, respect_retry_after=False)
+
+        assert policy.backoff(0, "7") == 0.5
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.failure_count == 1
+
+    def test_half_open_allows_single_probe(self):
+        clock = FakeClock()
+        transitions = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout=10,
+            clock=clock,
+            on_state_change=lambda old, new: transitions.append((old, new)),
+        )
+
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.state == CircuitState.HALF_OPEN
+
+        breaker.before_request()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert transitions == [
+            (CircuitState.CLOSED, CircuitState.OPEN),
+            (CircuitState.OPEN, CircuitState.HALF_OPEN),
+            (CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+
+    def test_callback_can_read_state(self):
+        clock = FakeClock()
+        seen = []
+        breaker = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout=10,
+            clock=clock,
+            on_state_change=lambda old, new: seen.append(breaker.state),
+        )
+
+        def trip_and_recover():
+            breaker.record_failure()
+            clock.now = 10
+            breaker.before_request()
+            breaker.record_success()
+
+        worker = threading.Thread(target=trip_and_recover, daemon=True)
+        worker.start()
+        worker.join(5)
+
+        assert not worker.is_alive()
+        assert seen == [
+            CircuitState.OPEN,
+            CircuitState.HALF_OPEN,
+            CircuitState.CLOSED,
+        ]
+
+    def test_failed_probe_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 10
+        breaker.before_request()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError) as error:
+            breaker.before_request()
+        assert error.value.retry_after == 10
+
+
+@patch("pygrocy.grocy_api_client.time.sleep")
+class TestClientRetries:
+    @responses.activate
+    def test_get_is_retried_on_server_error(self, sleep):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", retry_policy=RetryPolicy()
+        )
+        responses.add(responses.GET, USERS_URL, status=503)
+        responses.add(responses.GET, USERS_URL, json=[])
+
+        assert client.get_users() == []
+        assert len(responses.calls) == 2
+        sleep.assert_called_once()
+
+    @responses.activate
+    def test_retry_after_header_is_respected(self, sleep):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", retry_policy=RetryPolicy()
+        )
+        responses.add(
+            responses.GET, USERS_URL, status=503, headers={"Retry-After": "3"}
+        )
+        responses.add(responses.GET, USERS_URL, json=[])
+
+        client.get_users()
+
+        sleep.assert_called_once_with(3)
+
+    @responses.activate
+    def test_connection_errors_are_retried(self, sleep):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", retry_policy=RetryPolicy()
+        )
+        responses.add(
+            responses.GET, USERS_URL, body=requests.ConnectionError("refused")
+        )
+        responses.add(responses.GET, USERS_URL, json=[])
+
+        assert client.get_users() == []
+
+    @responses.activate
+    def test_gives_up_after_max_retries(self, sleep):
+        client = GrocyApiClient(
+            api_key="",
+            base_url="http://grocy.de",
+            retry_policy=RetryPolicy(max_retries=2),
+        )
+        responses.add(responses.GET, USERS_URL, status=503)
+
+        with pytest.raises(GrocyError) as error:
+            client.get_users()
+
+        assert error.value.status_code == 503
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_post_is_not_retried(self, sleep):
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", retry_policy=RetryPolicy()
+        )
+        responses.add(
+            responses.POST, "http://grocy.de:9192/api/objects/tasks", status=503
+        )
+
+        with pytest.raises(GrocyError):
+            client.add_generic("tasks", {"name": "test"})
+
+        assert len(responses.calls) == 1
+        sleep.assert_not_called()
+
+    @responses.activate
+    def test_open_circuit_fails_fast(self, sleep):
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", circuit_breaker=breaker
+        )
+        responses.add(responses.GET, USERS_URL, status=500)
+
+        for _ in range(2):
+            with pytest.raises(GrocyError):
+                client.get_users()
+        with pytest.raises(CircuitOpenError):
+            client.get_users()
+
+        assert client.circuit_breaker.state == CircuitState.OPEN
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_client_errors_do_not_trip_circuit(self, sleep):
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", circuit_breaker=breaker
+        )
+        responses.add(responses.GET, USERS_URL, status=404)
+
+        with pytest.raises(GrocyError):
+            client.get_users()
+
+        assert breaker.state == CircuitState.CLOSED
+
+    @responses.activate
+    def test_probe_failing_with_any_request_error_reopens(self, sleep):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", circuit_breaker=breaker
+        )
+        breaker.record_failure()
+        clock.now = 10
+        responses.add(
+            responses.GET, USERS_URL, body=requests.exceptions.ChunkedEncodingError()
+        )
+        responses.add(responses.GET, USERS_URL, json=[])
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            client.get_users()
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now = 20
+        assert client.get_users() == []
+        assert breaker.state == CircuitState.CLOSED
+
+    @responses.activate
+    def test_probe_failing_with_other_error_releases_probe(self, sleep):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        client = GrocyApiClient(
+            api_key="", base_url="http://grocy.de", circuit_breaker=breaker
+        )
+        breaker.record_failure()
+        clock.now = 10
+        responses.add(responses.GET, USERS_URL, body=RuntimeError("adapter bug"))
+        responses.add(responses.GET, USERS_URL, json=[])
+
+        with pytest.raises(RuntimeError):
+            client.get_users()
+
+        assert client.get_users() == []
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,110 @@
+import io
+import json
+import socket
+
+from benchmarks._cassettes import DATA_MODELS, cassette_payloads
+from pygrocy.base import DataModel, as_dicts, dump_json
+from pygrocy.data_models.product import Product
+from pygrocy.grocy_api_client import ProductDetailsResponse
+
+
+class _Base(DataModel):
+    __slots__ = ("_id",)
+
+    def __init__(self, id):
+        self._id = id
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+
+class _Named(_Base):
+    __slots__ = ("_name", "_children")
+
+    def __init__(self, id, name, children=()):
+        super().__init__(id)
+        self._name = name
+        self._children = list(children)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def children(self):
+        return self._children
+
+
+def _data_models():
+    for model, rows in cassette_payloads():
+        data_model = DATA_MODELS.get(model)
+        if data_model is not None:
+            yield from (data_model(model(**row)) for row in rows)
+
+
+class TestSerialization:
+    def test_as_dict_includes_inherited_properties_and_lists(self):
+        named = _Named(1, "Parent", [_Named(2, "Child"), 3])
+
+        assert named.as_dict() == {
+            "id": 1,
+            "name": "Parent",
+            "children": [{"id": 2, "name": "Child", "children": []}, 3],
+        }
+
+    def test_as_dict_serializes_nested_barcodes(self):
+        rows = [
+            row
+            for model, rows in cassette_payloads()
+            if model is ProductDetailsResponse
+            for row in rows
+        ]
+        details = next(
+            ProductDetailsResponse(**row) for row in rows if row["product_barcodes"]
+        )
+
+        barcodes = Product(details).as_dict()["product_barcodes"]
+
+        assert barcodes[0] == {
+            "barcode": details.barcodes[0].barcode,
+            "amount": details.barcodes[0].amount,
+        }
+
+    def test_dump_json_matches_json_dumps(self):
+        models = list(_data_models())
+        output = io.StringIO()
+
+        dump_json(models, output, default=str)
+
+        assert len(models) > 100
+        assert output.getvalue() == json.dumps(as_dicts(models), default=str)
+
+    def test_to_json_matches_json_dumps(self):
+        named = _Named(1, "Ünïcode", [_Named(2, "Child")])
+
+        assert named.toJson() == json.dumps(named.as_dict())
+
+    def test_dump_json_empty_and_generator(self):
+        output = io.StringIO()
+        dump_json(iter([]), output)
+        assert output.getvalue() == "[]"
+
+        output = io.StringIO()
+        dump_json((_Named(i, f"n{i}") for i in range(2)), output)
+        assert json.loads(output.getvalue())[1] == {
+            "id": 1,
+            "name": "n1",
+            "children": [],
+        }
+
+    def test_dump_json_to_socket(self):
+        sender, receiver = socket.socketpair()
+        with sender, receiver:
+            with sender.makefile("w") as stream:
+                dump_json([_Named(1, "Sent")], stream)
+            sender.shutdown(socket.SHUT_WR)
+
+            received = receiver.makefile("r").read()
+
+        assert json.loads(received) == [{"id": 1, "name": "Sent", "children": []}]
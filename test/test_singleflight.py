@@ -0,0 +1,147 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+
+from pygrocy import EntityType
+from pygrocy.errors import DeadlineExceededError, GrocyError
+from pygrocy.singleflight import SingleFlight
+from pygrocy.timeouts import deadline
+
+TASKS = [{"id": 1, "name": "Taxes", "done": 0}]
+
+
+def _run_concurrently(function, count):
+    with ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(function) for _ in range(count)]
+        return [future.result() for future in futures]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self, wait_for):
+        flight = SingleFlight()
+        executions = []
+
+        def work():
+            executions.append(1)
+            wait_for(lambda: flight.coalesced == 3)
+            return object()
+
+        results = _run_concurrently(lambda: flight.do("key", work), 4)
+
+        assert len(executions) == 1
+        assert all(result is results[0] for result in results)
+        assert (flight.requests, flight.coalesced) == (4, 3)
+        assert flight.coalesce_ratio == 0.75
+        assert flight.in_flight == 0
+
+    def test_errors_are_shared(self, wait_for):
+        flight = SingleFlight()
+
+        def work():
+            wait_for(lambda: flight.coalesced == 1)
+            raise ValueError("boom")
+
+        def call():
+            with pytest.raises(ValueError):
+                flight.do("key", work)
+
+        _run_concurrently(call, 2)
+
+    def test_waiting_caller_honours_deadline(self, wait_for):
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=("key", release.wait))
+        leader.start()
+        wait_for(lambda: flight.in_flight == 1)
+
+        with pytest.raises(DeadlineExceededError):
+            with deadline(0.05):
+                flight.do("key", lambda: None)
+        release.set()
+        leader.join()
+
+    def test_forget_starts_new_execution(self, wait_for):
+        flight = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=flight.do, args=("key", release.wait))
+        leader.start()
+        wait_for(lambda: flight.in_flight == 1)
+
+        flight.forget()
+
+        assert flight.do("key", lambda: "fresh") == "fresh"
+        release.set()
+        leader.join()
+
+
+class TestClientCoalescing:
+    @responses.activate
+    def test_identical_gets_are_coalesced(self, make_grocy, called_urls, wait_for):
+        grocy = make_grocy()
+        flight = grocy.single_flight
+
+        def tasks(request):
+            wait_for(lambda: flight.coalesced == 3)
+            return 200, {}, '[{"id": 1, "name": "Taxes", "done": 0}]'
+
+        responses.add_callback(responses.GET, f"{CONST_API_URL}/tasks", callback=tasks)
+
+        results = _run_concurrently(grocy.tasks, 4)
+
+        assert [[task.id for task in tasks] for tasks in results] == [[1]] * 4
+        assert called_urls() == ["tasks"]
+
+    @responses.activate
+    def test_coalesced_callers_get_their_own_objects(
+        self, make_grocy, called_urls, wait_for
+    ):
+        grocy = make_grocy()
+        flight = grocy.single_flight
+
+        def locations(request):
+            wait_for(lambda: flight.coalesced == 1)
+            return 200, {}, '[{"id": 1, "name": "Fridge"}]'
+
+        responses.add_callback(
+            responses.GET, f"{CONST_API_URL}/objects/locations", callback=locations
+        )
+
+        first, second = _run_concurrently(
+            lambda: grocy.get_generic_objects_for_type(EntityType.LOCATIONS), 2
+        )
+        first[0]["name"] = "Changed"
+        first.append({"id": 2})
+
+        assert flight.coalesced == 1
+        assert second == [{"id": 1, "name": "Fridge"}]
+        assert called_urls() == ["objects/locations"]
+
+    @responses.activate
+    def test_different_params_are_not_coalesced(self, make_grocy):
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        grocy = make_grocy()
+
+        grocy.tasks(["done=0"])
+        grocy.tasks(["done=1"])
+
+        assert len(responses.calls) == 2
+        assert grocy.single_flight.coalesced == 0
+
+    @responses.activate
+    def test_disabled(self, make_grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json={"error_message": "Not allowed"},
+            status=400,
+        )
+        grocy = make_grocy(
+            coalesce_requests=False,
+        )
+
+        with pytest.raises(GrocyError):
+            grocy.tasks()
+        assert grocy.single_flight is None
@@ -0,0 +1,135 @@
+import json
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+
+from pygrocy import EntityType
+from pygrocy.data_models.product import Product, ShoppingListProduct
+from pygrocy.errors import GrocyError
+from pygrocy.streaming import iter_json_array
+
+ROWS = [
+    {"id": 1, "name": "Äpfel", "amount": 1.5, "tags": [1, 2]},
+    {"id": 22, "name": "Milch", "amount": None, "open": True},
+    123456,
+    "text with ] and , inside",
+]
+
+
+def _chunked(data: bytes, size: int):
+    view = memoryview(data)
+    return [bytes(view[i:][:size]) for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+    def test_any_chunking(self, chunk_size):
+        body = json.dumps(ROWS, indent=2).encode("utf-8")
+
+        assert list(iter_json_array(_chunked(body, chunk_size))) == ROWS
+
+    def test_empty_body_and_array(self):
+        assert list(iter_json_array([b""])) == []
+        assert list(iter_json_array([b" [ ] "])) == []
+
+    def test_number_split_across_chunks(self):
+        assert list(iter_json_array([b"[1", b"2,3", b"]"])) == [12, 3]
+
+    def test_yields_before_body_is_complete(self):
+        def chunks():
+            yield b'[{"id": 1},'
+            raise AssertionError("read too far")
+
+        assert next(iter_json_array(chunks())) == {"id": 1}
+
+    def test_rejects_non_array(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"id": 1}']))
+
+    def test_truncated_body(self):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array([b'[{"id": 1}, {"id"']))
+
+
+class TestStreamingEndpoints:
+    @responses.activate
+    def test_iter_generic_objects(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/stock_log",
+            json=[{"id": 1}, {"id": 2}],
+        )
+
+        rows = grocy.iter_generic_objects(EntityType.STOCK_LOG)
+
+        assert list(rows) == [{"id": 1}, {"id": 2}]
+        assert responses.calls[0].request.req_kwargs["stream"]
+
+    @responses.activate
+    def test_iter_shopping_list(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/shopping_list",
+            json=[
+                {
+                    "id": 1,
+                    "product_id": 3,
+                    "amount": "2",
+                    "row_created_timestamp": "2022-01-01 10:00:00",
+                    "shopping_list_id": 1,
+                    "done": 0,
+                }
+            ],
+        )
+
+        items = list(grocy.iter_shopping_list(["done=0"]))
+
+        assert len(items) == 1
+        assert isinstance(items[0], ShoppingListProduct)
+        assert items[0].product_id == 3
+        assert "query%5B%5D=done%3D0" in responses.calls[0].request.url
+
+    @responses.activate
+    def test_iter_stock(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/stock",
+            json=[
+                {
+                    "product_id": 4,
+                    "amount": "1",
+                    "best_before_date": "2022-12-31",
+                    "amount_opened": "0",
+                    "amount_aggregated": "1",
+                    "amount_opened_aggregated": "0",
+                    "is_aggregated_amount": "0",
+                    "product": {
+                        "id": 4,
+                        "name": "Milk",
+                        "qu_id_stock": 1,
+                        "qu_id_purchase": 1,
+                        "row_created_timestamp": "2022-01-01 10:00:00",
+                        "min_stock_amount": "0",
+                        "default_best_before_days": 0,
+                    },
+                }
+            ],
+        )
+
+        stock = list(grocy.iter_stock())
+
+        assert isinstance(stock[0], Product)
+        assert stock[0].name == "Milk"
+
+    @responses.activate
+    def test_error_status(self, grocy):
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/objects/stock_log",
+            json={"error_message": "Not allowed"},
+            status=400,
+        )
+
+        with pytest.raises(GrocyError):
+            list(grocy.iter_generic_objects(EntityType.STOCK_LOG))
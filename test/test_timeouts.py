@@ -0,0 +1,117 @@
+import json
+import re
+import time
+from test.test_const import CONST_API_URL
+
+import pytest
+import requests
+import responses
+
+from pygrocy.errors import DeadlineExceededError
+from pygrocy.grocy_api_client import GrocyApiClient
+from pygrocy.timeouts import Deadline, RequestTimeouts, current_deadline, deadline
+
+USERS_URL = "http://grocy.de:9192/api/users"
+
+
+class TestRequestTimeouts:
+    def test_longest_prefix_wins(self):
+        timeouts = RequestTimeouts(
+            connect=1,
+            read=2,
+            endpoints={"objects": (3, 4), "objects/products": (5, 6)},
+        )
+
+        assert timeouts.for_endpoint("system/info") == (1, 2)
+        assert timeouts.for_endpoint("objects/locations") == (3, 4)
+        assert timeouts.for_endpoint("objects/products") == (5, 6)
+        assert timeouts.for_endpoint("objects/products/1") == (5, 6)
+        assert timeouts.for_endpoint("objectsfoo") == (1, 2)
+
+    @responses.activate
+    def test_client_passes_timeouts(self):
+        client = GrocyApiClient(
+            api_key="",
+            base_url="http://grocy.de",
+            timeouts=RequestTimeouts(connect=1, read=2, endpoints={"users": (3, 4)}),
+        )
+        responses.add(responses.GET, USERS_URL, json=[])
+        responses.add(responses.GET, "http://grocy.de:9192/api/tasks", json=[])
+
+        client.get_users()
+        client.get_tasks()
+
+        assert responses.calls[0].request.req_kwargs["timeout"] == (3, 4)
+        assert responses.calls[1].request.req_kwargs["timeout"] == (1, 2)
+
+
+class TestDeadline:
+    def test_clamps_timeouts_to_remaining_budget(self):
+        clock = iter([0, 8, 8]).__next__
+        budget = Deadline(10, clock=clock)
+
+        assert budget.clamp((5, None)) == (2, 2)
+
+    def test_nested_deadline_never_extends_outer(self):
+        with deadline(1) as outer:
+            with deadline(60) as inner:
+                assert inner is outer
+                assert current_deadline() is outer
+        assert current_deadline() is None
+
+    @responses.activate
+    def test_expired_deadline_fails_without_request(self):
+        client = GrocyApiClient(api_key="", base_url="http://grocy.de")
+        responses.add(responses.GET, USERS_URL, json=[])
+
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError):
+                client.get_users()
+
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_timeout_after_deadline_raises_deadline_error(self):
+        client = GrocyApiClient(api_key="", base_url="http://grocy.de")
+
+        def slow_timeout(request):
+            time.sleep(0.05)
+            raise requests.ReadTimeout()
+
+        responses.add_callback(responses.GET, USERS_URL, slow_timeout)
+
+        with deadline(0.01):
+            with pytest.raises(DeadlineExceededError) as error:
+                client.get_users()
+
+        assert isinstance(error.value, requests.Timeout)
+
+    @pytest.mark.parametrize("detail_workers", [1, 4])
+    @responses.activate
+    def test_composite_call_aborts_remaining_requests(
+        self, detail_workers, make_grocy, chore_details_payload
+    ):
+        grocy = make_grocy(
+            detail_workers=detail_workers,
+        )
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/chores",
+            json=[{"chore_id": i} for i in range(1, 21)],
+        )
+
+        def chore_details(request):
+            time.sleep(0.05)
+            chore_id = int(request.url.rsplit("/", 1)[-1])
+            return 200, {}, json.dumps(chore_details_payload(chore_id))
+
+        responses.add_callback(
+            responses.GET, re.compile(rf"{CONST_API_URL}/chores/\d+"), chore_details
+        )
+
+        with grocy:
+            with deadline(0.12):
+                with pytest.raises(DeadlineExceededError):
+                    grocy.chores(get_details=True)
+
+        assert len(responses.calls) < 21
@@ -0,0 +1,169 @@
+import asyncio
+import time
+from test.test_const import CONST_API_URL
+
+import pytest
+import responses
+
+from pygrocy.resilience import CircuitBreaker, RetryPolicy
+from pygrocy.watcher import ChangeWatcher, Dataset
+
+TASKS = [{"id": 1, "name": "Taxes", "done": "0"}]
+
+
+class TestChangeWatcher:
+    @responses.activate
+    def test_refreshes_only_after_change(
+        self, make_grocy, add_db_changed_time, called_urls
+    ):
+        add_db_changed_time("2022-01-01 10:00:00")
+        add_db_changed_time("2022-01-01 10:00:00")
+        add_db_changed_time("2022-01-02 10:00:00")
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        watcher = make_grocy().watch()
+        received = []
+        watcher.subscribe(Dataset.TASKS, lambda dataset, rows: received.append(rows))
+
+        assert watcher.poll() == [Dataset.TASKS]
+        assert watcher.poll() == []
+        assert watcher.poll() == [Dataset.TASKS]
+
+        assert [[task.id for task in rows] for rows in received] == [[1], [1]]
+        assert called_urls() == [
+            "system/db-changed-time",
+            "tasks",
+            "system/db-changed-time",
+            "system/db-changed-time",
+            "tasks",
+        ]
+
+    @responses.activate
+    def test_failed_refresh_is_retried_on_next_poll(
+        self, make_grocy, add_db_changed_time
+    ):
+        add_db_changed_time("2022-01-01 10:00:00")
+        add_db_changed_time("2022-01-02 10:00:00")
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        responses.add(
+            responses.GET,
+            f"{CONST_API_URL}/tasks",
+            json={"error_message": "Not allowed"},
+            status=400,
+        )
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=[])
+        watcher = make_grocy().watch()
+        received = []
+        watcher.subscribe(Dataset.TASKS, lambda dataset, rows: received.append(rows))
+
+        assert watcher.poll() == [Dataset.TASKS]
+        assert watcher.poll() == []
+        assert watcher.poll() == [Dataset.TASKS]
+        assert watcher.poll() == []
+
+        assert [[task.id for task in rows] for rows in received] == [[1], []]
+
+    @responses.activate
+    def test_adaptive_interval(self, make_grocy, add_db_changed_time):
+        add_db_changed_time("2022-01-01 10:00:00")
+        watcher = ChangeWatcher(make_grocy(), min_interval=1, max_interval=5)
+
+        intervals = []
+        for _ in range(5):
+            watcher.poll()
+            intervals.append(watcher.interval)
+
+        assert intervals == [1, 2, 4, 5, 5]
+
+    @responses.activate
+    def test_new_subscription_is_loaded_without_change(
+        self, make_grocy, add_db_changed_time
+    ):
+        add_db_changed_time()
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        responses.add(responses.GET, f"{CONST_API_URL}/objects/meal_plan", json=[])
+        watcher = make_grocy().watch()
+        watcher.subscribe(Dataset.TASKS, lambda *_: None)
+        watcher.poll()
+
+        watcher.subscribe(Dataset.MEAL_PLAN, lambda *_: None)
+
+        assert watcher.poll() == [Dataset.MEAL_PLAN]
+        assert watcher.snapshot(Dataset.MEAL_PLAN) == []
+
+    @responses.activate
+    def test_unsubscribe_and_failing_callback(self, make_grocy, add_db_changed_time):
+        add_db_changed_time()
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        watcher = make_grocy().watch()
+        received = []
+
+        def failing(dataset, rows):
+            raise RuntimeError("boom")
+
+        watcher.subscribe(Dataset.TASKS, failing)
+        unsubscribe = watcher.subscribe(
+            Dataset.TASKS, lambda dataset, rows: received.append(dataset)
+        )
+        watcher.poll()
+        unsubscribe()
+
+        assert received == [Dataset.TASKS]
+        assert watcher.snapshot(Dataset.TASKS) is not None
+
+    @responses.activate
+    def test_open_circuit_keeps_thread_alive(self, make_grocy, wait_for):
+        responses.add(
+            responses.GET, f"{CONST_API_URL}/system/db-changed-time", status=503
+        )
+        grocy = make_grocy(
+            retry_policy=RetryPolicy(max_retries=0),
+            circuit_breaker=CircuitBreaker(failure_threshold=1),
+        )
+        watcher = ChangeWatcher(grocy, min_interval=0.01, max_interval=0.01)
+
+        with watcher:
+            wait_for(lambda: len(responses.calls) == 1)
+            time.sleep(0.05)
+            assert watcher.running
+
+        assert watcher.poll() == []
+        assert len(responses.calls) == 1
+
+    def test_unexpected_error_backs_off_and_keeps_polling(self, make_grocy, wait_for):
+        watcher = ChangeWatcher(make_grocy(), min_interval=0.01, max_interval=0.05)
+        polls = []
+
+        def poll():
+            polls.append(watcher.interval)
+            raise RuntimeError("boom")
+
+        watcher.poll = poll
+        with watcher:
+            wait_for(lambda: len(polls) >= 2)
+            assert watcher.running
+
+        assert polls[:2] == [0.01, 0.05]
+
+    @responses.activate
+    def test_async_updates(self, make_grocy, add_db_changed_time):
+        add_db_changed_time()
+        responses.add(responses.GET, f"{CONST_API_URL}/tasks", json=TASKS)
+        watcher = ChangeWatcher(make_grocy(), min_interval=0.01, max_interval=0.01)
+
+        async def first_update():
+            updates = watcher.updates(Dataset.TASKS)
+            pending = asyncio.ensure_future(updates.__anext__())
+            await asyncio.sleep(0)
+            with watcher:
+                rows = await asyncio.wait_for(pending, 5)
+            await updates.aclose()
+            return rows
+
+        rows = asyncio.run(first_update())
+
+        assert rows[0].name == "Taxes"
+        assert watcher.snapshot(Dataset.TASKS) is None
+
+    def test_invalid_intervals(self):
+        with pytest.raises(ValueError):
+            ChangeWatcher(None, min_interval=10, max_interval=1)